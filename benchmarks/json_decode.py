@@ -0,0 +1,140 @@
+"""Benchmark decoding the JSON responses of the Remeha Home API.
+
+Compares the decoders on the captured dashboard payload from the API
+documentation, synthetic dashboards of increasing size and synthetic energy
+consumption responses. Additional captured payloads can be passed as files:
+
+    python -m benchmarks.json_decode --payload dashboard.json
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import json
+from pathlib import Path
+import platform
+import re
+import sys
+import time
+import timeit
+from typing import Any
+
+from devtools.synthetic import generate_consumption, generate_dashboard
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+API_DOCUMENTATION = Path(__file__).parents[1] / "documentation/api.md"
+DEFAULT_SIZES = [1, 10, 50, 100, 250, 500]
+
+
+def _decode_text(payload: bytes) -> Any:
+    """Decode like `ClientResponse.json()`, to text first."""
+    return json.loads(payload.decode("utf-8"))
+
+
+DECODERS: dict[str, Callable[[bytes], Any]] = {
+    "stdlib_text": _decode_text,
+    "stdlib_bytes": json.loads,
+}
+if orjson is not None:
+    DECODERS["orjson_bytes"] = orjson.loads
+
+
+def captured_dashboard() -> bytes:
+    """Return the captured dashboard response from the API documentation."""
+    documentation = API_DOCUMENTATION.read_text()
+    section = documentation[documentation.index("## GET `/homes/dashboard`") :]
+    payload = re.search(r"```json\n(.*?)```", section, re.DOTALL).group(1)
+    return json.dumps(json.loads(payload)).encode()
+
+
+def payloads(args: argparse.Namespace) -> dict[str, bytes]:
+    """Return the payloads to decode by name."""
+    result = {"captured_dashboard": captured_dashboard()}
+    for path in args.payload:
+        result[path.name] = path.read_bytes()
+    for appliances in args.sizes:
+        dashboard = generate_dashboard(
+            appliances, args.climate_zones, args.hot_water_zones, args.seed
+        )
+        result[f"dashboard_{appliances}"] = json.dumps(dashboard).encode()
+
+    # The responses the energy history import requests, a month of daily data
+    end = datetime(2024, 1, 31)
+    consumption = generate_consumption(
+        "appliance", end - timedelta(days=30), end, "daily"
+    )
+    result["energy_daily_31"] = json.dumps(consumption).encode()
+    return result
+
+
+def measure(decoder: Callable[[bytes], Any], payload: bytes, rounds: int) -> float:
+    """Return the median time in seconds to decode the payload."""
+    timer = timeit.Timer(lambda: decoder(payload))
+    number, _ = timer.autorange()
+    timings = sorted(timer.repeat(repeat=rounds, number=number))
+    return timings[len(timings) // 2] / number
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: [int(size) for size in value.split(",")],
+        default=DEFAULT_SIZES,
+        help="comma separated numbers of appliances",
+    )
+    parser.add_argument("--climate-zones", type=int, default=4)
+    parser.add_argument("--hot-water-zones", type=int, default=2)
+    parser.add_argument(
+        "--payload",
+        type=Path,
+        action="append",
+        default=[],
+        help="captured response to decode, can be repeated",
+    )
+    parser.add_argument("--rounds", type=int, default=5, help="rounds per payload")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="write the JSON report here")
+    args = parser.parse_args()
+
+    results = []
+    for name, payload in payloads(args).items():
+        timings = {
+            decoder_name: measure(decoder, payload, args.rounds) * 1e6
+            for decoder_name, decoder in DECODERS.items()
+        }
+        results.append(
+            {
+                "payload": name,
+                "bytes": len(payload),
+                "decode_us": timings,
+                "speedup": {
+                    decoder_name: timings["stdlib_text"] / timing
+                    for decoder_name, timing in timings.items()
+                },
+            }
+        )
+
+    report = {
+        "benchmark": "json_decode",
+        "python": platform.python_version(),
+        "orjson": orjson.__version__ if orjson is not None else None,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output)
+    else:
+        sys.stdout.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+"""Benchmark the coordinator refresh and the entity read path.
+
+Generates synthetic dashboards of increasing size and reports, per size, the
+wall and CPU time of a cold and warm coordinator refresh and of an energy
+refresh, the memory allocated during a refresh and the cost of computing the
+entity states. Results are
+written as JSON so they can be compared between releases:
+
+    python -m benchmarks.refresh --output bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import datetime
+import json
+import logging
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.remeha_home.api import json_loads
+from custom_components.remeha_home.binary_sensor import RemehaHomeBinarySensor
+from custom_components.remeha_home.climate import RemehaHomeClimateEntity
+from custom_components.remeha_home.const import (
+    APPLIANCE_ENERGY_SENSOR_TYPES,
+    APPLIANCE_SENSOR_TYPES,
+    CLIMATE_ZONE_BINARY_SENSOR_TYPES,
+    CLIMATE_ZONE_SENSOR_TYPES,
+    HOT_WATER_ZONE_BINARY_SENSOR_TYPES,
+    HOT_WATER_ZONE_SENSOR_TYPES,
+)
+from custom_components.remeha_home.coordinator import (
+    RemehaHomeEnergyUpdateCoordinator,
+    RemehaHomeUpdateCoordinator,
+)
+from custom_components.remeha_home.sensor import RemehaHomeSensor
+from devtools.synthetic import (
+    generate_consumption,
+    generate_dashboard,
+    generate_technical_details,
+)
+
+MANIFEST = Path(__file__).parents[1] / "custom_components/remeha_home/manifest.json"
+DEFAULT_SIZES = [1, 10, 50, 100, 250, 500]
+
+
+class SyntheticAPI:
+    """Stand-in for RemehaHomeAPI serving synthetic data.
+
+    Responses are decoded from JSON bytes on every call, like the real client
+    does.
+    """
+
+    def __init__(self, dashboard: dict, latency: float = 0.0) -> None:
+        """Create the API for a synthetic dashboard."""
+        self.latency = latency
+        self.request_count = 0
+        self._dashboard = json.dumps(dashboard).encode()
+        self._technical_details = {
+            appliance["applianceId"]: json.dumps(
+                generate_technical_details(appliance)
+            ).encode()
+            for appliance in dashboard["appliances"]
+        }
+
+    async def _async_respond(self, payload: bytes) -> dict:
+        self.request_count += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return json_loads(payload)
+
+    async def async_get_dashboard(self) -> dict:
+        """Return the synthetic dashboard."""
+        return await self._async_respond(self._dashboard)
+
+    async def async_get_appliance_technical_information(
+        self, appliance_id: str
+    ) -> dict:
+        """Return the synthetic technical details for an appliance."""
+        return await self._async_respond(self._technical_details[appliance_id])
+
+    async def async_get_consumption_data_for_today(self, appliance_id: str) -> dict:
+        """Return synthetic consumption data for today for an appliance."""
+        start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        return await self._async_respond(
+            json.dumps(
+                generate_consumption(appliance_id, start, start, "daily")
+            ).encode()
+        )
+
+
+def create_entities(
+    coordinator: RemehaHomeUpdateCoordinator,
+    energy_coordinator: RemehaHomeEnergyUpdateCoordinator,
+) -> dict[str, list]:
+    """Create all entities the platforms would create for the coordinator data."""
+    entities: dict[str, list] = {"sensor": [], "binary_sensor": [], "climate": []}
+    for appliance in coordinator.data.appliances:
+        appliance_id = appliance.appliance_id
+        for description in APPLIANCE_SENSOR_TYPES:
+            entities["sensor"].append(
+                RemehaHomeSensor(coordinator, appliance_id, description)
+            )
+        for description in APPLIANCE_ENERGY_SENSOR_TYPES:
+            entities["sensor"].append(
+                RemehaHomeSensor(energy_coordinator, appliance_id, description)
+            )
+
+        for climate_zone in appliance.climate_zones:
+            climate_zone_id = climate_zone.climate_zone_id
+            entities["climate"].append(
+                RemehaHomeClimateEntity(None, coordinator, climate_zone_id)
+            )
+            for description in CLIMATE_ZONE_SENSOR_TYPES:
+                entities["sensor"].append(
+                    RemehaHomeSensor(coordinator, climate_zone_id, description)
+                )
+            for description, transform in CLIMATE_ZONE_BINARY_SENSOR_TYPES:
+                entities["binary_sensor"].append(
+                    RemehaHomeBinarySensor(
+                        coordinator, climate_zone_id, description, transform
+                    )
+                )
+
+        for hot_water_zone in appliance.hot_water_zones:
+            hot_water_zone_id = hot_water_zone.hot_water_zone_id
+            for description in HOT_WATER_ZONE_SENSOR_TYPES:
+                entities["sensor"].append(
+                    RemehaHomeSensor(coordinator, hot_water_zone_id, description)
+                )
+            for description, transform in HOT_WATER_ZONE_BINARY_SENSOR_TYPES:
+                entities["binary_sensor"].append(
+                    RemehaHomeBinarySensor(
+                        coordinator, hot_water_zone_id, description, transform
+                    )
+                )
+
+    return entities
+
+
+def read_state(platform_name: str, entity) -> None:
+    """Evaluate the properties Home Assistant reads when writing the state."""
+    if platform_name == "sensor":
+        _ = entity.native_value
+    elif platform_name == "binary_sensor":
+        _ = entity.is_on
+    else:
+        _ = (
+            entity.current_temperature,
+            entity.target_temperature,
+            entity.hvac_mode,
+            entity.hvac_modes,
+            entity.hvac_action,
+            entity.preset_mode,
+        )
+
+
+async def async_measure_refresh(
+    coordinator: RemehaHomeUpdateCoordinator, trace_allocations: bool = False
+) -> dict:
+    """Measure a single coordinator refresh.
+
+    Allocation tracing slows down the refresh, so timings of a traced refresh
+    should not be compared with those of an untraced one.
+    """
+    if trace_allocations:
+        tracemalloc.start()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    coordinator.data = await coordinator._async_update_data()
+    result = {
+        "wall_s": time.perf_counter() - wall_start,
+        "cpu_s": time.process_time() - cpu_start,
+    }
+    if trace_allocations:
+        result["alloc_peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result
+
+
+def measure_entities(entities: dict[str, list], rounds: int) -> dict:
+    """Measure the per-entity state computation cost for each platform."""
+    results = {}
+    for platform_name, platform_entities in entities.items():
+        if not platform_entities:
+            continue
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for entity in platform_entities:
+                read_state(platform_name, entity)
+            timings.append(time.perf_counter() - start)
+        results[platform_name] = {
+            "entities": len(platform_entities),
+            "total_s": statistics.median(timings),
+            "per_entity_us": statistics.median(timings) / len(platform_entities) * 1e6,
+        }
+    return results
+
+
+async def async_benchmark_size(
+    hass: HomeAssistant, appliances: int, args: argparse.Namespace
+) -> dict:
+    """Run all measurements for a home with the given number of appliances."""
+    dashboard = generate_dashboard(
+        appliances, args.climate_zones, args.hot_water_zones, args.seed
+    )
+    api = SyntheticAPI(dashboard, args.latency)
+    coordinator = RemehaHomeUpdateCoordinator(hass, api)
+
+    cold = await async_measure_refresh(coordinator)
+    cold["requests"] = api.request_count
+    cold["alloc_peak_bytes"] = (
+        await async_measure_refresh(
+            RemehaHomeUpdateCoordinator(hass, SyntheticAPI(dashboard)), True
+        )
+    )["alloc_peak_bytes"]
+
+    warm_runs = []
+    for _ in range(args.polls):
+        api.request_count = 0
+        result = await async_measure_refresh(coordinator)
+        result["requests"] = api.request_count
+        warm_runs.append(result)
+    warm = {
+        key: statistics.median(run[key] for run in warm_runs) for key in warm_runs[0]
+    }
+    warm["alloc_peak_bytes"] = (await async_measure_refresh(coordinator, True))[
+        "alloc_peak_bytes"
+    ]
+
+    # Subscribe like enabled energy entities do, consumption data is only
+    # requested for appliances with a listener
+    energy_coordinator = RemehaHomeEnergyUpdateCoordinator(hass, api, coordinator)
+    for appliance in coordinator.data.appliances:
+        energy_coordinator.async_add_listener(lambda: None, appliance.appliance_id)
+    api.request_count = 0
+    energy = await async_measure_refresh(energy_coordinator)
+    energy["requests"] = api.request_count
+    await energy_coordinator.async_shutdown()
+
+    entities = create_entities(coordinator, energy_coordinator)
+    return {
+        "appliances": appliances,
+        "climate_zones": appliances * args.climate_zones,
+        "hot_water_zones": appliances * args.hot_water_zones,
+        "cold_refresh": cold,
+        "warm_refresh": warm,
+        "energy_refresh": energy,
+        "entity_state": measure_entities(entities, args.rounds),
+    }
+
+
+async def async_main(args: argparse.Namespace) -> dict:
+    """Run the benchmark for all requested sizes."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        try:
+            results = [
+                await async_benchmark_size(hass, appliances, args)
+                for appliances in args.sizes
+            ]
+        finally:
+            await hass.async_stop(force=True)
+
+    return {
+        "benchmark": "refresh",
+        "version": json.loads(MANIFEST.read_text())["version"],
+        "python": platform.python_version(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "parameters": {
+            "climate_zones_per_appliance": args.climate_zones,
+            "hot_water_zones_per_appliance": args.hot_water_zones,
+            "latency_s": args.latency,
+            "polls": args.polls,
+            "rounds": args.rounds,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: [int(size) for size in value.split(",")],
+        default=DEFAULT_SIZES,
+        help="comma separated numbers of appliances",
+    )
+    parser.add_argument("--climate-zones", type=int, default=4)
+    parser.add_argument("--hot-water-zones", type=int, default=2)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="simulated request latency"
+    )
+    parser.add_argument("--polls", type=int, default=5, help="warm polls per size")
+    parser.add_argument(
+        "--rounds", type=int, default=5, help="entity state rounds per size"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="write the JSON report here")
+    args = parser.parse_args()
+
+    # The climate entities log at info level on every state read
+    logging.basicConfig(level=logging.WARNING)
+
+    report = asyncio.run(async_main(args))
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output)
+    else:
+        sys.stdout.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
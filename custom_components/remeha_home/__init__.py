@@ -2,16 +2,104 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
+
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_entry_oauth2_flow
+import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
 
 from .api import RemehaHomeOAuth2Implementation, RemehaHomeAPI
 from .config_flow import RemehaHomeLoginFlowHandler
-from .const import DOMAIN
-from .coordinator import RemehaHomeUpdateCoordinator
+from .const import (
+    API_BASE_URL,
+    CACHE_STORAGE_VERSION,
+    CONF_API_BASE_URL,
+    CONF_DASHBOARD_FRESHNESS,
+    CONF_DEDICATED_SESSION,
+    CONF_LOGIN_BASE_URL,
+    CONF_MAX_PARALLEL_APPLIANCE_UPDATES,
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_TECHNICAL_INFO_TTL,
+    DATA_CONFIG,
+    DEFAULT_DASHBOARD_FRESHNESS,
+    DEFAULT_MAX_PARALLEL_APPLIANCE_UPDATES,
+    DEDICATED_SESSION_MAX_UPDATE_INTERVAL,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DEFAULT_MIN_UPDATE_INTERVAL,
+    DEFAULT_TECHNICAL_INFO_TTL,
+    DOMAIN,
+    HISTORY_STORAGE_VERSION,
+    LOGIN_BASE_URL,
+)
+from .coordinator import (
+    RemehaHomeEnergyUpdateCoordinator,
+    RemehaHomeUpdateCoordinator,
+    cache_storage_key,
+    energy_cache_storage_key,
+)
+from .history import RemehaHomeEnergyHistoryImporter, history_storage_key
+from .services import async_setup_services
+from .session import async_create_api_session
+
+
+def _max_update_interval(config: dict) -> timedelta:
+    """Return the configured maximum update interval or its default.
+
+    The default stays below the keepalive timeout of the dedicated session,
+    without it connections are not kept open between idle polls anyway.
+    """
+    if (max_update_interval := config.get(CONF_MAX_UPDATE_INTERVAL)) is not None:
+        return max_update_interval
+    if config[CONF_DEDICATED_SESSION]:
+        return DEDICATED_SESSION_MAX_UPDATE_INTERVAL
+    return DEFAULT_MAX_UPDATE_INTERVAL
+
+
+def _validate_update_intervals(config: dict) -> dict:
+    """Validate that the minimum update interval does not exceed the maximum."""
+    if config[CONF_MIN_UPDATE_INTERVAL] > _max_update_interval(config):
+        raise vol.Invalid(
+            f"{CONF_MIN_UPDATE_INTERVAL} must not be greater than {CONF_MAX_UPDATE_INTERVAL}"
+        )
+    return config
+
+
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.All(
+            vol.Schema(
+                {
+                    vol.Optional(CONF_API_BASE_URL, default=API_BASE_URL): cv.url,
+                    vol.Optional(CONF_LOGIN_BASE_URL, default=LOGIN_BASE_URL): cv.url,
+                    vol.Optional(CONF_DEDICATED_SESSION, default=True): cv.boolean,
+                    vol.Optional(
+                        CONF_TECHNICAL_INFO_TTL, default=DEFAULT_TECHNICAL_INFO_TTL
+                    ): cv.positive_time_period,
+                    vol.Optional(
+                        CONF_DASHBOARD_FRESHNESS, default=DEFAULT_DASHBOARD_FRESHNESS
+                    ): cv.time_period,
+                    vol.Optional(
+                        CONF_MAX_PARALLEL_APPLIANCE_UPDATES,
+                        default=DEFAULT_MAX_PARALLEL_APPLIANCE_UPDATES,
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                    vol.Optional(
+                        CONF_MIN_UPDATE_INTERVAL, default=DEFAULT_MIN_UPDATE_INTERVAL
+                    ): cv.positive_time_period,
+                    vol.Optional(CONF_MAX_UPDATE_INTERVAL): cv.positive_time_period,
+                }
+            ),
+            _validate_update_intervals,
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
 
 PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
@@ -24,12 +112,18 @@ PLATFORMS: list[Platform] = [
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up Remeha Home."""
     hass.data.setdefault(DOMAIN, {})
+    hass.data[DATA_CONFIG] = config.get(DOMAIN) or CONFIG_SCHEMA({DOMAIN: {}})[DOMAIN]
 
     RemehaHomeLoginFlowHandler.async_register_implementation(
         hass,
-        RemehaHomeOAuth2Implementation(async_get_clientsession(hass)),
+        RemehaHomeOAuth2Implementation(
+            async_get_clientsession(hass),
+            hass.data[DATA_CONFIG][CONF_LOGIN_BASE_URL],
+        ),
     )
 
+    async_setup_services(hass)
+
     return True
 
 
@@ -42,14 +136,58 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     )
 
     oauth_session = config_entry_oauth2_flow.OAuth2Session(hass, entry, implementation)
-    api = RemehaHomeAPI(oauth_session)
-    coordinator = RemehaHomeUpdateCoordinator(hass, api)
+    session = connection_stats = None
+    if hass.data[DATA_CONFIG][CONF_DEDICATED_SESSION]:
+        session, connection_stats = async_create_api_session(hass)
+        entry.async_on_unload(session.close)
+    api = RemehaHomeAPI(
+        oauth_session,
+        hass.data[DATA_CONFIG][CONF_API_BASE_URL],
+        session,
+        hass.data[DATA_CONFIG][CONF_DASHBOARD_FRESHNESS].total_seconds(),
+    )
+    # Open the connection while the cached data is loaded and the token refreshed
+    entry.async_create_background_task(
+        hass, api.async_warm_up(), f"{DOMAIN} connection warm up"
+    )
+    max_parallel_appliance_updates = hass.data[DATA_CONFIG][
+        CONF_MAX_PARALLEL_APPLIANCE_UPDATES
+    ]
+    coordinator = RemehaHomeUpdateCoordinator(
+        hass,
+        api,
+        entry,
+        max_parallel_appliance_updates=max_parallel_appliance_updates,
+        min_update_interval=hass.data[DATA_CONFIG][CONF_MIN_UPDATE_INTERVAL],
+        max_update_interval=_max_update_interval(hass.data[DATA_CONFIG]),
+        technical_info_ttl=hass.data[DATA_CONFIG][CONF_TECHNICAL_INFO_TTL],
+    )
 
-    await coordinator.async_config_entry_first_refresh()
+    if await coordinator.async_load_cache():
+        # Set up the entities from the cached data and revalidate in the background
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} revalidate cached data"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
+    entry.async_on_unload(api.async_start_token_refresh())
+
+    # Consumption data is requested once the energy entities subscribe to it
+    energy_coordinator = RemehaHomeEnergyUpdateCoordinator(
+        hass,
+        api,
+        coordinator,
+        entry,
+        max_parallel_appliance_updates=max_parallel_appliance_updates,
+    )
+    await energy_coordinator.async_load_cache()
 
     hass.data[DOMAIN][entry.entry_id] = {
         "api": api,
+        "connection_stats": connection_stats,
         "coordinator": coordinator,
+        "energy_coordinator": energy_coordinator,
+        "energy_history": RemehaHomeEnergyHistoryImporter(hass, api, entry),
     }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -63,3 +201,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored data of a config entry."""
+    await Store(hass, CACHE_STORAGE_VERSION, cache_storage_key(entry)).async_remove()
+    await Store(
+        hass, CACHE_STORAGE_VERSION, energy_cache_storage_key(entry)
+    ).async_remove()
+    await Store(
+        hass, HISTORY_STORAGE_VERSION, history_storage_key(entry)
+    ).async_remove()
@@ -3,69 +3,479 @@
 import base64
 import datetime
 import hashlib
-import json
 import logging
 import secrets
+import time
+from typing import Any
 import urllib
 
 import asyncio
-from aiohttp import ClientSession
+from collections import deque
+from aiohttp import (
+    ClientConnectorError,
+    ClientError,
+    ClientPayloadError,
+    ClientResponse,
+    ClientSession,
+    hdrs,
+)
 
+from homeassistant.core import CALLBACK_TYPE, callback
 from homeassistant.helpers.config_entry_oauth2_flow import (
+    CLOCK_OUT_OF_SYNC_MAX_SEC,
     AbstractOAuth2Implementation,
     OAuth2Session,
 )
+from homeassistant.helpers.event import async_call_later
 from homeassistant.exceptions import ConfigEntryAuthFailed
 
-from .const import DOMAIN
+from .const import (
+    API_BASE_URL,
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_RESET_TIMEOUT,
+    DEFAULT_DASHBOARD_FRESHNESS,
+    DOMAIN,
+    LOGIN_BASE_URL,
+    RATE_LIMIT,
+    RATE_LIMIT_DEFAULT_RETRY_AFTER,
+    RATE_LIMIT_MAX_RETRIES,
+    RATE_LIMITS,
+    REQUEST_DEADLINE,
+    REQUEST_TIMEOUT,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_MAX,
+    RETRY_MAX_ATTEMPTS,
+    RETRY_STATUSES,
+    STATS_WINDOW,
+    TOKEN_REFRESH_MARGIN,
+    TOKEN_REFRESH_RETRY_INTERVAL,
+)
+from .ratelimit import RequestPriority, TokenBucket, parse_retry_after
+from .retry import CircuitBreaker, backoff_delay
+from .stats import RollingStats
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def decode_json(body: bytes) -> Any:
+    """Decode a JSON body, raising ClientPayloadError if it is invalid.
+
+    Uses orjson when it is installed and the standard library otherwise.
+    """
+    try:
+        return json_loads(body)
+    except ValueError as err:
+        raise ClientPayloadError(f"Invalid JSON response: {err}") from err
+
+
+async def async_read_json(response: ClientResponse) -> Any:
+    """Decode a JSON response body directly from its bytes.
+
+    The content type is not checked, the login endpoints return JSON as text.
+    """
+    return decode_json(await response.read())
+
+
 class RemehaHomeAPI:
-    """Provide Remeha Home authentication tied to an OAuth2 based config entry."""
+    """Provide Remeha Home authentication tied to an OAuth2 based config entry.
+
+    Requests are rate limited by a token bucket for the whole API and one per
+    endpoint class, see RATE_LIMITS. User commands are sent before polling
+    requests when the budget runs out.
+    """
 
     def __init__(
         self,
         oauth_session: OAuth2Session = None,
+        base_url: str = API_BASE_URL,
+        session: ClientSession | None = None,
+        dashboard_freshness: float = DEFAULT_DASHBOARD_FRESHNESS.total_seconds(),
     ) -> None:
-        """Initialize Remeha Home auth."""
+        """Initialize Remeha Home auth.
+
+        Requests are sent with the session if given, otherwise with the shared
+        session of the OAuth2 session.
+        """
         self._oauth_session = oauth_session
+        self._base_url = base_url.rstrip("/")
+        self._session = session
+        self._token_lock = asyncio.Lock()
+        self._unsub_token_refresh: CALLBACK_TYPE | None = None
+        self._rate_limit = TokenBucket(*RATE_LIMIT)
+        self._endpoint_rate_limits = {
+            endpoint: TokenBucket(*rate_limit)
+            for endpoint, rate_limit in RATE_LIMITS.items()
+        }
+        self.circuit_breaker = CircuitBreaker(
+            urllib.parse.urlparse(self._base_url).hostname,
+            CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+            CIRCUIT_BREAKER_RESET_TIMEOUT,
+        )
+        self.request_stats = {
+            endpoint: {
+                "requests": 0,
+                "retries": 0,
+                "throttled": 0,
+                "wait_time": 0.0,
+                "errors": {},
+            }
+            for endpoint in RATE_LIMITS
+        }
+        self._request_times: deque[float] = deque()
+        self.dashboard_freshness = dashboard_freshness
+        self._dashboard_request: asyncio.Task | None = None
+        self._dashboard: tuple[float, dict] | None = None
+        # Last dashboard response, to revalidate it and detect unchanged bodies
+        self._dashboard_data: dict | None = None
+        self._dashboard_hash: bytes | None = None
+        self._dashboard_validators: dict[str, str] = {}
+        # Time in seconds until the response headers arrived and body size in bytes
+        self.latency = {
+            endpoint: RollingStats(STATS_WINDOW) for endpoint in RATE_LIMITS
+        }
+        self.response_size = {
+            endpoint: RollingStats(STATS_WINDOW) for endpoint in RATE_LIMITS
+        }
 
     async def async_get_access_token(self) -> str:
         """Return a valid access token."""
         if not self._oauth_session.valid_token:
-            await self._oauth_session.async_ensure_token_valid()
+            await self._async_refresh_token(CLOCK_OUT_OF_SYNC_MAX_SEC)
 
         return self._oauth_session.token["access_token"]
 
-    async def _async_api_request(self, method: str, path: str, **kwargs):
-        headers = kwargs.pop("headers", {})
-        return await self._oauth_session.async_request(
-            method,
-            "https://api.bdrthermea.net/Mobile/api" + path,
-            **kwargs,
-            headers={
-                **headers,
-                "Ocp-Apim-Subscription-Key": "df605c5470d846fc91e848b1cc653ddf",
-            },
+    async def _async_refresh_token(self, min_validity: float) -> None:
+        """Refresh the token if it expires within `min_validity` seconds.
+
+        Only a single token grant is in flight at any time, concurrent callers
+        wait for it and then reuse the refreshed token.
+        """
+        async with self._token_lock:
+            token = self._oauth_session.token
+            if token["expires_at"] - time.time() >= min_validity:
+                return
+
+            new_token = await self._oauth_session.implementation.async_refresh_token(
+                token
+            )
+            config_entry = self._oauth_session.config_entry
+            self._oauth_session.hass.config_entries.async_update_entry(
+                config_entry, data={**config_entry.data, "token": new_token}
+            )
+
+    @callback
+    def async_start_token_refresh(self) -> CALLBACK_TYPE:
+        """Refresh the token in the background ahead of its expiry.
+
+        Returns a callback that stops the background refresh.
+        """
+        self._async_schedule_token_refresh()
+        return self._async_stop_token_refresh
+
+    @callback
+    def _async_schedule_token_refresh(self, delay: float | None = None) -> None:
+        if delay is None:
+            delay = max(
+                self._oauth_session.token["expires_at"]
+                - time.time()
+                - TOKEN_REFRESH_MARGIN,
+                0,
+            )
+        self._unsub_token_refresh = async_call_later(
+            self._oauth_session.hass, delay, self._async_scheduled_token_refresh
+        )
+
+    @callback
+    def _async_stop_token_refresh(self) -> None:
+        if self._unsub_token_refresh is not None:
+            self._unsub_token_refresh()
+            self._unsub_token_refresh = None
+
+    async def _async_scheduled_token_refresh(self, _now) -> None:
+        self._unsub_token_refresh = None
+        try:
+            await self._async_refresh_token(TOKEN_REFRESH_MARGIN)
+        except ConfigEntryAuthFailed:
+            # The next API request will fail as well and start the reauth flow
+            _LOGGER.warning("Background token refresh failed, stopping refresh")
+            return
+        except (ClientError, TimeoutError) as err:
+            _LOGGER.warning("Background token refresh failed: %s", err)
+            self._async_schedule_token_refresh(TOKEN_REFRESH_RETRY_INTERVAL)
+            return
+
+        self._async_schedule_token_refresh()
+
+    async def _async_api_request(
+        self,
+        method: str,
+        path: str,
+        endpoint: str,
+        priority: RequestPriority = RequestPriority.POLL,
+        idempotent: bool | None = None,
+        **kwargs,
+    ) -> ClientResponse:
+        """Send a request within the rate limits of its endpoint class.
+
+        A request throttled by the API pauses all requests for the time in its
+        Retry-After header and is then sent again. Failed idempotent requests
+        are retried with exponential backoff, other requests only when they
+        could not be sent. GET requests are idempotent unless specified. An
+        attempt without response headers within REQUEST_TIMEOUT has failed.
+        A request is only retried while the retry fits in REQUEST_DEADLINE.
+        """
+        if idempotent is None:
+            idempotent = method == "GET"
+        if method != "GET":
+            # Commands change the dashboard, do not reuse a fetch from before them
+            self._dashboard = None
+            self._dashboard_request = None
+        stats = self.request_stats[endpoint]
+        deadline = time.monotonic() + REQUEST_DEADLINE
+        throttled = 0
+        failures = 0
+        while True:
+            self.circuit_breaker.check()
+            stats["wait_time"] += await self._endpoint_rate_limits[
+                endpoint
+            ].async_acquire(priority)
+            stats["wait_time"] += await self._rate_limit.async_acquire(priority)
+            # Make sure the token is valid, so the session does not start a refresh of its own
+            await self.async_get_access_token()
+            stats["requests"] += 1
+            start = time.monotonic()
+            self._request_times.append(start)
+            self._prune_request_times(start)
+
+            try:
+                async with asyncio.timeout(REQUEST_TIMEOUT):
+                    response = await self._async_send_request(method, path, **kwargs)
+            except (ClientError, TimeoutError) as err:
+                self._record_error(endpoint, type(err).__name__)
+                self.circuit_breaker.record_failure()
+                if not self._retry_fits(failures, deadline) or not (
+                    idempotent or isinstance(err, ClientConnectorError)
+                ):
+                    raise
+                error = repr(err)
+            else:
+                self.latency[endpoint].add(time.monotonic() - start)
+                if response.status >= 400:
+                    self._record_error(endpoint, str(response.status))
+                if response.status == 429:
+                    throttled += 1
+                    stats["throttled"] += 1
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    if retry_after is None:
+                        retry_after = RATE_LIMIT_DEFAULT_RETRY_AFTER
+                    _LOGGER.warning(
+                        "Request to %s throttled by the API, pausing requests for %s seconds",
+                        endpoint,
+                        retry_after,
+                    )
+                    await self._rate_limit.async_pause(retry_after)
+                    if throttled > RATE_LIMIT_MAX_RETRIES:
+                        return response
+                    response.release()
+                    continue
+
+                if response.status not in RETRY_STATUSES:
+                    self.circuit_breaker.record_success()
+                    return response
+
+                self.circuit_breaker.record_failure()
+                if not self._retry_fits(failures, deadline) or not idempotent:
+                    return response
+                response.release()
+                error = f"status {response.status}"
+
+            failures += 1
+            stats["retries"] += 1
+            delay = backoff_delay(failures, RETRY_BACKOFF_BASE, RETRY_BACKOFF_MAX)
+            _LOGGER.debug(
+                "Request to %s failed with %s, retrying in %.1f seconds",
+                endpoint,
+                error,
+                delay,
+            )
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _retry_fits(failures: int, deadline: float) -> bool:
+        """Return whether another attempt fits in the attempts and the deadline."""
+        max_delay = min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2**failures)
+        return (
+            failures < RETRY_MAX_ATTEMPTS
+            and time.monotonic() + max_delay + REQUEST_TIMEOUT <= deadline
+        )
+
+    def _prune_request_times(self, now: float) -> None:
+        while self._request_times and self._request_times[0] < now - 3600:
+            self._request_times.popleft()
+
+    def requests_last_hour(self) -> int:
+        """Return the number of requests sent in the last hour."""
+        self._prune_request_times(time.monotonic())
+        return len(self._request_times)
+
+    def _record_error(self, endpoint: str, error: str) -> None:
+        errors = self.request_stats[endpoint]["errors"]
+        errors[error] = errors.get(error, 0) + 1
+
+    async def _async_read_json(self, response: ClientResponse, endpoint: str) -> Any:
+        """Decode a JSON response of an endpoint class, recording its size."""
+        body = await response.read()
+        self.response_size[endpoint].add(len(body))
+        return decode_json(body)
+
+    def performance_stats(self) -> dict[str, Any]:
+        """Return the request statistics per endpoint class for diagnostics."""
+        return {
+            endpoint: {
+                **stats,
+                "latency": self.latency[endpoint].as_dict(),
+                "response_size": self.response_size[endpoint].as_dict(digits=0),
+            }
+            for endpoint, stats in self.request_stats.items()
+        }
+
+    async def _async_send_request(
+        self, method: str, path: str, **kwargs
+    ) -> ClientResponse:
+        headers = {
+            **kwargs.pop("headers", {}),
+            "Ocp-Apim-Subscription-Key": "df605c5470d846fc91e848b1cc653ddf",
+        }
+        if self._session is None:
+            return await self._oauth_session.async_request(
+                method, self._base_url + path, **kwargs, headers=headers
+            )
+
+        headers[hdrs.AUTHORIZATION] = (
+            f"Bearer {self._oauth_session.token['access_token']}"
         )
+        return await self._session.request(
+            method, self._base_url + path, **kwargs, headers=headers
+        )
+
+    async def async_warm_up(self) -> None:
+        """Open a connection to the API host ahead of the first request."""
+        if self._session is None:
+            return
+
+        try:
+            async with asyncio.timeout(REQUEST_TIMEOUT), self._session.head(
+                self._base_url, allow_redirects=False
+            ):
+                pass
+        except (ClientError, TimeoutError) as err:
+            _LOGGER.debug("Failed to open a connection to the API: %s", err)
 
     async def async_get_dashboard(self) -> dict:
-        """Return the Remeha Home dashboard JSON."""
-        # Add a timestamp to the request to prevent caching
-        timestamp = int(datetime.datetime.now().timestamp())
+        """Return the Remeha Home dashboard JSON.
+
+        Concurrent callers share a single request and its result, which is
+        also returned to callers within the dashboard freshness window after
+        it completed. The result is shared and must not be modified.
+
+        The same object is returned as long as the dashboard is unchanged, so
+        callers can skip processing it with an identity check.
+        """
+        if (
+            self._dashboard is not None
+            and time.monotonic() - self._dashboard[0] < self.dashboard_freshness
+        ):
+            return self._dashboard[1]
+
+        if self._dashboard_request is None:
+            self._dashboard_request = asyncio.create_task(
+                self._async_fetch_shared_dashboard()
+            )
+            self._dashboard_request.add_done_callback(self._dashboard_request_done)
+
+        # A cancelled caller must not cancel the request of the other callers
+        return await asyncio.shield(self._dashboard_request)
+
+    def invalidate_dashboard(self) -> None:
+        """Forget the previous dashboard, so the next one is requested in full.
+
+        The next request is not revalidated and its body is always decoded.
+        """
+        self._dashboard = None
+        self._dashboard_request = None
+        self._dashboard_data = None
+        self._dashboard_hash = None
+        self._dashboard_validators = {}
+
+    async def _async_fetch_shared_dashboard(self) -> dict:
+        """Request the dashboard for all callers and record when it completed."""
+        dashboard = await self._async_fetch_dashboard()
+        # A request started before a command is detached and its result dropped
+        if self._dashboard_request is asyncio.current_task():
+            self._dashboard = (time.monotonic(), dashboard)
+        return dashboard
+
+    @callback
+    def _dashboard_request_done(self, task: asyncio.Task) -> None:
+        if self._dashboard_request is task:
+            self._dashboard_request = None
+        # Retrieve the exception in case all callers were cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _async_fetch_dashboard(self) -> dict:
+        """Request the dashboard, revalidating the previous response.
+
+        The body is only decoded when it differs from the previous one, which
+        also covers responses without validators.
+        """
+        # Without a previous response there is nothing to revalidate
+        if self._dashboard_data is None:
+            self._dashboard_validators = {}
+        # Caches must revalidate the response with the API
+        headers = {hdrs.CACHE_CONTROL: "no-cache", **self._dashboard_validators}
         response = await self._async_api_request(
-            "GET", f"/homes/dashboard?t={timestamp}"
+            "GET", "/homes/dashboard", "dashboard", headers=headers
         )
+        if response.status == 304:
+            response.release()
+            if self._dashboard_data is None:
+                raise ClientPayloadError(
+                    "Dashboard not modified, but there is no previous response"
+                )
+            return self._dashboard_data
+
         response.raise_for_status()
-        return await response.json()
+        body = await response.read()
+        self.response_size["dashboard"].add(len(body))
+        body_hash = hashlib.blake2b(body, digest_size=16).digest()
+        if body_hash != self._dashboard_hash:
+            self._dashboard_data = decode_json(body)
+            self._dashboard_hash = body_hash
+        # Only revalidate a response that could be decoded
+        self._dashboard_validators = {
+            request_header: response.headers[response_header]
+            for response_header, request_header in (
+                (hdrs.ETAG, hdrs.IF_NONE_MATCH),
+                (hdrs.LAST_MODIFIED, hdrs.IF_MODIFIED_SINCE),
+            )
+            if response_header in response.headers
+        }
+        return self._dashboard_data
 
     async def async_set_manual(self, climate_zone_id: str, setpoint: float):
         """Set a climate zone to manual mode with a specific temperature setpoint."""
         response = await self._async_api_request(
             "POST",
             f"/climate-zones/{climate_zone_id}/modes/manual",
+            "command",
+            priority=RequestPriority.COMMAND,
+            idempotent=True,
             json={
                 "roomTemperatureSetPoint": setpoint,
             },
@@ -80,6 +490,9 @@ class RemehaHomeAPI:
         response = await self._async_api_request(
             "POST",
             f"/climate-zones/{climate_zone_id}/modes/schedule",
+            "command",
+            priority=RequestPriority.COMMAND,
+            idempotent=True,
             json={
                 "heatingProgramId": heating_program_id,
             },
@@ -91,6 +504,9 @@ class RemehaHomeAPI:
         response = await self._async_api_request(
             "POST",
             f"/climate-zones/{climate_zone_id}/modes/temporary-override",
+            "command",
+            priority=RequestPriority.COMMAND,
+            idempotent=True,
             json={
                 "roomTemperatureSetPoint": setpoint,
             },
@@ -102,6 +518,9 @@ class RemehaHomeAPI:
         response = await self._async_api_request(
             "POST",
             f"/climate-zones/{climate_zone_id}/modes/anti-frost",
+            "command",
+            priority=RequestPriority.COMMAND,
+            idempotent=True,
         )
         response.raise_for_status()
 
@@ -112,6 +531,9 @@ class RemehaHomeAPI:
         response = await self._async_api_request(
             "POST",
             f"/climate-zones/{climate_zone_id}/time-programs/heating/{time_program_id}/activate",
+            "command",
+            priority=RequestPriority.COMMAND,
+            idempotent=True,
         )
         response.raise_for_status()
 
@@ -120,6 +542,9 @@ class RemehaHomeAPI:
         response = await self._async_api_request(
             "POST",
             f"/climate-zones/{climate_zone_id}/modes/fireplacemode",
+            "command",
+            priority=RequestPriority.COMMAND,
+            idempotent=True,
             json={"fireplaceModeActive": enabled},
         )
         response.raise_for_status()
@@ -131,26 +556,41 @@ class RemehaHomeAPI:
         response = await self._async_api_request(
             "GET",
             f"/appliances/{appliance_id}/technicaldetails",
+            "appliance",
         )
         response.raise_for_status()
-        return await response.json()
+        return await self._async_read_json(response, "appliance")
 
     async def async_get_consumption_data_for_today(self, appliance_id: str) -> dict:
-        """Get technical information for an appliance."""
+        """Get the consumption data for today for an appliance."""
         today = datetime.datetime.now().replace(
             hour=0, minute=0, second=0, microsecond=0
         )
         end_of_today = today + datetime.timedelta(hours=23, minutes=59, seconds=59)
+        return await self.async_get_consumption_data(
+            appliance_id, "daily", today, end_of_today
+        )
 
-        today_string = today.strftime("%Y-%m-%d %H:%M:%S.%fZ")
-        end_of_today_string = end_of_today.strftime("%Y-%m-%d %H:%M:%S.%fZ")
+    async def async_get_consumption_data(
+        self,
+        appliance_id: str,
+        interval: str,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        priority: RequestPriority = RequestPriority.POLL,
+    ) -> dict:
+        """Get the daily, monthly or yearly consumption data for an appliance."""
+        start_string = start.strftime("%Y-%m-%d %H:%M:%S.%fZ")
+        end_string = end.strftime("%Y-%m-%d %H:%M:%S.%fZ")
 
         response = await self._async_api_request(
             "GET",
-            f"/appliances/{appliance_id}/energyconsumption/daily?startDate={today_string}&endDate={end_of_today_string}",
+            f"/appliances/{appliance_id}/energyconsumption/{interval}?startDate={start_string}&endDate={end_string}",
+            "energy",
+            priority=priority,
         )
         response.raise_for_status()
-        return await response.json()
+        return await self._async_read_json(response, "energy")
 
 
 class RemehaHomeAuthFailed(Exception):
@@ -160,9 +600,12 @@ class RemehaHomeAuthFailed(Exception):
 class RemehaHomeOAuth2Implementation(AbstractOAuth2Implementation):
     """Custom OAuth2 implementation for the Remeha Home integration."""
 
-    def __init__(self, session: ClientSession) -> None:
+    def __init__(
+        self, session: ClientSession, login_base_url: str = LOGIN_BASE_URL
+    ) -> None:
         """Create a Remeha Home OAuth2 implementation."""
         self._session = session
+        self._login_base_url = login_base_url.rstrip("/")
 
     @property
     def name(self) -> str:
@@ -193,7 +636,7 @@ class RemehaHomeOAuth2Implementation(AbstractOAuth2Implementation):
         async with asyncio.timeout(60):
             # Request the login page starting a new login transaction
             response = await self._session.get(
-                "https://remehalogin.bdrthermea.net/bdrb2cprod.onmicrosoft.com/oauth2/v2.0/authorize",
+                f"{self._login_base_url}/bdrb2cprod.onmicrosoft.com/oauth2/v2.0/authorize",
                 params={
                     "response_type": "code",
                     "client_id": "6ce007c6-0628-419e-88f4-bee2e6418eec",
@@ -227,13 +670,14 @@ class RemehaHomeOAuth2Implementation(AbstractOAuth2Implementation):
                 for cookie in self._session.cookie_jar
                 if (
                     cookie.key == "x-ms-cpim-csrf"
-                    and cookie["domain"] == "remehalogin.bdrthermea.net"
+                    and cookie["domain"]
+                    == urllib.parse.urlparse(self._login_base_url).hostname
                 )
             )
 
             # Post the user credentials to authenticate
             response = await self._session.post(
-                "https://remehalogin.bdrthermea.net/bdrb2cprod.onmicrosoft.com/B2C_1A_RPSignUpSignInNewRoomv3.1/SelfAsserted",
+                f"{self._login_base_url}/bdrb2cprod.onmicrosoft.com/B2C_1A_RPSignUpSignInNewRoomv3.1/SelfAsserted",
                 params={
                     "tx": "StateProperties=" + state_properties,
                     "p": "B2C_1A_RPSignUpSignInNewRoomv3.1",
@@ -248,13 +692,13 @@ class RemehaHomeOAuth2Implementation(AbstractOAuth2Implementation):
                 },
             )
             response.raise_for_status()
-            response_json = json.loads(await response.text())
+            response_json = await async_read_json(response)
             if response_json["status"] != "200":
                 raise RemehaHomeAuthFailed
 
             # Request the authentication complete callback
             response = await self._session.get(
-                "https://remehalogin.bdrthermea.net/bdrb2cprod.onmicrosoft.com/B2C_1A_RPSignUpSignInNewRoomv3.1/api/CombinedSigninAndSignup/confirmed",
+                f"{self._login_base_url}/bdrb2cprod.onmicrosoft.com/B2C_1A_RPSignUpSignInNewRoomv3.1/api/CombinedSigninAndSignup/confirmed",
                 params={
                     "rememberMe": "false",
                     "csrf_token": csrf_token,
@@ -296,15 +740,17 @@ class RemehaHomeOAuth2Implementation(AbstractOAuth2Implementation):
     async def _async_request_new_token(self, grant_params):
         """Call the OAuth2 token endpoint with specific grant paramters."""
         async with asyncio.timeout(30), self._session.post(
-            "https://remehalogin.bdrthermea.net/bdrb2cprod.onmicrosoft.com/oauth2/v2.0/token?p=B2C_1A_RPSignUpSignInNewRoomV3.1",
+            f"{self._login_base_url}/bdrb2cprod.onmicrosoft.com/oauth2/v2.0/token?p=B2C_1A_RPSignUpSignInNewRoomV3.1",
             data=grant_params,
             allow_redirects=True,
         ) as response:
             # NOTE: The OAuth2 token request sometimes returns a "400 Bad Request" response. The root cause of this
             #       problem has not been found, but this workaround allows you to reauthenticate at least. Otherwise
             #       Home Assitant would get stuck on refreshing the token forever.
+            #       Concurrent refreshes with the same refresh token are one possible cause, which is
+            #       why RemehaHomeAPI makes sure only a single refresh is in flight.
             if response.status == 400:
-                response_json = await response.json()
+                response_json = await async_read_json(response)
                 _LOGGER.error(
                     "OAuth2 token request returned '400 Bad Request': %s",
                     response_json["error_description"],
@@ -312,6 +758,6 @@ class RemehaHomeOAuth2Implementation(AbstractOAuth2Implementation):
                 raise ConfigEntryAuthFailed
 
             response.raise_for_status()
-            response_json = await response.json()
+            response_json = await async_read_json(response)
 
         return response_json
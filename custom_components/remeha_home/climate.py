@@ -13,6 +13,7 @@ from homeassistant.components.climate import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, PRECISION_HALVES, UnitOfTemperature
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -20,6 +21,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .api import RemehaHomeAPI
 from .const import DOMAIN
 from .coordinator import RemehaHomeUpdateCoordinator
+from .models import Appliance, ClimateZone
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -58,6 +60,64 @@ def get_hvac_mode_to_remeha_mode(appliance_type: str) -> dict:
         }
 
 
+async def async_send_zone_command(
+    api: RemehaHomeAPI,
+    climate_zone: ClimateZone,
+    appliance_type: str,
+    hvac_mode: HVACMode | None = None,
+    temperature: float | None = None,
+) -> dict[str, Any]:
+    """Send the commands to set the mode and temperature of a climate zone.
+
+    Without a mode the current mode is kept. A temperature overrides the
+    schedule until the next switch in auto mode and is held in manual mode.
+    Returns the changes to patch into the coordinator.
+    """
+    remeha_modes = get_hvac_mode_to_remeha_mode(appliance_type)
+    set_mode = hvac_mode is not None
+    if not set_mode:
+        hvac_mode = get_remeha_mode_to_hvac_mode(appliance_type).get(
+            climate_zone.zone_mode
+        )
+    if hvac_mode not in remeha_modes:
+        raise HomeAssistantError(f"Mode {hvac_mode} is not supported by the zone")
+
+    if temperature is not None:
+        if hvac_mode == HVACMode.OFF:
+            raise HomeAssistantError("Cannot set the temperature of a zone that is off")
+        if not (
+            climate_zone.set_point_min is None
+            or climate_zone.set_point_max is None
+            or climate_zone.set_point_min <= temperature <= climate_zone.set_point_max
+        ):
+            raise HomeAssistantError(
+                f"Temperature {temperature} is outside the range of the zone, "
+                f"{climate_zone.set_point_min} to {climate_zone.set_point_max}"
+            )
+
+    climate_zone_id = climate_zone.climate_zone_id
+    if hvac_mode == HVACMode.OFF:
+        await api.async_set_off(climate_zone_id)
+        return {"zone_mode": remeha_modes[hvac_mode]}
+
+    if hvac_mode == HVACMode.AUTO:
+        changes = {}
+        if set_mode:
+            await api.async_set_schedule(
+                climate_zone_id,
+                climate_zone.active_heating_climate_time_program_number,
+            )
+            changes = {"zone_mode": remeha_modes[hvac_mode]}
+        if temperature is not None:
+            await api.async_set_temporary_override(climate_zone_id, temperature)
+            changes = {"zone_mode": "TemporaryOverride", "set_point": temperature}
+        return changes
+
+    set_point = temperature if temperature is not None else climate_zone.set_point
+    await api.async_set_manual(climate_zone_id, set_point)
+    return {"zone_mode": remeha_modes[hvac_mode], "set_point": set_point}
+
+
 REMEHA_STATUS_TO_HVAC_ACTION = {
     "ProducingHeat": HVACAction.HEATING,
     "RequestingHeat": HVACAction.HEATING,
@@ -89,9 +149,9 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
 
     entities = []
-    for appliance in coordinator.data["appliances"]:
-        for climate_zone in appliance["climateZones"]:
-            climate_zone_id = climate_zone["climateZoneId"]
+    for appliance in coordinator.data.appliances:
+        for climate_zone in appliance.climate_zones:
+            climate_zone_id = climate_zone.climate_zone_id
             entities.append(RemehaHomeClimateEntity(api, coordinator, climate_zone_id))
 
     async_add_entities(entities)
@@ -120,7 +180,7 @@ class RemehaHomeClimateEntity(CoordinatorEntity, ClimateEntity):
         climate_zone_id: str,
     ) -> None:
         """Create a Remeha Home climate entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=climate_zone_id)
         self.api = api
         self.coordinator: RemehaHomeUpdateCoordinator = coordinator
         self.climate_zone_id = climate_zone_id
@@ -128,7 +188,7 @@ class RemehaHomeClimateEntity(CoordinatorEntity, ClimateEntity):
         self._attr_unique_id = "_".join([DOMAIN, self.climate_zone_id])
 
     @property
-    def _data(self) -> dict:
+    def _data(self) -> ClimateZone:
         """Return the climate zone information from the coordinator."""
         return self.coordinator.get_by_id(self.climate_zone_id)
 
@@ -137,49 +197,43 @@ class RemehaHomeClimateEntity(CoordinatorEntity, ClimateEntity):
         """Return device info for this device."""
         return self.coordinator.get_device_info(self.climate_zone_id)
 
-    def _get_appliance_data(self) -> dict | None:
+    def _get_appliance_data(self) -> Appliance | None:
         """Get the appliance data for this climate zone."""
-        for appliance in self.coordinator.data.get("appliances", []):
-            for climate_zone in appliance.get("climateZones", []):
-                if climate_zone.get("climateZoneId") == self.climate_zone_id:
-                    return appliance
-        return None
+        return self.coordinator.get_appliance(self.climate_zone_id)
 
     def _get_appliance_type(self) -> str:
         """Get the appliance type for this climate zone."""
         appliance_data = self._get_appliance_data()
-        return (
-            appliance_data.get("applianceType", "Boiler")
-            if appliance_data
-            else "Boiler"
-        )
+        if appliance_data is None or appliance_data.appliance_type is None:
+            return "Boiler"
+        return appliance_data.appliance_type
 
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        return self._data["roomTemperature"]
+        return self._data.room_temperature
 
     @property
     def target_temperature(self) -> float | None:
         """Return the target temperature."""
         if self.hvac_mode == HVACMode.OFF:
             return None
-        return self._data["setPoint"]
+        return self._data.set_point
 
     @property
     def min_temp(self) -> float:
         """Return the minimum temperature."""
-        return self._data["setPointMin"]
+        return self._data.set_point_min
 
     @property
     def max_temp(self) -> float:
         """Return the maximum temperature."""
-        return self._data["setPointMax"]
+        return self._data.set_point_max
 
     @property
     def hvac_mode(self) -> HVACMode | None:
         """Return hvac target hvac state."""
-        mode = self._data["zoneMode"]
+        mode = self._data.zone_mode
         appliance_type = self._get_appliance_type()
         hvac_mode = get_remeha_mode_to_hvac_mode(appliance_type).get(mode)
 
@@ -215,7 +269,7 @@ class RemehaHomeClimateEntity(CoordinatorEntity, ClimateEntity):
         if self.hvac_mode == HVACMode.OFF:
             return HVACAction.OFF
 
-        action = self._data["activeComfortDemand"]
+        action = self._data.active_comfort_demand
         hvac_action = REMEHA_STATUS_TO_HVAC_ACTION.get(action)
 
         # Enhanced debugging for cooling functionality
@@ -236,7 +290,7 @@ class RemehaHomeClimateEntity(CoordinatorEntity, ClimateEntity):
         if self.hvac_mode in (HVACMode.HEAT, HVACMode.HEAT_COOL):
             return "manual"
         return PRESET_INDEX_TO_PRESET_MODE[
-            self._data["activeHeatingClimateTimeProgramNumber"]
+            self._data.active_heating_climate_time_program_number
         ]
 
     @property
@@ -246,44 +300,24 @@ class RemehaHomeClimateEntity(CoordinatorEntity, ClimateEntity):
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
-        if (temperature := kwargs.get(ATTR_TEMPERATURE)) is not None:
-            _LOGGER.debug("Setting temperature to %f", temperature)
-            if self.hvac_mode == HVACMode.AUTO:
-                await self.api.async_set_temporary_override(
-                    self.climate_zone_id, temperature
-                )
-            elif self.hvac_mode in (HVACMode.HEAT, HVACMode.HEAT_COOL):
-                await self.api.async_set_manual(self.climate_zone_id, temperature)
-            elif self.hvac_mode == HVACMode.OFF:
-                return
-
-            await self.coordinator.async_request_refresh()
+        temperature = kwargs.get(ATTR_TEMPERATURE)
+        if temperature is None or self.hvac_mode in (None, HVACMode.OFF):
+            return
+
+        _LOGGER.debug("Setting temperature to %f", temperature)
+        changes = await async_send_zone_command(
+            self.api, self._data, self._get_appliance_type(), temperature=temperature
+        )
+        self.coordinator.async_patch_item(self.climate_zone_id, changes)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new operation mode."""
         _LOGGER.debug("Setting operation mode to %s", hvac_mode)
 
-        # Temporarily override the coordinator state until the next poll
-        appliance_type = self._get_appliance_type()
-        hvac_mode_mapping = get_hvac_mode_to_remeha_mode(appliance_type)
-        self._data["zoneMode"] = hvac_mode_mapping.get(hvac_mode)
-        self.async_write_ha_state()
-
-        if hvac_mode == HVACMode.AUTO:
-            await self.api.async_set_schedule(
-                self.climate_zone_id,
-                self._data["activeHeatingClimateTimeProgramNumber"],
-            )
-        elif hvac_mode in (HVACMode.HEAT, HVACMode.HEAT_COOL):
-            await self.api.async_set_manual(
-                self.climate_zone_id, self._data["setPoint"]
-            )
-        elif hvac_mode == HVACMode.OFF:
-            await self.api.async_set_off(self.climate_zone_id)
-        else:
-            raise NotImplementedError()
-
-        await self.coordinator.async_request_refresh()
+        changes = await async_send_zone_command(
+            self.api, self._data, self._get_appliance_type(), hvac_mode=hvac_mode
+        )
+        self.coordinator.async_patch_item(self.climate_zone_id, changes)
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode."""
@@ -296,12 +330,6 @@ class RemehaHomeClimateEntity(CoordinatorEntity, ClimateEntity):
         target_preset = PRESET_MODE_TO_PRESET_INDEX[preset_mode]
         previous_hvac_mode = self.hvac_mode
 
-        appliance_type = self._get_appliance_type()
-        hvac_mode_mapping = get_hvac_mode_to_remeha_mode(appliance_type)
-        self._data["zoneMode"] = hvac_mode_mapping.get(HVACMode.AUTO)
-        self._data["activeHeatingClimateTimeProgramNumber"] = target_preset
-        self.async_write_ha_state()
-
         # Switch the selected heating time program
         await self.api.async_activate_heating_time_program(
             self.climate_zone_id, target_preset
@@ -310,4 +338,9 @@ class RemehaHomeClimateEntity(CoordinatorEntity, ClimateEntity):
         if previous_hvac_mode != HVACMode.AUTO:
             await self.api.async_set_schedule(self.climate_zone_id, target_preset)
 
-        await self.coordinator.async_request_refresh()
+        appliance_type = self._get_appliance_type()
+        hvac_mode_mapping = get_hvac_mode_to_remeha_mode(appliance_type)
+        changes = {"active_heating_climate_time_program_number": target_preset}
+        if (zone_mode := hvac_mode_mapping.get(HVACMode.AUTO)) is not None:
+            changes["zone_mode"] = zone_mode
+        self.coordinator.async_patch_item(self.climate_zone_id, changes)
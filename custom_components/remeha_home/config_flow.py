@@ -10,7 +10,7 @@ from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.config_entry_oauth2_flow import AbstractOAuth2FlowHandler
 
-from .const import DOMAIN
+from .const import CONF_LOGIN_BASE_URL, DATA_CONFIG, DOMAIN, LOGIN_BASE_URL
 from .api import RemehaHomeAuthFailed, RemehaHomeOAuth2Implementation
 
 _LOGGER = logging.getLogger(__name__)
@@ -51,9 +51,14 @@ class RemehaHomeLoginFlowHandler(AbstractOAuth2FlowHandler, domain=DOMAIN):
         """Handle a flow start."""
         await self.async_set_unique_id(DOMAIN)
 
+        login_base_url = self.hass.data.get(DATA_CONFIG, {}).get(
+            CONF_LOGIN_BASE_URL, LOGIN_BASE_URL
+        )
         self.async_register_implementation(
             self.hass,
-            RemehaHomeOAuth2Implementation(async_get_clientsession(self.hass)),
+            RemehaHomeOAuth2Implementation(
+                async_get_clientsession(self.hass), login_base_url
+            ),
         )
 
         return await super().async_step_user(user_input)
@@ -1,5 +1,7 @@
 """Constants for the Remeha Home integration."""
 
+from datetime import datetime, timedelta
+
 from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorDeviceClass,
@@ -13,6 +15,124 @@ from homeassistant.const import UnitOfEnergy, UnitOfTemperature, UnitOfPressure
 
 DOMAIN = "remeha_home"
 
+API_BASE_URL = "https://api.bdrthermea.net/Mobile/api"
+LOGIN_BASE_URL = "https://remehalogin.bdrthermea.net"
+
+# Optional configuration.yaml overrides, e.g. to point at a local emulator
+CONF_API_BASE_URL = "api_base_url"
+CONF_LOGIN_BASE_URL = "login_base_url"
+CONF_DEDICATED_SESSION = "dedicated_session"
+CONF_TECHNICAL_INFO_TTL = "technical_info_ttl"
+CONF_DASHBOARD_FRESHNESS = "dashboard_freshness"
+CONF_MAX_PARALLEL_APPLIANCE_UPDATES = "max_parallel_appliance_updates"
+CONF_MIN_UPDATE_INTERVAL = "min_update_interval"
+CONF_MAX_UPDATE_INTERVAL = "max_update_interval"
+DATA_CONFIG = f"{DOMAIN}_config"
+# Lock serializing the profile_refresh service calls
+DATA_PROFILE_LOCK = f"{DOMAIN}_profile_lock"
+
+# Refresh the access token this many seconds before it expires
+TOKEN_REFRESH_MARGIN = 300
+# Retry interval in seconds after a failed background token refresh
+TOKEN_REFRESH_RETRY_INTERVAL = 60
+
+# Polling interval bounds, the coordinator adapts its interval to the dashboard state
+DEFAULT_UPDATE_INTERVAL = timedelta(seconds=60)
+DEFAULT_MIN_UPDATE_INTERVAL = timedelta(seconds=30)
+DEFAULT_MAX_UPDATE_INTERVAL = timedelta(minutes=5)
+# Default maximum interval with the dedicated session, below its connection
+# keepalive timeout so idle polls reuse the connection
+DEDICATED_SESSION_MAX_UPDATE_INTERVAL = timedelta(seconds=210)
+# Time in seconds to poll at the minimum interval after a command
+FAST_UPDATE_DURATION = 120
+# Delay after a scheduled switch time before polling to pick up its result
+SWITCH_TIME_UPDATE_DELAY = timedelta(seconds=15)
+# A dashboard fetched less than this long ago is reused instead of requested again
+DEFAULT_DASHBOARD_FRESHNESS = timedelta(seconds=2)
+
+# Delay in seconds before refreshing to confirm the result of a command
+COMMAND_CONFIRMATION_DELAY = 5
+# Time in seconds during which local command results override the cloud state
+COMMAND_PATCH_TIMEOUT = 60
+# Maximum number of zones the set_zones service sends commands for concurrently
+COMMAND_MAX_PARALLEL_ZONES = 4
+
+# Persisted dashboard cache used to set up entities before the first refresh
+CACHE_STORAGE_VERSION = 1
+# Minimum time in seconds between two writes of the cache and the write delay
+CACHE_SAVE_INTERVAL = 900
+CACHE_SAVE_DELAY = 10
+# Number of recent samples the performance statistics in the diagnostics cover
+STATS_WINDOW = 500
+# Interval at which the health sensors write their state
+HEALTH_SENSOR_UPDATE_INTERVAL = timedelta(minutes=5)
+
+# Age after which the cached technical information is refreshed in the background
+DEFAULT_TECHNICAL_INFO_TTL = timedelta(days=1)
+
+# Import of the energy consumption history into long-term statistics
+HISTORY_STORAGE_VERSION = 1
+HISTORY_EARLIEST_START = datetime(2015, 1, 1)
+# Size of the windows of daily data and the number of windows written per batch
+HISTORY_WINDOW = timedelta(days=31)
+HISTORY_BATCH_WINDOWS = 6
+# Maximum number of concurrent history requests and the pause in seconds after each
+HISTORY_MAX_PARALLEL_REQUESTS = 2
+HISTORY_REQUEST_INTERVAL = 1
+
+# Energy consumption data is requested by its own coordinator
+ENERGY_UPDATE_INTERVAL = timedelta(minutes=15)
+# Timeout in seconds for requesting the consumption data of all appliances
+ENERGY_UPDATE_TIMEOUT = 60
+# Delay to collect energy entities enabled together into a single request
+ENERGY_DEMAND_REFRESH_DELAY = 5
+
+# Request rate budget as (requests per second, burst) for the whole API
+RATE_LIMIT = (2.0, 20)
+# Request rate budgets as (requests per second, burst) per endpoint class
+RATE_LIMITS = {
+    "dashboard": (0.2, 3),
+    "command": (2.0, 20),
+    "appliance": (1.0, 10),
+    "energy": (1.0, 10),
+}
+# Pause in seconds after a throttled request without a Retry-After header
+RATE_LIMIT_DEFAULT_RETRY_AFTER = 30
+# Number of times a throttled request is sent again
+RATE_LIMIT_MAX_RETRIES = 1
+
+# Time in seconds an attempt waits for the response headers before it is retried
+REQUEST_TIMEOUT = 10
+# Time in seconds within which a request and its retries complete, below the
+# timeouts of the coordinator refreshes so they see the error of the request
+REQUEST_DEADLINE = 25
+# Number of times a failed request is retried
+RETRY_MAX_ATTEMPTS = 3
+# Response statuses of failed requests which are retried
+RETRY_STATUSES = {500, 502, 503, 504}
+# Base and maximum delay in seconds between retries
+RETRY_BACKOFF_BASE = 1.0
+RETRY_BACKOFF_MAX = 10.0
+# Number of consecutive failed requests after which requests fail fast
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+# Time in seconds during which requests fail fast
+CIRCUIT_BREAKER_RESET_TIMEOUT = 60
+
+# Maximum number of connections to the API host
+CONNECTION_LIMIT_PER_HOST = 4
+# Time in seconds an idle connection is kept open, below the 4 minute idle
+# timeout of the API gateway so a poll never reuses a connection it closed.
+# Polls further apart than this open a new connection.
+CONNECTION_KEEPALIVE_TIMEOUT = 230
+# Time in seconds resolved host names are cached
+DNS_CACHE_TTL = 3600
+
+# Maximum number of appliances for which data is requested concurrently
+DEFAULT_MAX_PARALLEL_APPLIANCE_UPDATES = 4
+# Timeout in seconds for all requests of a single appliance during a refresh
+APPLIANCE_UPDATE_TIMEOUT = 30
+
+
 APPLIANCE_SENSOR_TYPES = [
     SensorEntityDescription(
         key="waterPressure",
@@ -36,6 +156,9 @@ APPLIANCE_SENSOR_TYPES = [
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
     ),
+]
+
+APPLIANCE_ENERGY_SENSOR_TYPES = [
     SensorEntityDescription(
         key="consumptionData.heatingEnergyConsumed",
         name="Heating Energy Consumed",
@@ -1,46 +1,148 @@
 """Coordinator for fetching the Remeha Home data."""
 
+from dataclasses import replace
 from datetime import datetime, timedelta
 import logging
+import time
+from typing import Any
 
 import asyncio
-from aiohttp.client_exceptions import ClientResponseError
+from aiohttp.client_exceptions import ClientError, ClientResponseError
 
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.exceptions import ConfigEntryAuthFailed
+import homeassistant.util.dt as dt_util
 
 from .api import RemehaHomeAPI
-from .const import DOMAIN
+from .const import (
+    APPLIANCE_UPDATE_TIMEOUT,
+    CACHE_SAVE_DELAY,
+    CACHE_SAVE_INTERVAL,
+    CACHE_STORAGE_VERSION,
+    COMMAND_CONFIRMATION_DELAY,
+    COMMAND_PATCH_TIMEOUT,
+    DEFAULT_MAX_PARALLEL_APPLIANCE_UPDATES,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DEFAULT_MIN_UPDATE_INTERVAL,
+    DEFAULT_TECHNICAL_INFO_TTL,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+    ENERGY_DEMAND_REFRESH_DELAY,
+    ENERGY_UPDATE_INTERVAL,
+    ENERGY_UPDATE_TIMEOUT,
+    FAST_UPDATE_DURATION,
+    STATS_WINDOW,
+    SWITCH_TIME_UPDATE_DELAY,
+)
+from .models import (
+    Appliance,
+    ApplianceEnergy,
+    ClimateZone,
+    ConsumptionData,
+    Dashboard,
+    Gateway,
+    HotWaterZone,
+    TechnicalInfo,
+    parse_dashboard,
+)
+from .stats import RollingStats
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def cache_storage_key(config_entry: ConfigEntry) -> str:
+    """Return the storage key of the dashboard cache for a config entry."""
+    return f"{DOMAIN}.{config_entry.entry_id}"
+
+
+def energy_cache_storage_key(config_entry: ConfigEntry) -> str:
+    """Return the storage key of the consumption data cache for a config entry."""
+    return f"{DOMAIN}.{config_entry.entry_id}.energy"
+
+
 class RemehaHomeUpdateCoordinator(DataUpdateCoordinator):
     """Remeha Home update coordinator."""
 
-    def __init__(self, hass: HomeAssistant, api: RemehaHomeAPI) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: RemehaHomeAPI,
+        config_entry: ConfigEntry | None = None,
+        max_parallel_appliance_updates: int = DEFAULT_MAX_PARALLEL_APPLIANCE_UPDATES,
+        min_update_interval: timedelta = DEFAULT_MIN_UPDATE_INTERVAL,
+        max_update_interval: timedelta = DEFAULT_MAX_UPDATE_INTERVAL,
+        technical_info_ttl: timedelta = DEFAULT_TECHNICAL_INFO_TTL,
+    ) -> None:
         """Initialize Remeha Home update coordinator."""
         super().__init__(
             hass,
             _LOGGER,
+            config_entry=config_entry,
             name=DOMAIN,
-            update_interval=timedelta(seconds=60),
+            update_interval=max(
+                min_update_interval, min(DEFAULT_UPDATE_INTERVAL, max_update_interval)
+            ),
         )
+        self.min_update_interval = min_update_interval
+        self.max_update_interval = max_update_interval
+        self._fast_update_until = 0.0
+        self._previous_zone_states: list | None = None
         self.api = api
-        self.items = {}
+        self.items: dict[str, Appliance | ClimateZone | HotWaterZone] = {}
+        self.zone_appliance_ids = {}
         self.device_info = {}
-        self.technical_info = {}
-        self.appliance_consumption_data = {}
-        self.appliance_last_consumption_data_update = {}
+        self._device_info_hashes: dict[str, int] = {}
+        self.technical_info: dict[str, TechnicalInfo] = {}
+        self.technical_info_ttl = technical_info_ttl
+        self._technical_info_updated: dict[str, float] = {}
+        self._technical_info_refresh: asyncio.Task | None = None
+        self._appliance_semaphore = asyncio.Semaphore(max_parallel_appliance_updates)
+        self._changed_items: set[str] | None = None
+        self._dashboard_response: dict | None = None
+        self._listeners_update_success = True
+        # Pending local changes by item id, with the cloud values they replaced
+        self._pending_patches: dict[str, tuple[dict, dict, float]] = {}
+        self._unsub_confirmation_refresh: CALLBACK_TYPE | None = None
+        self._store: Store | None = (
+            Store(hass, CACHE_STORAGE_VERSION, cache_storage_key(config_entry))
+            if config_entry is not None
+            else None
+        )
+        self._last_cache_save = 0.0
+        self.last_refresh_duration: float | None = None
+        self.last_update_success_time: datetime | None = None
+        self.consecutive_failures = 0
+        # Time in seconds spent in each phase of a refresh
+        self.refresh_timings = {
+            phase: RollingStats(STATS_WINDOW)
+            for phase in ("dashboard", "technical_info", "processing")
+        }
 
-    async def _async_update_data(self):
+    async def _async_refresh(self, *args, **kwargs) -> None:
+        """Refresh the data, keeping track of the refresh health."""
+        start = time.monotonic()
+        await super()._async_refresh(*args, **kwargs)
+        self.last_refresh_duration = time.monotonic() - start
+        if self.last_update_success:
+            self.last_update_success_time = dt_util.utcnow()
+            self.consecutive_failures = 0
+        else:
+            self.consecutive_failures += 1
+
+    async def _async_update_data(self) -> Dashboard:
         """Fetch data from API endpoint.
 
         This is the place to pre-process the data to lookup tables
         so entities can quickly look up their data.
         """
+        start = time.monotonic()
         try:
             # Note: asyncio.TimeoutError and aiohttp.ClientError are already
             # handled by the data update coordinator.
@@ -54,145 +156,708 @@ class RemehaHomeUpdateCoordinator(DataUpdateCoordinator):
                 raise ConfigEntryAuthFailed from err
 
             raise UpdateFailed from err
+        self.refresh_timings["dashboard"].add(time.monotonic() - start)
+
+        new_appliance_ids = [
+            appliance["applianceId"]
+            for appliance in data["appliances"]
+            if appliance["applianceId"] not in self.technical_info
+        ]
+
+        # The API returns the previous response if the dashboard did not change.
+        # Pending patches and missing technical information still need processing.
+        if (
+            data is self._dashboard_response
+            and not self._pending_patches
+            and not new_appliance_ids
+        ):
+            self._changed_items = set()
+            self._adapt_update_interval(self.data)
+            self._async_schedule_technical_info_refresh()
+            return self.data
+
+        # Request the technical information of new appliances concurrently, a
+        # failing appliance is logged and skipped so it cannot fail the whole refresh
+        if new_appliance_ids:
+            start = time.monotonic()
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    for appliance_id in new_appliance_ids:
+                        task_group.create_task(
+                            self._async_update_technical_info(appliance_id)
+                        )
+            except ExceptionGroup as err:
+                # Only ConfigEntryAuthFailed is allowed to escape an appliance update
+                raise err.exceptions[0] from err
+            self.refresh_timings["technical_info"].add(time.monotonic() - start)
 
-        # Save the current time for appliance usage data updates
-        now = datetime.now()
+        start = time.monotonic()
+        dashboard = self._process_dashboard(data)
+        self._dashboard_response = data
+        self._async_schedule_technical_info_refresh()
+        self._async_schedule_cache_save()
+        self.refresh_timings["processing"].add(time.monotonic() - start)
 
-        for appliance in data["appliances"]:
-            appliance_id = appliance["applianceId"]
+        return dashboard
+
+    def _process_dashboard(self, data: dict) -> Dashboard:
+        """Parse the dashboard and build the lookup tables for the entities."""
+        previous_items = self.items
+        dashboard = parse_dashboard(data, previous_items)
+        self.items = {}
+        self.zone_appliance_ids = {}
+        for appliance in dashboard.appliances:
+            appliance_id = appliance.appliance_id
             self.items[appliance_id] = appliance
 
-            # Request appliance technical information the first time it is discovered
-            if appliance_id not in self.technical_info:
-                self.technical_info[appliance_id] = (
-                    await self.api.async_get_appliance_technical_information(
-                        appliance_id
-                    )
+            self._update_device_info(appliance)
+
+            for climate_zone in appliance.climate_zones:
+                self.items[climate_zone.climate_zone_id] = climate_zone
+                self.zone_appliance_ids[climate_zone.climate_zone_id] = appliance_id
+
+            for hot_water_zone in appliance.hot_water_zones:
+                self.items[hot_water_zone.hot_water_zone_id] = hot_water_zone
+                self.zone_appliance_ids[hot_water_zone.hot_water_zone_id] = appliance_id
+
+        self._reconcile_patches(previous_items)
+        self._changed_items = self._diff_items(previous_items)
+        self._adapt_update_interval(dashboard)
+
+        return dashboard
+
+    def _adapt_update_interval(self, dashboard: Dashboard) -> None:
+        """Set the update interval computed from the dashboard state."""
+        new_update_interval = self._compute_update_interval(dashboard)
+        if new_update_interval != self.update_interval:
+            _LOGGER.debug("Changing update interval to %s", new_update_interval)
+            self.update_interval = new_update_interval
+
+    def _update_device_info(self, appliance: Appliance) -> None:
+        """Update the device info of an appliance and its zones.
+
+        The device info is only rebuilt when the data it is built from changed.
+        Devices that are already registered are then updated in the device
+        registry.
+        """
+        appliance_id = appliance.appliance_id
+        content_hash = hash(
+            (
+                appliance.house_name,
+                tuple(
+                    (zone.climate_zone_id, zone.name)
+                    for zone in appliance.climate_zones
+                ),
+                tuple(
+                    (zone.hot_water_zone_id, zone.name)
+                    for zone in appliance.hot_water_zones
+                ),
+                self.technical_info.get(appliance_id),
+            )
+        )
+        previous_hash = self._device_info_hashes.get(appliance_id)
+        if content_hash == previous_hash:
+            return
+
+        self._device_info_hashes[appliance_id] = content_hash
+        device_info = self._build_device_info(appliance)
+        self.device_info.update(device_info)
+        if previous_hash is None:
+            return
+
+        _LOGGER.debug("Device info of appliance %s changed", appliance_id)
+        device_registry = dr.async_get(self.hass)
+        for info in device_info.values():
+            device = device_registry.async_get_device(identifiers=info["identifiers"])
+            if device is not None:
+                device_registry.async_update_device(
+                    device.id,
+                    name=info.get("name"),
+                    model=info.get("model"),
+                    hw_version=info.get("hw_version"),
+                    sw_version=info.get("sw_version"),
                 )
-                _LOGGER.debug(
-                    "Requested technical information for appliance %s: %s",
+
+    def _build_device_info(self, appliance: Appliance) -> dict[str, DeviceInfo]:
+        """Return the device info of an appliance and its zones by item id."""
+        appliance_id = appliance.appliance_id
+        # Technical information may be missing if its request failed
+        technical_info = self.technical_info.get(appliance_id, TechnicalInfo())
+        device_info = {
+            appliance_id: DeviceInfo(
+                identifiers={(DOMAIN, appliance_id)},
+                name=appliance.house_name,
+                manufacturer="Remeha",
+                model=technical_info.appliance_name,
+            )
+        }
+
+        for climate_zone in appliance.climate_zones:
+            climate_zone_id = climate_zone.climate_zone_id
+            # This assumes that all climate zones for an appliance share the same gateway
+            gateways = technical_info.internet_connected_gateways
+
+            if len(gateways) > 1:
+                _LOGGER.warning(
+                    "Appliance %s has more than one gateway, using technical information from the first one",
                     appliance_id,
-                    self.technical_info[appliance_id],
                 )
 
-            # Only update appliance usage data every 15 minutes
-            if (appliance_id not in self.appliance_last_consumption_data_update) or (
-                now - self.appliance_last_consumption_data_update[appliance_id]
-                >= timedelta(minutes=14, seconds=45)
-            ):
-                try:
-                    consumption_data = (
-                        await self.api.async_get_consumption_data_for_today(
-                            appliance_id
-                        )
+            if len(gateways) > 0:
+                gateway_info = gateways[0]
+            else:
+                _LOGGER.warning(
+                    "Appliance %s has no gateways, using unknown values",
+                    appliance_id,
+                )
+                gateway_info = Gateway()
+
+            device_info[climate_zone_id] = DeviceInfo(
+                identifiers={(DOMAIN, climate_zone_id)},
+                name=climate_zone.name,
+                manufacturer="Remeha",
+                model=gateway_info.name,
+                hw_version=gateway_info.hardware_version,
+                sw_version=gateway_info.software_version,
+                via_device=(DOMAIN, appliance_id),
+            )
+
+        for hot_water_zone in appliance.hot_water_zones:
+            hot_water_zone_id = hot_water_zone.hot_water_zone_id
+            device_info[hot_water_zone_id] = DeviceInfo(
+                identifiers={(DOMAIN, hot_water_zone_id)},
+                name=hot_water_zone.name,
+                manufacturer="Remeha",
+                model="Hot Water Zone",
+                via_device=(DOMAIN, appliance_id),
+            )
+
+        return device_info
+
+    async def async_load_cache(self) -> bool:
+        """Load the dashboard snapshot persisted by a previous run.
+
+        Returns whether a snapshot was loaded, in which case the entities can be
+        set up before the first refresh.
+        """
+        if self._store is None or (cache := await self._store.async_load()) is None:
+            return False
+
+        self.technical_info = {
+            appliance_id: TechnicalInfo.from_dict(technical_info)
+            for appliance_id, technical_info in cache["technical_info"].items()
+        }
+        # Caches of older versions have no update times, refresh them right away
+        self._technical_info_updated = cache.get("technical_info_updated", {})
+        self.data = self._process_dashboard(cache["dashboard"])
+        if (updated := cache.get("updated")) is not None:
+            self.last_update_success_time = dt_util.parse_datetime(updated)
+        _LOGGER.debug("Loaded cached dashboard information")
+        return True
+
+    @callback
+    def _async_schedule_cache_save(self) -> None:
+        """Persist the current data, at most once every cache save interval."""
+        now = time.monotonic()
+        if self._store is None or now - self._last_cache_save < CACHE_SAVE_INTERVAL:
+            return
+
+        self._last_cache_save = now
+        self._store.async_delay_save(self._cache_data, CACHE_SAVE_DELAY)
+
+    @callback
+    def _cache_data(self) -> dict:
+        return {
+            "dashboard": self.data.as_dict(),
+            "technical_info": {
+                appliance_id: technical_info.as_dict()
+                for appliance_id, technical_info in self.technical_info.items()
+            },
+            "technical_info_updated": self._technical_info_updated,
+            "updated": (
+                self.last_update_success_time.isoformat()
+                if self.last_update_success_time is not None
+                else None
+            ),
+        }
+
+    def _compute_update_interval(self, dashboard: Dashboard) -> timedelta:
+        """Compute the interval until the next poll from the dashboard state.
+
+        Poll fast after commands, poll right after the next schedule switch and
+        back off while all zones are idle and their state does not change.
+        """
+        idle = True
+        zone_states = []
+        switch_times = []
+        for appliance in dashboard.appliances:
+            for climate_zone in appliance.climate_zones:
+                idle = idle and climate_zone.active_comfort_demand == "Idle"
+                zone_states.append(
+                    (
+                        climate_zone.zone_mode,
+                        climate_zone.set_point,
+                        climate_zone.active_comfort_demand,
                     )
-                    _LOGGER.debug(
-                        "Requested consumption data for appliance %s: %s",
-                        appliance_id,
-                        consumption_data,
+                )
+                switch_times.append(climate_zone.next_switch_time)
+            for hot_water_zone in appliance.hot_water_zones:
+                idle = idle and hot_water_zone.dhw_status == "Idle"
+                zone_states.append(
+                    (
+                        hot_water_zone.dhw_zone_mode,
+                        hot_water_zone.target_setpoint,
+                        hot_water_zone.dhw_status,
                     )
+                )
+                switch_times.append(hot_water_zone.next_switch_time)
 
-                    if len(consumption_data["data"]) > 0:
-                        self.appliance_consumption_data[appliance_id] = (
-                            consumption_data["data"][0]
-                        )
-                    else:
-                        _LOGGER.warning(
-                            "No consumption data found for appliance %s", appliance_id
-                        )
-                        self.appliance_consumption_data[appliance_id] = {
-                            "heatingEnergyConsumed": 0.0,
-                            "hotWaterEnergyConsumed": 0.0,
-                            "coolingEnergyConsumed": 0.0,
-                            "heatingEnergyDelivered": 0.0,
-                            "hotWaterEnergyDelivered": 0.0,
-                            "coolingEnergyDelivered": 0.0,
-                        }
-
-                    self.appliance_last_consumption_data_update[appliance_id] = now
-                except ClientResponseError as err:
-                    _LOGGER.warning(
-                        "Failed to request consumption data for appliance %s: %s",
-                        appliance_id,
-                        err,
+        stable = idle and zone_states == self._previous_zone_states
+        self._previous_zone_states = zone_states
+
+        if time.monotonic() < self._fast_update_until:
+            update_interval = self.min_update_interval
+        elif stable:
+            update_interval = min(self.update_interval * 2, self.max_update_interval)
+        else:
+            update_interval = DEFAULT_UPDATE_INTERVAL
+
+        # Make sure the poll after an upcoming schedule switch is not delayed
+        now = dt_util.now()
+        for switch_time in switch_times:
+            if not switch_time or not (parsed := dt_util.parse_datetime(switch_time)):
+                continue
+            # The dashboard reports local time with a UTC designator, see sensor.py
+            until_switch = (
+                parsed.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+                - now
+                + SWITCH_TIME_UPDATE_DELAY
+            )
+            if timedelta(0) < until_switch < update_interval:
+                update_interval = until_switch
+
+        return max(
+            self.min_update_interval, min(update_interval, self.max_update_interval)
+        )
+
+    def _diff_items(self, previous_items: dict) -> set[str] | None:
+        """Return the ids of the items that changed compared to the previous items.
+
+        Returns None if items were added or removed, in which case all
+        listeners are updated. Unchanged items are shared between snapshots,
+        so most comparisons end at an identity check. Appliances are compared
+        without their zones.
+        """
+        if previous_items.keys() != self.items.keys():
+            return None
+
+        changed = set()
+        for item_id, item in self.items.items():
+            previous = previous_items.get(item_id)
+            if previous is None or previous != item:
+                changed.add(item_id)
+                # Climate zones depend on the type of their appliance
+                if (
+                    isinstance(item, Appliance)
+                    and previous is not None
+                    and previous.appliance_type != item.appliance_type
+                ):
+                    changed.update(
+                        climate_zone.climate_zone_id
+                        for climate_zone in item.climate_zones
                     )
+        return changed
 
-            # Get the cached consumption data for the appliance or use default values
-            if appliance_id in self.appliance_consumption_data:
-                appliance["consumptionData"] = self.appliance_consumption_data[
-                    appliance_id
-                ]
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners of the items that changed in the last refresh.
+
+        Listeners are registered with the id of their item as context. All
+        listeners are updated if the availability of the data or the list of
+        devices changed.
+        """
+        changed_items = self._changed_items
+        self._changed_items = None
+        if (
+            changed_items is None
+            or self.last_update_success != self._listeners_update_success
+        ):
+            self._listeners_update_success = self.last_update_success
+            super().async_update_listeners()
+            return
+
+        self._async_update_item_listeners(changed_items)
+
+    @callback
+    def _async_update_item_listeners(self, item_ids: set[str]) -> None:
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in item_ids:
+                update_callback()
+
+    @callback
+    def async_patch_item(
+        self, item_id: str, changes: dict[str, Any], confirm: bool = True
+    ) -> None:
+        """Apply the result of a successful command to the cached item state.
+
+        The changes map model attribute names to their new value. Only the
+        listeners of the item are notified. Unless confirm is False, in which
+        case the caller requests the refresh itself, a confirmation refresh is
+        scheduled to reconcile the local changes with the cloud state.
+        """
+        if (item := self.items.get(item_id)) is None:
+            return
+
+        pending_changes, cloud_values, _ = self._pending_patches.get(
+            item_id, ({}, {}, 0)
+        )
+        # Fields without a pending change still hold the cloud value
+        cloud_values = {
+            key: cloud_values[key] if key in cloud_values else getattr(item, key)
+            for key in {**pending_changes, **changes}
+        }
+        self.items[item_id] = replace(item, **changes)
+        self._pending_patches[item_id] = (
+            {**pending_changes, **changes},
+            cloud_values,
+            time.monotonic() + COMMAND_PATCH_TIMEOUT,
+        )
+
+        self._async_update_item_listeners({item_id})
+
+        # Poll fast for a while to pick up the effects of the command
+        self._fast_update_until = time.monotonic() + FAST_UPDATE_DURATION
+
+        if not confirm:
+            return
+
+        # Postpone the confirmation while commands keep coming in
+        if self._unsub_confirmation_refresh is not None:
+            self._unsub_confirmation_refresh()
+        self._unsub_confirmation_refresh = async_call_later(
+            self.hass, COMMAND_CONFIRMATION_DELAY, self._async_confirmation_refresh
+        )
+
+    async def async_shutdown(self) -> None:
+        """Cancel any scheduled refresh of the coordinator."""
+        await super().async_shutdown()
+        if self._unsub_confirmation_refresh is not None:
+            self._unsub_confirmation_refresh()
+            self._unsub_confirmation_refresh = None
+        if self._technical_info_refresh is not None:
+            self._technical_info_refresh.cancel()
+            self._technical_info_refresh = None
+
+    async def _async_confirmation_refresh(self, _now) -> None:
+        self._unsub_confirmation_refresh = None
+        await self.async_request_refresh()
+
+    def _reconcile_patches(self, previous_items: dict) -> None:
+        """Reconcile locally patched items with freshly requested items.
+
+        A local change is dropped once the cloud reports the changed value or
+        any other change to the field, in which case the cloud state wins.
+        """
+        now = time.monotonic()
+        for item_id, (changes, cloud_values, expires_at) in list(
+            self._pending_patches.items()
+        ):
+            if (item := self.items.get(item_id)) is None:
+                del self._pending_patches[item_id]
+                continue
+
+            # Changes the cloud neither reflects nor overrode yet
+            changes = {
+                key: value
+                for key, value in changes.items()
+                if getattr(item, key) != value
+                and getattr(item, key) == cloud_values[key]
+            }
+            if not changes:
+                del self._pending_patches[item_id]
+            elif now < expires_at:
+                # The cloud has not processed the command yet, keep the local state
+                self._pending_patches[item_id] = (changes, cloud_values, expires_at)
+                patched = replace(item, **changes)
+                previous = previous_items.get(item_id)
+                self.items[item_id] = previous if previous == patched else patched
             else:
-                appliance["consumptionData"] = {
-                    "heatingEnergyConsumed": 0.0,
-                    "hotWaterEnergyConsumed": 0.0,
-                    "coolingEnergyConsumed": 0.0,
-                    "heatingEnergyDelivered": 0.0,
-                    "hotWaterEnergyDelivered": 0.0,
-                    "coolingEnergyDelivered": 0.0,
-                }
+                _LOGGER.debug(
+                    "Cloud state of %s does not reflect command %s, discarding it",
+                    item_id,
+                    changes,
+                )
+                del self._pending_patches[item_id]
 
-            self.device_info[appliance_id] = DeviceInfo(
-                identifiers={(DOMAIN, appliance_id)},
-                name=appliance["houseName"],
-                manufacturer="Remeha",
-                model=self.technical_info[appliance_id]["applianceName"],
+    @callback
+    def _async_schedule_technical_info_refresh(self) -> None:
+        """Refresh the expired technical information in the background."""
+        if (
+            self._technical_info_refresh is not None
+            and not self._technical_info_refresh.done()
+        ):
+            return
+
+        expires_before = time.time() - self.technical_info_ttl.total_seconds()
+        expired = [
+            appliance_id
+            for appliance_id in self.technical_info
+            if appliance_id in self.items
+            and self._technical_info_updated.get(appliance_id, 0) < expires_before
+        ]
+        if expired:
+            self._technical_info_refresh = self.hass.async_create_background_task(
+                self._async_refresh_technical_info(expired),
+                f"{DOMAIN} refresh technical information",
             )
 
-            for climate_zone in appliance["climateZones"]:
-                climate_zone_id = climate_zone["climateZoneId"]
-                # This assumes that all climate zones for an appliance share the same gateway
-                gateways = self.technical_info[appliance_id][
-                    "internetConnectedGateways"
-                ]
-
-                if len(gateways) > 1:
-                    _LOGGER.warning(
-                        "Appliance %s has more than one gateway, using technical information from the first one",
-                        appliance_id,
+    async def _async_refresh_technical_info(self, appliance_ids: list[str]) -> None:
+        """Refresh the technical information of appliances.
+
+        The device registry is only updated for appliances of which the
+        technical information changed.
+        """
+        start = time.monotonic()
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                for appliance_id in appliance_ids:
+                    task_group.create_task(
+                        self._async_update_technical_info(appliance_id)
                     )
+        except ExceptionGroup:
+            # The next refresh fails as well and starts the reauth flow
+            return
+        self.refresh_timings["technical_info"].add(time.monotonic() - start)
 
-                if len(gateways) > 0:
-                    gateway_info = gateways[0]
-                else:
-                    _LOGGER.warning(
-                        "Appliance %s has no gateways, using unknown values",
-                        appliance_id,
+        self._async_schedule_cache_save()
+        for appliance_id in appliance_ids:
+            if (appliance := self.items.get(appliance_id)) is not None:
+                self._update_device_info(appliance)
+
+    async def _async_update_technical_info(self, appliance_id: str) -> None:
+        """Request the technical information for an appliance."""
+        try:
+            async with self._appliance_semaphore, asyncio.timeout(
+                APPLIANCE_UPDATE_TIMEOUT
+            ):
+                technical_info = TechnicalInfo.from_dict(
+                    await self.api.async_get_appliance_technical_information(
+                        appliance_id
                     )
-                    gateway_info = {
-                        "name": "Unknown",
-                        "hardwareVersion": "Unknown",
-                        "softwareVersion": "Unknown",
-                    }
-
-                self.items[climate_zone_id] = climate_zone
-                self.device_info[climate_zone_id] = DeviceInfo(
-                    identifiers={(DOMAIN, climate_zone_id)},
-                    name=climate_zone["name"],
-                    manufacturer="Remeha",
-                    model=gateway_info["name"],
-                    hw_version=gateway_info["hardwareVersion"],
-                    sw_version=gateway_info["softwareVersion"],
-                    via_device=(DOMAIN, appliance_id),
                 )
-
-            for hot_water_zone in appliance["hotWaterZones"]:
-                hot_water_zone_id = hot_water_zone["hotWaterZoneId"]
-                self.items[hot_water_zone_id] = hot_water_zone
-                self.device_info[hot_water_zone_id] = DeviceInfo(
-                    identifiers={(DOMAIN, hot_water_zone_id)},
-                    name=hot_water_zone["name"],
-                    manufacturer="Remeha",
-                    model="Hot Water Zone",
-                    via_device=(DOMAIN, appliance_id),
+                _LOGGER.debug(
+                    "Requested technical information for appliance %s: %s",
+                    appliance_id,
+                    technical_info,
                 )
+        except ClientResponseError as err:
+            if err.status == 401:
+                raise ConfigEntryAuthFailed from err
 
-        return data
+            _LOGGER.warning(
+                "Failed to request technical information for appliance %s: %s",
+                appliance_id,
+                err,
+            )
+            return
+        except (ClientError, TimeoutError) as err:
+            _LOGGER.warning(
+                "Failed to request technical information for appliance %s: %s",
+                appliance_id,
+                err,
+            )
+            return
+
+        self._technical_info_updated[appliance_id] = time.time()
+        self.technical_info[appliance_id] = technical_info
 
     def get_by_id(self, item_id: str):
         """Return item with the specified item id."""
         return self.items.get(item_id)
 
+    def get_appliance(self, zone_id: str) -> Appliance | None:
+        """Return the appliance of the zone with the specified zone id."""
+        return self.items.get(self.zone_appliance_ids.get(zone_id))
+
     def get_device_info(self, item_id: str):
         """Return device info for the item with the specified id."""
         return self.device_info.get(item_id)
+
+
+class RemehaHomeEnergyUpdateCoordinator(DataUpdateCoordinator):
+    """Remeha Home energy consumption update coordinator.
+
+    Consumption data is requested on its own schedule, so the latency of the
+    energy endpoints never delays the dashboard refresh. It is only requested
+    for appliances with an enabled energy entity, entities subscribe with the
+    appliance id as their listener context.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: RemehaHomeAPI,
+        dashboard_coordinator: RemehaHomeUpdateCoordinator,
+        config_entry: ConfigEntry | None = None,
+        max_parallel_appliance_updates: int = DEFAULT_MAX_PARALLEL_APPLIANCE_UPDATES,
+    ) -> None:
+        """Initialize Remeha Home energy consumption update coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=config_entry,
+            name=f"{DOMAIN} energy",
+            update_interval=ENERGY_UPDATE_INTERVAL,
+            # Collect the entities added together into a single refresh
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=ENERGY_DEMAND_REFRESH_DELAY, immediate=False
+            ),
+        )
+        self.api = api
+        self.dashboard_coordinator = dashboard_coordinator
+        self._appliance_semaphore = asyncio.Semaphore(max_parallel_appliance_updates)
+        self._store: Store | None = (
+            Store(hass, CACHE_STORAGE_VERSION, energy_cache_storage_key(config_entry))
+            if config_entry is not None
+            else None
+        )
+        # Whether the data was loaded from the cache and not refreshed since
+        self._data_from_cache = False
+        # Time in seconds spent in each phase of a refresh
+        self.refresh_timings = {"consumption": RollingStats(STATS_WINDOW)}
+
+    async def async_load_cache(self) -> bool:
+        """Load the consumption data persisted earlier today.
+
+        The consumption data covers the current day, so data persisted on an
+        earlier day is ignored. Returns whether data was loaded.
+        """
+        if self._store is None or (cache := await self._store.async_load()) is None:
+            return False
+
+        if cache["date"] != dt_util.now().date().isoformat():
+            return False
+
+        self.data = {
+            appliance_id: ApplianceEnergy.from_dict(appliance_energy)
+            for appliance_id, appliance_energy in cache["energy"].items()
+        }
+        self._data_from_cache = True
+        _LOGGER.debug("Loaded cached consumption data")
+        return True
+
+    @callback
+    def _cache_data(self) -> dict:
+        return {
+            "date": dt_util.now().date().isoformat(),
+            "energy": {
+                appliance_id: appliance_energy.as_dict()
+                for appliance_id, appliance_energy in self.data.items()
+            },
+        }
+
+    async def _async_update_data(self) -> dict[str, ApplianceEnergy]:
+        """Fetch the consumption data for today for the appliances in use."""
+        dashboard = self.dashboard_coordinator.data or Dashboard()
+        contexts = set(self.async_contexts())
+        appliance_ids = [
+            appliance.appliance_id
+            for appliance in dashboard.appliances
+            if appliance.appliance_id in contexts
+        ]
+        # Keep the previous data of appliances for which the request fails
+        data = {
+            appliance_id: appliance_data
+            for appliance_id, appliance_data in (self.data or {}).items()
+            if appliance_id in appliance_ids
+        }
+
+        start = time.monotonic()
+        task_group = asyncio.TaskGroup()
+        try:
+            async with asyncio.timeout(ENERGY_UPDATE_TIMEOUT), task_group:
+                tasks = {
+                    appliance_id: task_group.create_task(
+                        self._async_get_consumption_data(appliance_id)
+                    )
+                    for appliance_id in appliance_ids
+                }
+        except ExceptionGroup as err:
+            # Only ConfigEntryAuthFailed is allowed to escape an appliance update
+            raise err.exceptions[0] from err
+        self.refresh_timings["consumption"].add(time.monotonic() - start)
+
+        failed = 0
+        for appliance_id, task in tasks.items():
+            if (consumption_data := task.result()) is None:
+                failed += 1
+            else:
+                data[appliance_id] = ApplianceEnergy(consumption_data)
+
+        if appliance_ids and failed == len(appliance_ids):
+            raise UpdateFailed("Failed to request consumption data for all appliances")
+
+        self._data_from_cache = False
+        if self._store is not None:
+            self._store.async_delay_save(self._cache_data, CACHE_SAVE_DELAY)
+        return data
+
+    async def _async_get_consumption_data(
+        self, appliance_id: str
+    ) -> ConsumptionData | None:
+        """Request the consumption data for today for an appliance."""
+        try:
+            async with self._appliance_semaphore, asyncio.timeout(
+                APPLIANCE_UPDATE_TIMEOUT
+            ):
+                consumption_data = await self.api.async_get_consumption_data_for_today(
+                    appliance_id
+                )
+        except ClientResponseError as err:
+            if err.status == 401:
+                raise ConfigEntryAuthFailed from err
+
+            _LOGGER.warning(
+                "Failed to request consumption data for appliance %s: %s",
+                appliance_id,
+                err,
+            )
+            return None
+        except (ClientError, TimeoutError) as err:
+            _LOGGER.warning(
+                "Failed to request consumption data for appliance %s: %s",
+                appliance_id,
+                err,
+            )
+            return None
+
+        _LOGGER.debug(
+            "Requested consumption data for appliance %s: %s",
+            appliance_id,
+            consumption_data,
+        )
+
+        if len(consumption_data["data"]) > 0:
+            return ConsumptionData.from_dict(consumption_data["data"][0])
+
+        _LOGGER.warning("No consumption data found for appliance %s", appliance_id)
+        return ConsumptionData()
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> CALLBACK_TYPE:
+        """Listen for data updates, requesting the data of a new appliance."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        # Cached data is shown until the data is refreshed
+        if self._data_from_cache or context not in (self.data or {}):
+            self.hass.async_create_task(self.async_request_refresh())
+        return remove_listener
+
+    def get_by_id(self, appliance_id: str) -> ApplianceEnergy | None:
+        """Return the energy data of the appliance with the specified id."""
+        return (self.data or {}).get(appliance_id)
+
+    def get_device_info(self, item_id: str):
+        """Return device info for the item with the specified id."""
+        return self.dashboard_coordinator.get_device_info(item_id)
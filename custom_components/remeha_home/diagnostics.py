@@ -0,0 +1,39 @@
+"""Diagnostics support for Remeha Home."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+TO_REDACT = {"token", "access_token", "refresh_token", "id_token"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    api = entry_data["api"]
+    coordinator = entry_data["coordinator"]
+    energy_coordinator = entry_data["energy_coordinator"]
+    connection_stats = entry_data["connection_stats"]
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "update_interval": str(coordinator.update_interval),
+        "last_update_success": coordinator.last_update_success,
+        "requests": api.performance_stats(),
+        "refresh_timings": {
+            phase: stats.as_dict()
+            for phase, stats in (
+                coordinator.refresh_timings | energy_coordinator.refresh_timings
+            ).items()
+        },
+        "circuit_breaker": api.circuit_breaker.as_dict(),
+        "connections": connection_stats.counts if connection_stats else None,
+    }
@@ -0,0 +1,285 @@
+"""Import the energy consumption history of appliances into long-term statistics."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+import logging
+import re
+
+import asyncio
+from aiohttp.client_exceptions import ClientError
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+    statistics_during_period,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfEnergy
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
+from homeassistant.util import slugify
+
+from .api import RemehaHomeAPI
+from .const import (
+    APPLIANCE_ENERGY_SENSOR_TYPES,
+    DOMAIN,
+    HISTORY_BATCH_WINDOWS,
+    HISTORY_EARLIEST_START,
+    HISTORY_MAX_PARALLEL_REQUESTS,
+    HISTORY_REQUEST_INTERVAL,
+    HISTORY_STORAGE_VERSION,
+    HISTORY_WINDOW,
+)
+from .models import Appliance
+from .ratelimit import RequestPriority
+
+_LOGGER = logging.getLogger(__name__)
+
+# The consumption data fields with the name of their sensor
+ENERGY_FIELDS = {
+    description.key.removeprefix("consumptionData."): description.name
+    for description in APPLIANCE_ENERGY_SENSOR_TYPES
+}
+
+
+def history_storage_key(config_entry: ConfigEntry) -> str:
+    """Return the storage key of the import progress for a config entry."""
+    return f"{DOMAIN}.{config_entry.entry_id}.energy_history"
+
+
+def energy_statistic_id(appliance_id: str, field: str) -> str:
+    """Return the external statistic id for a consumption field of an appliance."""
+    field = re.sub(r"(?<!^)(?=[A-Z])", "_", field)
+    return f"{DOMAIN}:{slugify(f'{appliance_id}_{field}')}"
+
+
+def _has_consumption(entry: dict) -> bool:
+    return any(entry.get(field) for field in ENERGY_FIELDS)
+
+
+def _last_sums_before(
+    hass: HomeAssistant, statistic_ids: dict[str, str], start: datetime
+) -> dict[str, float]:
+    """Return the sum of the last statistic before start by field.
+
+    Fields without statistics before start start at 0. Must run in the
+    recorder executor.
+    """
+    sums = {field: 0.0 for field in statistic_ids.values()}
+    for statistic_id, field in statistic_ids.items():
+        rows = get_last_statistics(hass, 1, statistic_id, False, {"sum"}).get(
+            statistic_id
+        )
+        if rows and rows[0]["start"] >= start.timestamp():
+            # The import overlaps the statistics, find the last one before it
+            rows = statistics_during_period(
+                hass,
+                dt_util.as_utc(HISTORY_EARLIEST_START),
+                start,
+                {statistic_id},
+                "hour",
+                None,
+                {"sum"},
+            ).get(statistic_id)
+        if rows and rows[-1].get("sum") is not None:
+            sums[field] = rows[-1]["sum"]
+    return sums
+
+
+class RemehaHomeEnergyHistoryImporter:
+    """Import the consumption history of appliances into external statistics.
+
+    The history is requested in windows of daily data, several windows at a
+    time. Statistics are written per batch of windows, after which the progress
+    is checkpointed so an interrupted import resumes where it left off.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, api: RemehaHomeAPI, config_entry: ConfigEntry
+    ) -> None:
+        """Create an energy history importer for a config entry."""
+        self.hass = hass
+        self.api = api
+        self._store = Store(
+            hass, HISTORY_STORAGE_VERSION, history_storage_key(config_entry)
+        )
+        self._lock = asyncio.Lock()
+        self._request_semaphore = asyncio.Semaphore(HISTORY_MAX_PARALLEL_REQUESTS)
+
+    async def async_import(
+        self, appliances: Sequence[Appliance], start: datetime | None = None
+    ) -> None:
+        """Import the history of the appliances up to and including yesterday.
+
+        Without a start the import resumes from the last checkpoint, or starts
+        at the first month with consumption data for a new appliance.
+        """
+        if self._lock.locked():
+            _LOGGER.warning("An energy history import is already running")
+            return
+
+        async with self._lock:
+            checkpoints = await self._store.async_load() or {}
+            for appliance in appliances:
+                await self._async_import_appliance(appliance, checkpoints, start)
+
+    async def _async_import_appliance(
+        self, appliance: Appliance, checkpoints: dict, start: datetime | None
+    ) -> None:
+        appliance_id = appliance.appliance_id
+
+        if start is None and (checkpoint := checkpoints.get(appliance_id)):
+            window_start = dt_util.parse_datetime(checkpoint["next_start"])
+            sums = checkpoint["sums"]
+        else:
+            try:
+                window_start = start or await self._async_find_first_month(appliance_id)
+            except (ClientError, TimeoutError) as err:
+                _LOGGER.warning(
+                    "Failed to request the consumption history of appliance %s: %s",
+                    appliance_id,
+                    err,
+                )
+                return
+
+            if window_start is None:
+                _LOGGER.info(
+                    "No consumption history found for appliance %s", appliance_id
+                )
+                return
+
+            # Continue the sums of statistics imported before, so they stay monotonic
+            sums = await get_instance(self.hass).async_add_executor_job(
+                _last_sums_before,
+                self.hass,
+                {
+                    energy_statistic_id(appliance_id, field): field
+                    for field in ENERGY_FIELDS
+                },
+                window_start,
+            )
+
+        # Today is incomplete, it is covered by the consumption sensors
+        end = dt_util.start_of_local_day()
+        windows = []
+        while window_start < end:
+            window_end = min(window_start + HISTORY_WINDOW, end)
+            windows.append((window_start, window_end - timedelta(seconds=1)))
+            window_start = window_end
+
+        metadata = {
+            field: StatisticMetaData(
+                has_mean=False,
+                has_sum=True,
+                name=f"{appliance.house_name} {name}",
+                source=DOMAIN,
+                statistic_id=energy_statistic_id(appliance_id, field),
+                unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+            )
+            for field, name in ENERGY_FIELDS.items()
+        }
+
+        for index in range(0, len(windows), HISTORY_BATCH_WINDOWS):
+            batch = windows[index : index + HISTORY_BATCH_WINDOWS]
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    tasks = [
+                        task_group.create_task(
+                            self._async_fetch(appliance_id, "daily", *window)
+                        )
+                        for window in batch
+                    ]
+            except ExceptionGroup as err:
+                _LOGGER.warning(
+                    "Failed to import the consumption history of appliance %s from %s, "
+                    "the import will resume from there: %s",
+                    appliance_id,
+                    batch[0][0],
+                    err.exceptions[0],
+                )
+                return
+
+            statistics: dict[str, list[StatisticData]] = {
+                field: [] for field in ENERGY_FIELDS
+            }
+            for task in tasks:
+                for entry in sorted(task.result(), key=lambda e: e["timeStamp"]):
+                    entry_start = dt_util.parse_datetime(entry["timeStamp"])
+                    for field, field_statistics in statistics.items():
+                        value = entry.get(field) or 0.0
+                        sums[field] += value
+                        field_statistics.append(
+                            StatisticData(
+                                start=entry_start, state=value, sum=sums[field]
+                            )
+                        )
+
+            for field, field_statistics in statistics.items():
+                if field_statistics:
+                    async_add_external_statistics(
+                        self.hass, metadata[field], field_statistics
+                    )
+
+            next_start = batch[-1][1] + timedelta(seconds=1)
+            checkpoints[appliance_id] = {
+                "next_start": next_start.isoformat(),
+                "sums": dict(sums),
+            }
+            await self._store.async_save(checkpoints)
+            _LOGGER.debug(
+                "Imported consumption history of appliance %s up to %s",
+                appliance_id,
+                next_start,
+            )
+
+    async def _async_find_first_month(self, appliance_id: str) -> datetime | None:
+        """Find the first month with consumption data using the yearly and monthly data."""
+        now = dt_util.now()
+        yearly = await self._async_fetch(
+            appliance_id, "yearly", HISTORY_EARLIEST_START, now
+        )
+        first_year = next(
+            (
+                dt_util.parse_datetime(entry["timeStamp"])
+                for entry in sorted(yearly, key=lambda e: e["timeStamp"])
+                if _has_consumption(entry)
+            ),
+            None,
+        )
+        if first_year is None:
+            return None
+
+        first_year = dt_util.start_of_local_day(
+            first_year.date().replace(month=1, day=1)
+        )
+        monthly = await self._async_fetch(
+            appliance_id,
+            "monthly",
+            first_year,
+            min(first_year.replace(month=12, day=31), now),
+        )
+        first_month = next(
+            (
+                dt_util.parse_datetime(entry["timeStamp"])
+                for entry in sorted(monthly, key=lambda e: e["timeStamp"])
+                if _has_consumption(entry)
+            ),
+            first_year,
+        )
+        return dt_util.start_of_local_day(first_month.date().replace(day=1))
+
+    async def _async_fetch(
+        self, appliance_id: str, interval: str, start: datetime, end: datetime
+    ) -> list[dict]:
+        async with self._request_semaphore:
+            result = await self.api.async_get_consumption_data(
+                appliance_id, interval, start, end, RequestPriority.BACKGROUND
+            )
+            # Spread the requests to stay well below the API rate limits
+            await asyncio.sleep(HISTORY_REQUEST_INTERVAL)
+        return result["data"]
@@ -0,0 +1,256 @@
+"""Immutable snapshots of the Remeha Home data."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field, fields, replace
+from functools import cache
+from operator import attrgetter
+import re
+from typing import Any, ClassVar, Self
+
+
+def to_snake_case(name: str) -> str:
+    """Return the model attribute name for a camel case API name."""
+    return re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", name).lower()
+
+
+def to_camel_case(name: str) -> str:
+    """Return the camel case API name for a model attribute name."""
+    first, *rest = name.split("_")
+    return first + "".join(part.capitalize() for part in rest)
+
+
+@cache
+def compile_key_path(key: str) -> Callable[[Any], Any]:
+    """Compile a dotted entity description key into a function returning its value.
+
+    The camel case API names in the key are mapped to the model attributes. The
+    returned function raises AttributeError if the path does not exist.
+    """
+    return attrgetter(".".join(to_snake_case(part) for part in key.split(".")))
+
+
+@cache
+def _api_fields(cls: type[Model]) -> tuple[tuple[str, str, type[Model] | None], ...]:
+    """Return the attribute name, API name and nested model of the fields of a model."""
+    return tuple(
+        (
+            model_field.name,
+            to_camel_case(model_field.name),
+            cls.nested.get(model_field.name),
+        )
+        for model_field in fields(cls)
+    )
+
+
+class Model:
+    """Base class of the snapshot models.
+
+    Models are created from the API responses by mapping the camel case API
+    names to the snake case attributes. Unknown API fields are dropped and
+    missing ones keep their default.
+    """
+
+    __slots__ = ()
+
+    # The models of the fields holding nested objects or lists of objects
+    nested: ClassVar[dict[str, type[Model]]] = {}
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> Self:
+        """Create the model from an API response."""
+        kwargs = {}
+        for name, key, model in _api_fields(cls):
+            if key not in data:
+                continue
+            value = data[key]
+            if model is not None and value is not None:
+                if isinstance(value, list):
+                    value = tuple(model.from_dict(item) for item in value)
+                else:
+                    value = model.from_dict(value)
+            kwargs[name] = value
+        return cls(**kwargs)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the model in the shape of the API response."""
+        data = {}
+        for name, key, model in _api_fields(type(self)):
+            value = getattr(self, name)
+            if model is not None and value is not None:
+                if isinstance(value, tuple):
+                    value = [item.as_dict() for item in value]
+                else:
+                    value = value.as_dict()
+            data[key] = value
+        return data
+
+
+@dataclass(frozen=True, slots=True)
+class ClimateZone(Model):
+    """Snapshot of a climate zone."""
+
+    climate_zone_id: str = ""
+    name: str | None = None
+    zone_mode: str | None = None
+    room_temperature: float | None = None
+    set_point: float | None = None
+    set_point_min: float | None = None
+    set_point_max: float | None = None
+    next_setpoint: float | None = None
+    next_switch_time: str | None = None
+    current_schedule_set_point: float | None = None
+    active_comfort_demand: str | None = None
+    active_heating_climate_time_program_number: int | None = None
+    fire_place_mode_active: bool | None = None
+
+    @property
+    def item_id(self) -> str:
+        """Return the id of the climate zone."""
+        return self.climate_zone_id
+
+
+@dataclass(frozen=True, slots=True)
+class HotWaterZone(Model):
+    """Snapshot of a hot water zone."""
+
+    hot_water_zone_id: str = ""
+    name: str | None = None
+    dhw_zone_mode: str | None = None
+    dhw_status: str | None = None
+    dhw_temperature: float | None = None
+    target_setpoint: float | None = None
+    next_switch_time: str | None = None
+
+    @property
+    def item_id(self) -> str:
+        """Return the id of the hot water zone."""
+        return self.hot_water_zone_id
+
+
+@dataclass(frozen=True, slots=True)
+class OutdoorTemperatureInformation(Model):
+    """Snapshot of the outdoor temperature of an appliance."""
+
+    appliance_outdoor_temperature: float | None = None
+    cloud_outdoor_temperature: float | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class Appliance(Model):
+    """Snapshot of an appliance.
+
+    The zones are not compared, an appliance is unchanged when only its
+    zones changed.
+    """
+
+    nested: ClassVar[dict[str, type[Model]]] = {
+        "outdoor_temperature_information": OutdoorTemperatureInformation,
+        "climate_zones": ClimateZone,
+        "hot_water_zones": HotWaterZone,
+    }
+
+    appliance_id: str = ""
+    appliance_type: str | None = None
+    house_name: str | None = None
+    water_pressure: float | None = None
+    outdoor_temperature_information: OutdoorTemperatureInformation | None = None
+    climate_zones: tuple[ClimateZone, ...] = field(default=(), compare=False)
+    hot_water_zones: tuple[HotWaterZone, ...] = field(default=(), compare=False)
+
+    @property
+    def item_id(self) -> str:
+        """Return the id of the appliance."""
+        return self.appliance_id
+
+
+@dataclass(frozen=True, slots=True)
+class Dashboard(Model):
+    """Snapshot of the dashboard of a home."""
+
+    nested: ClassVar[dict[str, type[Model]]] = {"appliances": Appliance}
+
+    appliances: tuple[Appliance, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class ConsumptionData(Model):
+    """Snapshot of the energy consumption of an appliance for a day."""
+
+    heating_energy_consumed: float = 0.0
+    hot_water_energy_consumed: float = 0.0
+    cooling_energy_consumed: float = 0.0
+    heating_energy_delivered: float = 0.0
+    hot_water_energy_delivered: float = 0.0
+    cooling_energy_delivered: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class ApplianceEnergy(Model):
+    """Snapshot of the energy data of an appliance."""
+
+    nested: ClassVar[dict[str, type[Model]]] = {"consumption_data": ConsumptionData}
+
+    consumption_data: ConsumptionData = ConsumptionData()
+
+
+@dataclass(frozen=True, slots=True)
+class Gateway(Model):
+    """Snapshot of an internet connected gateway."""
+
+    name: str = "Unknown"
+    hardware_version: str = "Unknown"
+    software_version: str = "Unknown"
+
+
+@dataclass(frozen=True, slots=True)
+class TechnicalInfo(Model):
+    """Snapshot of the technical information of an appliance."""
+
+    nested: ClassVar[dict[str, type[Model]]] = {"internet_connected_gateways": Gateway}
+
+    appliance_name: str | None = None
+    internet_connected_gateways: tuple[Gateway, ...] = ()
+
+
+def parse_dashboard(
+    data: Mapping[str, Any], previous_items: Mapping[str, Any]
+) -> Dashboard:
+    """Parse a dashboard response into a snapshot.
+
+    Appliances and zones equal to those in the previous items are reused, so
+    unchanged items keep their identity and are shared between snapshots.
+    """
+    appliances = []
+    for appliance in Dashboard.from_dict(data).appliances:
+        climate_zones = tuple(
+            _reuse(climate_zone, previous_items)
+            for climate_zone in appliance.climate_zones
+        )
+        hot_water_zones = tuple(
+            _reuse(hot_water_zone, previous_items)
+            for hot_water_zone in appliance.hot_water_zones
+        )
+        previous = previous_items.get(appliance.appliance_id)
+        if (
+            previous == appliance
+            and previous.climate_zones == climate_zones
+            and previous.hot_water_zones == hot_water_zones
+        ):
+            appliances.append(previous)
+        else:
+            appliances.append(
+                replace(
+                    appliance,
+                    climate_zones=climate_zones,
+                    hot_water_zones=hot_water_zones,
+                )
+            )
+    return Dashboard(appliances=tuple(appliances))
+
+
+def _reuse(item: ClimateZone | HotWaterZone, previous_items: Mapping[str, Any]):
+    """Return the previous item if it is equal to the item."""
+    previous = previous_items.get(item.item_id)
+    return previous if previous == item else item
@@ -0,0 +1,119 @@
+"""Profiling of the Remeha Home coordinator refresh."""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+from io import StringIO
+import logging
+import pstats
+import time
+import tracemalloc
+
+from aiohttp import ClientError
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from .const import DATA_PROFILE_LOCK, DOMAIN
+from .coordinator import RemehaHomeUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Number of functions listed in the profile summary
+PROFILE_SUMMARY_FUNCTIONS = 40
+
+
+async def async_profile_refresh(
+    hass: HomeAssistant,
+    coordinators: list[RemehaHomeUpdateCoordinator],
+    cycles: int,
+    allocation_sites: int,
+) -> dict[str, str]:
+    """Profile refresh cycles of the coordinators and write the results.
+
+    Each cycle runs the regular update of every coordinator under cProfile and
+    tracemalloc. The cached dashboard is dropped before each cycle, so every
+    cycle requests, decodes and processes the dashboard in full. The profile
+    of the event loop thread also includes the work of other integrations
+    that runs while the refresh waits for the API.
+
+    Returns the paths of the written profile and summary in the config directory.
+    """
+    async with hass.data.setdefault(DATA_PROFILE_LOCK, asyncio.Lock()):
+        name = f"{DOMAIN}_profile_{int(time.time())}"
+        paths = {
+            "profile": hass.config.path(f"{name}.prof"),
+            "summary": hass.config.path(f"{name}.txt"),
+        }
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+
+        profile = cProfile.Profile()
+        cycle_results = []
+        try:
+            baseline = tracemalloc.take_snapshot()
+            for cycle in range(1, cycles + 1):
+                for coordinator in coordinators:
+                    # Profile a full refresh rather than a cache hit
+                    coordinator.api.invalidate_dashboard()
+                    coordinator._dashboard_response = None
+                    start = time.monotonic()
+                    profile.enable()
+                    try:
+                        data = await coordinator._async_update_data()
+                    except (UpdateFailed, ClientError, TimeoutError) as err:
+                        result = f"failed: {err!r}"
+                    else:
+                        result = "ok"
+                    finally:
+                        profile.disable()
+                    cycle_results.append(
+                        f"cycle {cycle} {coordinator.config_entry.entry_id}: "
+                        f"{time.monotonic() - start:.3f} s, {result}"
+                    )
+                    if result == "ok":
+                        coordinator.async_set_updated_data(data)
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+
+        await hass.async_add_executor_job(
+            _write_results,
+            paths,
+            profile,
+            cycle_results,
+            baseline,
+            snapshot,
+            allocation_sites,
+        )
+
+    _LOGGER.info("Wrote refresh profile to %s", paths["summary"])
+    return paths
+
+
+def _write_results(
+    paths: dict[str, str],
+    profile: cProfile.Profile,
+    cycle_results: list[str],
+    baseline: tracemalloc.Snapshot,
+    snapshot: tracemalloc.Snapshot,
+    allocation_sites: int,
+) -> None:
+    """Write the profile and the summary of the profiled refreshes."""
+    profile.dump_stats(paths["profile"])
+    allocations = snapshot.compare_to(baseline, "lineno")[:allocation_sites]
+
+    stats_output = StringIO()
+    stats = pstats.Stats(profile, stream=stats_output)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILE_SUMMARY_FUNCTIONS)
+
+    with open(paths["summary"], "w", encoding="utf-8") as summary:
+        summary.write("Refresh cycles\n")
+        summary.writelines(f"{result}\n" for result in cycle_results)
+        summary.write("\nTop allocation sites\n")
+        summary.writelines(f"{allocation}\n" for allocation in allocations)
+        summary.write("\nProfile by cumulative time\n")
+        summary.write(stats_output.getvalue())
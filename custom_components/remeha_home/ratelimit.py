@@ -0,0 +1,102 @@
+"""Client side rate limiting of the Remeha Home API requests."""
+
+from __future__ import annotations
+
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+import heapq
+import itertools
+import time
+
+import asyncio
+
+
+class RequestPriority(IntEnum):
+    """Priority of a request, lower values are sent first."""
+
+    COMMAND = 0
+    POLL = 1
+    BACKGROUND = 2
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Return the delay in seconds of a Retry-After header value."""
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Token bucket handing out tokens to waiting requests by priority.
+
+    Tokens are added at `rate` per second up to `capacity`. Requests of equal
+    priority are served in arrival order.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Create a full token bucket."""
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._waiters: list[tuple[int, int]] = []
+        self._counter = itertools.count()
+        self._condition = asyncio.Condition()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            self._tokens + (now - self._updated) * self.rate, self.capacity
+        )
+        self._updated = now
+
+    async def async_acquire(
+        self, priority: RequestPriority = RequestPriority.POLL
+    ) -> float:
+        """Wait for a token and return the time spent waiting."""
+        start = time.monotonic()
+        entry = (priority, next(self._counter))
+        async with self._condition:
+            heapq.heappush(self._waiters, entry)
+            self._condition.notify_all()
+            try:
+                while True:
+                    delay = None
+                    if self._waiters[0] == entry:
+                        now = time.monotonic()
+                        self._refill(now)
+                        delay = max(
+                            self._paused_until - now,
+                            (1 - self._tokens) / self.rate,
+                            0.0,
+                        )
+                        if delay == 0.0:
+                            heapq.heappop(self._waiters)
+                            self._tokens -= 1
+                            return time.monotonic() - start
+
+                    try:
+                        async with asyncio.timeout(delay):
+                            await self._condition.wait()
+                    except TimeoutError:
+                        pass
+            finally:
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                self._condition.notify_all()
+
+    async def async_pause(self, delay: float) -> None:
+        """Hand out no tokens for the next `delay` seconds."""
+        async with self._condition:
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+            self._condition.notify_all()
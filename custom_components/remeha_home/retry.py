@@ -0,0 +1,86 @@
+"""Retry policy and circuit breaker for the Remeha Home API requests."""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+
+from aiohttp import ClientError
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Return the delay before retry `attempt`, exponential with jitter."""
+    delay = min(cap, base * 2 ** (attempt - 1))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class CircuitOpenError(ClientError):
+    """Error to indicate that requests to a host fail fast during an outage."""
+
+
+class CircuitBreaker:
+    """Circuit breaker for the requests to a single host.
+
+    The circuit opens after `failure_threshold` consecutive failed requests,
+    during which requests fail immediately. After `reset_timeout` seconds
+    requests are let through again, the first result decides whether the
+    circuit closes or opens again.
+    """
+
+    def __init__(self, host: str, failure_threshold: int, reset_timeout: float) -> None:
+        """Create a closed circuit breaker for a host."""
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.trips = 0
+        self._opened_at = 0.0
+
+    def check(self) -> None:
+        """Raise CircuitOpenError if requests to the host should fail fast."""
+        if self.state != "open":
+            return
+
+        remaining = self._opened_at + self.reset_timeout - time.monotonic()
+        if remaining > 0:
+            raise CircuitOpenError(
+                f"Requests to {self.host} are suspended for {remaining:.0f} seconds"
+            )
+
+        self.state = "half_open"
+
+    def record_success(self) -> None:
+        """Record a request the host responded to."""
+        if self.state != "closed":
+            _LOGGER.info("Requests to %s succeed again, closing circuit", self.host)
+        self.state = "closed"
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit when the host is down."""
+        self.failures += 1
+        if self.state == "half_open" or (
+            self.state == "closed" and self.failures >= self.failure_threshold
+        ):
+            _LOGGER.warning(
+                "%s requests to %s failed, suspending requests for %s seconds",
+                self.failures,
+                self.host,
+                self.reset_timeout,
+            )
+            self.state = "open"
+            self.trips += 1
+            self._opened_at = time.monotonic()
+
+    def as_dict(self) -> dict:
+        """Return the state of the circuit breaker for diagnostics."""
+        return {
+            "host": self.host,
+            "state": self.state,
+            "failures": self.failures,
+            "trips": self.trips,
+        }
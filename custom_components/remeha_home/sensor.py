@@ -1,60 +1,159 @@
 """Platform for sensor integration."""
 
 from __future__ import annotations
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, tzinfo
+from functools import lru_cache
 import logging
 
-
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
+    SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 import homeassistant.util.dt as dt_util
 
 from .const import (
+    APPLIANCE_ENERGY_SENSOR_TYPES,
     APPLIANCE_SENSOR_TYPES,
     CLIMATE_ZONE_SENSOR_TYPES,
     DOMAIN,
+    HEALTH_SENSOR_UPDATE_INTERVAL,
     HOT_WATER_ZONE_SENSOR_TYPES,
 )
-from .coordinator import RemehaHomeUpdateCoordinator
+from .coordinator import (
+    RemehaHomeEnergyUpdateCoordinator,
+    RemehaHomeUpdateCoordinator,
+)
+from .models import compile_key_path
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, kw_only=True)
+class RemehaHomeHealthSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor reporting the health of the integration."""
+
+    value_fn: Callable[[RemehaHomeUpdateCoordinator], StateType]
+
+
+def _data_age(coordinator: RemehaHomeUpdateCoordinator) -> float | None:
+    """Return the time in seconds since the dashboard was last refreshed."""
+    if coordinator.last_update_success_time is None:
+        return None
+    return round(
+        (dt_util.utcnow() - coordinator.last_update_success_time).total_seconds()
+    )
+
+
+HEALTH_SENSOR_TYPES = [
+    RemehaHomeHealthSensorEntityDescription(
+        key="last_refresh_duration",
+        name="Last Refresh Duration",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        value_fn=lambda coordinator: (
+            round(coordinator.last_refresh_duration, 3)
+            if coordinator.last_refresh_duration is not None
+            else None
+        ),
+    ),
+    RemehaHomeHealthSensorEntityDescription(
+        key="dashboard_latency",
+        name="Dashboard API Latency",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        value_fn=lambda coordinator: (
+            round(latency, 3)
+            if (latency := coordinator.api.latency["dashboard"].last) is not None
+            else None
+        ),
+    ),
+    RemehaHomeHealthSensorEntityDescription(
+        key="requests_per_hour",
+        name="Requests per Hour",
+        native_unit_of_measurement="requests/h",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.api.requests_last_hour(),
+    ),
+    RemehaHomeHealthSensorEntityDescription(
+        key="consecutive_failures",
+        name="Consecutive Failures",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.consecutive_failures,
+    ),
+    RemehaHomeHealthSensorEntityDescription(
+        key="data_age",
+        name="Data Age",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=_data_age,
+    ),
+]
+
+
+@lru_cache(maxsize=256)
+def parse_timestamp(value: str, time_zone: tzinfo) -> datetime | None:
+    """Parse a dashboard timestamp, which is in local time despite its UTC designator."""
+    if (parsed := dt_util.parse_datetime(value)) is None:
+        return None
+    return parsed.replace(tzinfo=time_zone)
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up the Remeha Home sensor entities from a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    energy_coordinator = hass.data[DOMAIN][entry.entry_id]["energy_coordinator"]
 
     entities = []
-    for appliance in coordinator.data["appliances"]:
-        appliance_id = appliance["applianceId"]
+    for appliance in coordinator.data.appliances:
+        appliance_id = appliance.appliance_id
         for entity_description in APPLIANCE_SENSOR_TYPES:
             entities.append(
                 RemehaHomeSensor(coordinator, appliance_id, entity_description)
             )
+        for entity_description in APPLIANCE_ENERGY_SENSOR_TYPES:
+            entities.append(
+                RemehaHomeSensor(energy_coordinator, appliance_id, entity_description)
+            )
 
-        for climate_zone in appliance["climateZones"]:
-            climate_zone_id = climate_zone["climateZoneId"]
+        for climate_zone in appliance.climate_zones:
+            climate_zone_id = climate_zone.climate_zone_id
             for entity_description in CLIMATE_ZONE_SENSOR_TYPES:
                 entities.append(
                     RemehaHomeSensor(coordinator, climate_zone_id, entity_description)
                 )
 
-        for hot_water_zone in appliance["hotWaterZones"]:
-            hot_water_zone_id = hot_water_zone["hotWaterZoneId"]
+        for hot_water_zone in appliance.hot_water_zones:
+            hot_water_zone_id = hot_water_zone.hot_water_zone_id
             for entity_description in HOT_WATER_ZONE_SENSOR_TYPES:
                 entities.append(
                     RemehaHomeSensor(coordinator, hot_water_zone_id, entity_description)
                 )
 
+    for entity_description in HEALTH_SENSOR_TYPES:
+        entities.append(
+            RemehaHomeHealthSensor(coordinator, entry.entry_id, entity_description)
+        )
+
     async_add_entities(entities)
 
 
@@ -65,15 +164,19 @@ class RemehaHomeSensor(CoordinatorEntity, SensorEntity):
 
     def __init__(
         self,
-        coordinator: RemehaHomeUpdateCoordinator,
+        coordinator: RemehaHomeUpdateCoordinator | RemehaHomeEnergyUpdateCoordinator,
         item_id: str,
         entity_description: SensorEntityDescription,
     ) -> None:
         """Create a Remeha Home sensor entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=item_id)
         self.entity_description = entity_description
         self.item_id = item_id
         self._attr_unique_id = "_".join([DOMAIN, self.item_id, entity_description.key])
+        self._get_value = compile_key_path(entity_description.key)
+        self._is_timestamp = (
+            entity_description.device_class == SensorDeviceClass.TIMESTAMP
+        )
 
     @property
     def _data(self):
@@ -83,21 +186,19 @@ class RemehaHomeSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self):
         """Return the measurement value for this sensor."""
-        data = self._data
-        for part in self.entity_description.key.split("."):
+        # Consumption data is not available until the first energy refresh
+        if (data := self._data) is None:
+            return None
+
+        try:
+            value = self._get_value(data)
+        except AttributeError:
             # If the key is missing for some reason, don't crash, instead return None
-            if part not in data:
-                _LOGGER.warning(
-                    "Key not found in data: %s", self.entity_description.key
-                )
-                return None
-            data = data[part]
-        value = data
+            _LOGGER.warning("Key not found in data: %s", self.entity_description.key)
+            return None
 
-        if self.entity_description.device_class == SensorDeviceClass.TIMESTAMP:
-            return dt_util.parse_datetime(value).replace(
-                tzinfo=dt_util.DEFAULT_TIME_ZONE
-            )
+        if self._is_timestamp and value is not None:
+            return parse_timestamp(value, dt_util.DEFAULT_TIME_ZONE)
 
         return value
 
@@ -105,3 +206,50 @@ class RemehaHomeSensor(CoordinatorEntity, SensorEntity):
     def device_info(self) -> DeviceInfo:
         """Return device info for this device."""
         return self.coordinator.get_device_info(self.item_id)
+
+
+class RemehaHomeHealthSensor(SensorEntity):
+    """Representation of a sensor reporting the health of the integration.
+
+    The state is written at a fixed interval rather than on every refresh, to
+    limit the load on the recorder.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        coordinator: RemehaHomeUpdateCoordinator,
+        entry_id: str,
+        entity_description: RemehaHomeHealthSensorEntityDescription,
+    ) -> None:
+        """Create a Remeha Home health sensor entity."""
+        self.coordinator = coordinator
+        self.entity_description = entity_description
+        self._attr_unique_id = "_".join([DOMAIN, entry_id, entity_description.key])
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            name="Remeha Home",
+            manufacturer="Remeha",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Write the state at the health sensor update interval."""
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass, self._async_write_state, HEALTH_SENSOR_UPDATE_INTERVAL
+            )
+        )
+
+    @callback
+    def _async_write_state(self, _now: datetime) -> None:
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the value of the health measurement."""
+        return self.entity_description.value_fn(self.coordinator)
@@ -0,0 +1,225 @@
+"""Services for the Remeha Home integration."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from aiohttp import ClientError
+import voluptuous as vol
+
+from homeassistant.components.climate import ATTR_HVAC_MODE, HVACMode
+from homeassistant.const import ATTR_ENTITY_ID, ATTR_TEMPERATURE
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.auth.permissions.const import POLICY_CONTROL
+from homeassistant.exceptions import HomeAssistantError, Unauthorized, UnknownUser
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers import entity_registry as er
+import homeassistant.util.dt as dt_util
+
+from .climate import async_send_zone_command
+from .const import COMMAND_MAX_PARALLEL_ZONES, DOMAIN
+from .coordinator import RemehaHomeUpdateCoordinator
+from .models import ClimateZone
+from .profiler import async_profile_refresh
+
+SERVICE_IMPORT_ENERGY_HISTORY = "import_energy_history"
+SERVICE_PROFILE_REFRESH = "profile_refresh"
+SERVICE_SET_ZONES = "set_zones"
+
+ATTR_START_DATE = "start_date"
+ATTR_CYCLES = "cycles"
+ATTR_ALLOCATION_SITES = "allocation_sites"
+ATTR_ZONES = "zones"
+
+IMPORT_ENERGY_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_START_DATE): cv.date,
+    }
+)
+
+PROFILE_REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CYCLES, default=3): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=20)
+        ),
+        vol.Optional(ATTR_ALLOCATION_SITES, default=25): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=500)
+        ),
+    }
+)
+
+SET_ZONES_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ZONES): vol.All(
+            cv.ensure_list,
+            [
+                vol.All(
+                    {
+                        vol.Required(ATTR_ENTITY_ID): cv.entity_id,
+                        vol.Optional(ATTR_HVAC_MODE): vol.All(
+                            vol.Coerce(HVACMode),
+                            vol.In(
+                                [
+                                    HVACMode.AUTO,
+                                    HVACMode.HEAT,
+                                    HVACMode.HEAT_COOL,
+                                    HVACMode.OFF,
+                                ]
+                            ),
+                        ),
+                        vol.Optional(ATTR_TEMPERATURE): vol.Coerce(float),
+                    },
+                    cv.has_at_least_one_key(ATTR_HVAC_MODE, ATTR_TEMPERATURE),
+                )
+            ],
+        ),
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Remeha Home services."""
+
+    async def async_import_energy_history(call: ServiceCall) -> None:
+        """Import the energy consumption history of all appliances in the background."""
+        start = call.data.get(ATTR_START_DATE)
+        if start is not None:
+            start = dt_util.start_of_local_day(start)
+
+        for entry_id, entry_data in hass.data[DOMAIN].items():
+            entry = hass.config_entries.async_get_entry(entry_id)
+            entry.async_create_background_task(
+                hass,
+                entry_data["energy_history"].async_import(
+                    entry_data["coordinator"].data.appliances, start
+                ),
+                f"{DOMAIN} import energy history",
+            )
+
+    async def async_profile_refresh_service(call: ServiceCall) -> ServiceResponse:
+        """Profile refresh cycles and write the results to the config directory."""
+        # Only administrators may profile, async_register_admin_service does
+        # not support service responses
+        if call.context.user_id:
+            user = await hass.auth.async_get_user(call.context.user_id)
+            if user is None:
+                raise UnknownUser(context=call.context, permission=POLICY_CONTROL)
+            if not user.is_admin:
+                raise Unauthorized(context=call.context)
+
+        return await async_profile_refresh(
+            hass,
+            [entry_data["coordinator"] for entry_data in hass.data[DOMAIN].values()],
+            call.data[ATTR_CYCLES],
+            call.data[ATTR_ALLOCATION_SITES],
+        )
+
+    async def async_set_zones(call: ServiceCall) -> ServiceResponse:
+        """Set the mode and temperature of several climate zones at once."""
+        semaphore = asyncio.Semaphore(COMMAND_MAX_PARALLEL_ZONES)
+        coordinators: set[RemehaHomeUpdateCoordinator] = set()
+
+        async def async_set_zone(zone: dict[str, Any]) -> dict[str, Any]:
+            async with semaphore:
+                try:
+                    await _async_set_zone(hass, zone, coordinators)
+                except (HomeAssistantError, ClientError, TimeoutError) as err:
+                    return {"success": False, "error": str(err) or repr(err)}
+            return {"success": True}
+
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [
+                task_group.create_task(async_set_zone(zone))
+                for zone in call.data[ATTR_ZONES]
+            ]
+        # Confirm the commands of all zones with a single refresh
+        for coordinator in coordinators:
+            await coordinator.async_request_refresh()
+
+        response = {
+            zone[ATTR_ENTITY_ID]: task.result()
+            for zone, task in zip(call.data[ATTR_ZONES], tasks)
+        }
+        if not call.return_response and (
+            failed := [
+                entity_id
+                for entity_id, result in response.items()
+                if not result["success"]
+            ]
+        ):
+            raise HomeAssistantError(f"Failed to set zones: {', '.join(failed)}")
+
+        return {ATTR_ZONES: response}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_ENERGY_HISTORY,
+        async_import_energy_history,
+        schema=IMPORT_ENERGY_HISTORY_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE_REFRESH,
+        async_profile_refresh_service,
+        schema=PROFILE_REFRESH_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_ZONES,
+        async_set_zones,
+        schema=SET_ZONES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+async def _async_set_zone(
+    hass: HomeAssistant,
+    zone: dict[str, Any],
+    coordinators: set[RemehaHomeUpdateCoordinator],
+) -> None:
+    """Send the commands for a single zone of the set_zones service.
+
+    Behaves like the climate entity of the zone. The result is patched into
+    the coordinator, which is added to coordinators before any command is
+    sent so the caller can confirm the commands with a single refresh.
+    """
+    entity_id = zone[ATTR_ENTITY_ID]
+    entity_entry = er.async_get(hass).async_get(entity_id)
+    if (
+        entity_entry is None
+        or entity_entry.platform != DOMAIN
+        or entity_entry.config_entry_id not in hass.data[DOMAIN]
+    ):
+        raise HomeAssistantError(f"{entity_id} is not a Remeha Home climate zone")
+
+    entry_data = hass.data[DOMAIN][entity_entry.config_entry_id]
+    coordinator = entry_data["coordinator"]
+    climate_zone_id = entity_entry.unique_id.removeprefix(f"{DOMAIN}_")
+    climate_zone = coordinator.get_by_id(climate_zone_id)
+    if not isinstance(climate_zone, ClimateZone):
+        raise HomeAssistantError(f"{entity_id} is not a Remeha Home climate zone")
+
+    appliance = coordinator.get_appliance(climate_zone_id)
+    if appliance is None or appliance.appliance_type is None:
+        appliance_type = "Boiler"
+    else:
+        appliance_type = appliance.appliance_type
+
+    coordinators.add(coordinator)
+    changes = await async_send_zone_command(
+        entry_data["api"],
+        climate_zone,
+        appliance_type,
+        zone.get(ATTR_HVAC_MODE),
+        zone.get(ATTR_TEMPERATURE),
+    )
+    coordinator.async_patch_item(climate_zone_id, changes, confirm=False)
@@ -0,0 +1,67 @@
+"""Dedicated HTTP session for the Remeha Home API."""
+
+from __future__ import annotations
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector, TraceConfig
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.ssl import get_default_context
+
+from .const import (
+    CONNECTION_KEEPALIVE_TIMEOUT,
+    CONNECTION_LIMIT_PER_HOST,
+    DNS_CACHE_TTL,
+    REQUEST_DEADLINE,
+    REQUEST_TIMEOUT,
+)
+
+
+class ConnectionStats(TraceConfig):
+    """Trace config counting the connections created and reused by a session."""
+
+    def __init__(self) -> None:
+        """Create the trace config with all counts at zero."""
+        super().__init__()
+        self.counts = {
+            "connections_created": 0,
+            "connections_reused": 0,
+            "dns_cache_hits": 0,
+            "dns_cache_misses": 0,
+        }
+        self.on_connection_create_end.append(self._counter("connections_created"))
+        self.on_connection_reuseconn.append(self._counter("connections_reused"))
+        self.on_dns_cache_hit.append(self._counter("dns_cache_hits"))
+        self.on_dns_cache_miss.append(self._counter("dns_cache_misses"))
+
+    def _counter(self, key: str):
+        async def _async_count(_session, _context, _params) -> None:
+            self.counts[key] += 1
+
+        return _async_count
+
+
+@callback
+def async_create_api_session(
+    hass: HomeAssistant,
+) -> tuple[ClientSession, ConnectionStats]:
+    """Create a session tuned for polling the API, with its connection stats.
+
+    Connections are kept alive between polls, so a poll reuses the TLS
+    connection of the previous one. The caller is responsible for closing
+    the session. aiohttp negotiates the gzip and brotli content encodings.
+    Requests time out by default, so a stalled connection never blocks.
+    """
+    connection_stats = ConnectionStats()
+    connector = TCPConnector(
+        ssl=get_default_context(),
+        limit_per_host=CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout=CONNECTION_KEEPALIVE_TIMEOUT,
+        use_dns_cache=True,
+        ttl_dns_cache=DNS_CACHE_TTL,
+    )
+    session = ClientSession(
+        connector=connector,
+        timeout=ClientTimeout(total=REQUEST_DEADLINE, sock_connect=REQUEST_TIMEOUT),
+        trace_configs=[connection_stats],
+    )
+    return session, connection_stats
@@ -0,0 +1,46 @@
+"""Rolling performance statistics for the Remeha Home diagnostics."""
+
+from __future__ import annotations
+
+from collections import deque
+import math
+
+
+def _percentile(samples: list[float], percentile: float) -> float:
+    """Return the nearest rank percentile of sorted samples."""
+    rank = math.ceil(percentile / 100 * len(samples))
+    return samples[max(rank, 1) - 1]
+
+
+class RollingStats:
+    """Distribution of the most recent samples of a measurement.
+
+    Only the last `window` samples are kept, so the percentiles follow the
+    current behaviour of the API rather than its average since startup.
+    """
+
+    def __init__(self, window: int) -> None:
+        """Create the statistics without samples."""
+        self.count = 0
+        self.last: float | None = None
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def add(self, value: float) -> None:
+        """Record a sample."""
+        self.count += 1
+        self.last = value
+        self._samples.append(value)
+
+    def as_dict(self, digits: int = 3) -> dict:
+        """Return the statistics for diagnostics."""
+        if not self._samples:
+            return {"count": self.count}
+
+        samples = sorted(self._samples)
+        return {
+            "count": self.count,
+            "p50": round(_percentile(samples, 50), digits),
+            "p95": round(_percentile(samples, 95), digits),
+            "p99": round(_percentile(samples, 99), digits),
+            "max": round(samples[-1], digits),
+        }
@@ -18,6 +18,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .api import RemehaHomeAPI
 from .const import DOMAIN
 from .coordinator import RemehaHomeUpdateCoordinator
+from .models import compile_key_path, to_snake_case
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,9 +31,9 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
 
     entities = []
-    for appliance in coordinator.data["appliances"]:
-        for climate_zone in appliance["climateZones"]:
-            climate_zone_id = climate_zone["climateZoneId"]
+    for appliance in coordinator.data.appliances:
+        for climate_zone in appliance.climate_zones:
+            climate_zone_id = climate_zone.climate_zone_id
 
             entities.append(
                 RemehaHomeFireplaceModeSwitch(api, coordinator, climate_zone_id)
@@ -54,7 +55,7 @@ class RemehaHomeSwitch(CoordinatorEntity, SwitchEntity):
         entity_description: SwitchEntityDescription,
     ) -> None:
         """Create a Remeha Home switch entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=climate_zone_id)
         self.api = api
         self.climate_zone_id = climate_zone_id
         self.entity_description = entity_description
@@ -62,6 +63,7 @@ class RemehaHomeSwitch(CoordinatorEntity, SwitchEntity):
         self._attr_unique_id = "_".join(
             [DOMAIN, self.climate_zone_id, entity_description.key]
         )
+        self._get_value = compile_key_path(entity_description.key)
 
     @property
     def _data(self):
@@ -71,7 +73,7 @@ class RemehaHomeSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def is_on(self) -> bool:
         """Return the state of this switch."""
-        return self._data[self.entity_description.key]
+        return self._get_value(self._data)
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -111,10 +113,14 @@ class RemehaHomeFireplaceModeSwitch(RemehaHomeSwitch):
         """Turn the entity on."""
         _LOGGER.debug("Enable fireplace mode")
         await self.api.async_set_fireplace_mode(self.climate_zone_id, True)
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_patch_item(
+            self.climate_zone_id, {to_snake_case(self.entity_description.key): True}
+        )
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
         _LOGGER.debug("Disable fireplace mode")
         await self.api.async_set_fireplace_mode(self.climate_zone_id, False)
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_patch_item(
+            self.climate_zone_id, {to_snake_case(self.entity_description.key): False}
+        )
@@ -0,0 +1 @@
+"""Development tools for the Remeha Home integration."""
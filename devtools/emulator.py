@@ -0,0 +1,394 @@
+"""Local stand-in for the Remeha Home cloud.
+
+Implements the endpoints from documentation/api.md and the B2C login flow used
+by `RemehaHomeOAuth2Implementation`, with configurable latency and error
+injection. Run it with:
+
+    python -m devtools.emulator --appliances 10 --climate-zones 2 --latency 0.2
+
+and point Home Assistant at it from configuration.yaml:
+
+    remeha_home:
+      api_base_url: http://localhost:8080/Mobile/api
+      login_base_url: http://localhost:8080
+
+Use `localhost` rather than an IP address, the shared aiohttp cookie jar does
+not store cookies for IP addresses and the login flow needs its CSRF cookie.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+from dataclasses import dataclass, field
+from datetime import datetime
+import hashlib
+import json
+import logging
+import random
+import secrets
+import time
+from urllib.parse import urlencode
+
+from aiohttp import web
+
+from .synthetic import (
+    generate_consumption,
+    generate_dashboard,
+    generate_technical_details,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+API_PREFIX = "/Mobile/api"
+B2C_PREFIX = "/bdrb2cprod.onmicrosoft.com"
+B2C_POLICY = "B2C_1A_RPSignUpSignInNewRoomv3.1"
+SUBSCRIPTION_KEY = "df605c5470d846fc91e848b1cc653ddf"
+REDIRECT_URI = "com.b2c.remehaapp://login-callback"
+
+
+@dataclass
+class EmulatorConfig:
+    """Behaviour of the emulated cloud."""
+
+    appliances: int = 1
+    climate_zones: int = 1
+    hot_water_zones: int = 1
+    seed: int | None = 0
+    # Mean added latency and uniform jitter in seconds
+    latency: float = 0.0
+    jitter: float = 0.0
+    # Probability that a request is answered with one of the error statuses
+    error_rate: float = 0.0
+    error_statuses: list[int] = field(default_factory=lambda: [429, 500, 502, 503])
+    # Probability that a request hangs for `timeout_delay` seconds
+    timeout_rate: float = 0.0
+    timeout_delay: float = 60.0
+    retry_after: int = 5
+    token_lifetime: int = 3600
+    email: str | None = None
+    password: str | None = None
+
+
+class RemehaCloudEmulator:
+    """aiohttp application emulating the Remeha Home cloud."""
+
+    def __init__(self, config: EmulatorConfig | None = None) -> None:
+        """Create an emulator with a freshly generated home."""
+        self.config = config or EmulatorConfig()
+        self.dashboard = generate_dashboard(
+            self.config.appliances,
+            self.config.climate_zones,
+            self.config.hot_water_zones,
+            self.config.seed,
+        )
+        self.request_counts: dict[str, int] = {}
+        self._rng = random.Random(self.config.seed)
+        self._access_tokens: dict[str, float] = {}
+        self._refresh_tokens: set[str] = set()
+        self._login_transactions: dict[str, str] = {}
+        self._authorization_codes: dict[str, str] = {}
+        self._runner: web.AppRunner | None = None
+
+        self.app = web.Application(middlewares=[self._middleware])
+        self.app.add_routes(
+            [
+                web.get(f"{API_PREFIX}/homes/dashboard", self._dashboard),
+                web.get(
+                    f"{API_PREFIX}/appliances/{{appliance_id}}/technicaldetails",
+                    self._technical_details,
+                ),
+                web.get(
+                    f"{API_PREFIX}/appliances/{{appliance_id}}/energyconsumption/{{interval:daily|monthly|yearly}}",
+                    self._energy_consumption,
+                ),
+                web.post(
+                    f"{API_PREFIX}/climate-zones/{{zone_id}}/modes/{{mode}}",
+                    self._climate_zone_mode,
+                ),
+                web.post(
+                    f"{API_PREFIX}/climate-zones/{{zone_id}}/time-programs/heating/{{program:\\d+}}/activate",
+                    self._climate_zone_time_program,
+                ),
+                web.post(
+                    f"{API_PREFIX}/hot-water-zones/{{zone_id}}/modes/{{mode}}",
+                    self._hot_water_zone_mode,
+                ),
+                web.post(
+                    f"{API_PREFIX}/hot-water-zones/{{zone_id}}/{{setpoint:reduced-setpoint|comfort-setpoint}}",
+                    self._hot_water_zone_setpoint,
+                ),
+                web.get(f"{B2C_PREFIX}/oauth2/v2.0/authorize", self._authorize),
+                web.post(
+                    f"{B2C_PREFIX}/{B2C_POLICY}/SelfAsserted", self._self_asserted
+                ),
+                web.get(
+                    f"{B2C_PREFIX}/{B2C_POLICY}/api/CombinedSigninAndSignup/confirmed",
+                    self._confirmed,
+                ),
+                web.post(f"{B2C_PREFIX}/oauth2/v2.0/token", self._token),
+            ]
+        )
+
+    async def async_start(self, host: str = "localhost", port: int = 8080) -> str:
+        """Start serving and return the base url of the emulator."""
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        # Resolve the actual port when an ephemeral port was requested
+        port = self._runner.addresses[0][1]
+        return f"http://{host}:{port}"
+
+    async def async_stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        """Count requests and apply the configured latency and errors."""
+        route = request.match_info.route.resource
+        name = route.canonical if route is not None else request.path
+        self.request_counts[name] = self.request_counts.get(name, 0) + 1
+
+        config = self.config
+        delay = config.latency + self._rng.uniform(-config.jitter, config.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if self._rng.random() < config.timeout_rate:
+            await asyncio.sleep(config.timeout_delay)
+
+        if self._rng.random() < config.error_rate:
+            status = self._rng.choice(config.error_statuses)
+            headers = {}
+            if status == 429:
+                headers["Retry-After"] = str(config.retry_after)
+            if status == 401:
+                # Revoke all access tokens so the client has to refresh
+                self._access_tokens.clear()
+            return web.Response(
+                status=status, headers=headers, text=f"Injected {status}"
+            )
+
+        if request.path.startswith(API_PREFIX):
+            if request.headers.get("Ocp-Apim-Subscription-Key") != SUBSCRIPTION_KEY:
+                return web.Response(status=401, text="Missing subscription key")
+            authorization = request.headers.get("Authorization", "")
+            token = authorization.removeprefix("Bearer ")
+            if self._access_tokens.get(token, 0) < time.time():
+                return web.Response(status=401, text="Invalid or expired token")
+
+        return await handler(request)
+
+    def _find_appliance(self, appliance_id: str) -> dict:
+        for appliance in self.dashboard["appliances"]:
+            if appliance["applianceId"] == appliance_id:
+                return appliance
+        raise web.HTTPNotFound
+
+    def _find_zone(self, key: str, id_key: str, zone_id: str) -> dict:
+        for appliance in self.dashboard["appliances"]:
+            for zone in appliance[key]:
+                if zone[id_key] == zone_id:
+                    return zone
+        raise web.HTTPNotFound
+
+    async def _dashboard(self, request: web.Request) -> web.Response:
+        return web.json_response(self.dashboard)
+
+    async def _technical_details(self, request: web.Request) -> web.Response:
+        appliance = self._find_appliance(request.match_info["appliance_id"])
+        return web.json_response(generate_technical_details(appliance))
+
+    async def _energy_consumption(self, request: web.Request) -> web.Response:
+        appliance = self._find_appliance(request.match_info["appliance_id"])
+        try:
+            start = datetime.fromisoformat(request.query["startDate"].rstrip("Z"))
+            end = datetime.fromisoformat(request.query["endDate"].rstrip("Z"))
+        except (KeyError, ValueError) as err:
+            raise web.HTTPBadRequest(text="Invalid startDate or endDate") from err
+        return web.json_response(
+            generate_consumption(
+                appliance["applianceId"], start, end, request.match_info["interval"]
+            )
+        )
+
+    async def _climate_zone_mode(self, request: web.Request) -> web.Response:
+        zone = self._find_zone(
+            "climateZones", "climateZoneId", request.match_info["zone_id"]
+        )
+        body = await request.json() if request.can_read_body else {}
+        mode = request.match_info["mode"]
+        if mode == "manual":
+            zone["zoneMode"] = "Manual"
+            zone["setPoint"] = body["roomTemperatureSetPoint"]
+        elif mode == "temporary-override":
+            zone["zoneMode"] = "TemporaryOverride"
+            zone["setPoint"] = body["roomTemperatureSetPoint"]
+        elif mode == "schedule":
+            zone["zoneMode"] = "Scheduling"
+            zone["setPoint"] = zone["currentScheduleSetPoint"]
+        elif mode == "anti-frost":
+            zone["zoneMode"] = "FrostProtection"
+        elif mode == "fireplacemode":
+            zone["firePlaceModeActive"] = body["fireplaceModeActive"]
+        else:
+            raise web.HTTPNotFound
+        return web.Response()
+
+    async def _climate_zone_time_program(self, request: web.Request) -> web.Response:
+        zone = self._find_zone(
+            "climateZones", "climateZoneId", request.match_info["zone_id"]
+        )
+        zone["activeHeatingClimateTimeProgramNumber"] = int(
+            request.match_info["program"]
+        )
+        return web.Response()
+
+    async def _hot_water_zone_mode(self, request: web.Request) -> web.Response:
+        zone = self._find_zone(
+            "hotWaterZones", "hotWaterZoneId", request.match_info["zone_id"]
+        )
+        modes = {
+            "anti-frost": "Off",
+            "schedule": "Schedule",
+            "continuous-comfort": "ContinuousComfort",
+        }
+        if request.match_info["mode"] not in modes:
+            raise web.HTTPNotFound
+        zone["dhwZoneMode"] = modes[request.match_info["mode"]]
+        return web.Response()
+
+    async def _hot_water_zone_setpoint(self, request: web.Request) -> web.Response:
+        zone = self._find_zone(
+            "hotWaterZones", "hotWaterZoneId", request.match_info["zone_id"]
+        )
+        body = await request.json()
+        if request.match_info["setpoint"] == "reduced-setpoint":
+            zone["reducedSetpoint"] = body["reducedSetpoint"]
+        else:
+            zone["comfortSetPoint"] = body["comfortSetpoint"]
+        return web.Response()
+
+    async def _authorize(self, request: web.Request) -> web.Response:
+        request_id = secrets.token_hex(16)
+        self._login_transactions[request_id] = request.query.get("code_challenge", "")
+        response = web.Response(text="<html>Sign in</html>", content_type="text/html")
+        response.headers["x-request-id"] = request_id
+        response.set_cookie("x-ms-cpim-csrf", secrets.token_urlsafe(16))
+        return response
+
+    def _transaction_id(self, request: web.Request) -> str:
+        state_properties = request.query.get("tx", "").removeprefix("StateProperties=")
+        padding = "=" * (-len(state_properties) % 4)
+        try:
+            state = json.loads(base64.urlsafe_b64decode(state_properties + padding))
+        except ValueError as err:
+            raise web.HTTPBadRequest(text="Invalid state properties") from err
+        if state.get("TID") not in self._login_transactions:
+            raise web.HTTPBadRequest(text="Unknown transaction")
+        return state["TID"]
+
+    async def _self_asserted(self, request: web.Request) -> web.Response:
+        self._transaction_id(request)
+        if request.headers.get("x-csrf-token") != request.cookies.get("x-ms-cpim-csrf"):
+            return web.Response(status=403, text="CSRF token mismatch")
+
+        form = await request.post()
+        config = self.config
+        accepted = (
+            config.email is None or form.get("signInName") == config.email
+        ) and (config.password is None or form.get("password") == config.password)
+        # Like the real B2C endpoint this answers 200 with the status in the body
+        return web.Response(
+            text=json.dumps({"status": "200" if accepted else "400"}),
+            content_type="text/json",
+        )
+
+    async def _confirmed(self, request: web.Request) -> web.Response:
+        transaction_id = self._transaction_id(request)
+        code = secrets.token_urlsafe(32)
+        self._authorization_codes[code] = self._login_transactions.pop(transaction_id)
+        raise web.HTTPFound(f"{REDIRECT_URI}?{urlencode({'code': code})}")
+
+    async def _token(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        grant_type = form.get("grant_type")
+        if grant_type == "authorization_code":
+            code_challenge = self._authorization_codes.pop(form.get("code", ""), None)
+            verifier_digest = (
+                base64.urlsafe_b64encode(
+                    hashlib.sha256(form.get("code_verifier", "").encode()).digest()
+                )
+                .decode("ascii")
+                .rstrip("=")
+            )
+            if code_challenge is None or code_challenge != verifier_digest:
+                return self._token_error("Invalid authorization code")
+        elif grant_type == "refresh_token":
+            refresh_token = form.get("refresh_token")
+            if refresh_token not in self._refresh_tokens:
+                return self._token_error("Invalid refresh token")
+            self._refresh_tokens.discard(refresh_token)
+        else:
+            return self._token_error("Unsupported grant type")
+
+        access_token = secrets.token_urlsafe(32)
+        refresh_token = secrets.token_urlsafe(32)
+        self._access_tokens[access_token] = time.time() + self.config.token_lifetime
+        self._refresh_tokens.add(refresh_token)
+        return web.json_response(
+            {
+                "access_token": access_token,
+                "refresh_token": refresh_token,
+                "token_type": "Bearer",
+                "expires_in": self.config.token_lifetime,
+            }
+        )
+
+    @staticmethod
+    def _token_error(description: str) -> web.Response:
+        return web.json_response(
+            {"error": "invalid_grant", "error_description": description}, status=400
+        )
+
+
+def main() -> None:
+    """Run the emulator from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--appliances", type=int, default=1)
+    parser.add_argument("--climate-zones", type=int, default=1)
+    parser.add_argument("--hot-water-zones", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--error-statuses",
+        type=lambda value: [int(status) for status in value.split(",")],
+        default=[429, 500, 502, 503],
+    )
+    parser.add_argument("--timeout-rate", type=float, default=0.0)
+    parser.add_argument("--timeout-delay", type=float, default=60.0)
+    parser.add_argument("--retry-after", type=int, default=5)
+    parser.add_argument("--token-lifetime", type=int, default=3600)
+    parser.add_argument("--email")
+    parser.add_argument("--password")
+    args = vars(parser.parse_args())
+
+    host = args.pop("host")
+    port = args.pop("port")
+    emulator = RemehaCloudEmulator(EmulatorConfig(**args))
+
+    logging.basicConfig(level=logging.INFO)
+    web.run_app(emulator.app, host=host, port=port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""Synthetic Remeha Home data matching the payloads in documentation/api.md."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import random
+import uuid
+
+
+def _uuid(rng: random.Random) -> str:
+    """Return a reproducible uuid drawn from the random generator."""
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _timestamp(value: datetime) -> str:
+    """Format a timestamp the way the dashboard endpoint does."""
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def generate_climate_zone(
+    rng: random.Random, appliance_id: str, index: int, appliance_type: str
+) -> dict:
+    """Generate a single climate zone."""
+    next_switch_time = datetime.now(timezone.utc).replace(
+        second=0, microsecond=0
+    ) + timedelta(minutes=rng.randint(5, 600))
+    set_point = float(rng.choice(range(15, 23)))
+    return {
+        "climateZoneId": _uuid(rng),
+        "applianceId": appliance_id,
+        "name": f"Zone {index + 1}",
+        "zoneIcon": 3,
+        "zoneType": "CH",
+        "activeComfortDemand": rng.choice(
+            ["Idle", "Idle", "ProducingHeat", "RequestingHeat"]
+            + (["ProducingCold"] if appliance_type == "HeatPump" else [])
+        ),
+        "zoneMode": rng.choice(["Scheduling", "Manual", "TemporaryOverride"]),
+        "controlStrategy": "Automatic",
+        "firePlaceModeActive": False,
+        "capabilityFirePlaceMode": True,
+        "roomTemperature": round(rng.uniform(14.0, 23.0), 1),
+        "setPoint": set_point,
+        "nextSetpoint": float(rng.choice(range(15, 23))),
+        "nextSwitchTime": _timestamp(next_switch_time),
+        "setPointMin": 5.0,
+        "setPointMax": 30.0,
+        "currentScheduleSetPoint": set_point,
+        "activeHeatingClimateTimeProgramNumber": rng.randint(1, 3),
+        "capabilityCooling": appliance_type == "HeatPump",
+        "capabilityTemporaryOverrideEndTime": True,
+        "preHeat": {"enabled": False, "active": False},
+        "temporaryOverride": {"endTime": "0001-01-01T00:00:00Z"},
+    }
+
+
+def generate_hot_water_zone(rng: random.Random, appliance_id: str, index: int) -> dict:
+    """Generate a single hot water zone."""
+    next_switch_time = datetime.now(timezone.utc).replace(
+        second=0, microsecond=0
+    ) + timedelta(minutes=rng.randint(5, 600))
+    return {
+        "hotWaterZoneId": _uuid(rng),
+        "applianceId": appliance_id,
+        "name": "DHW" if index == 0 else f"DHW {index + 1}",
+        "zoneType": "DHW",
+        "dhwZoneMode": rng.choice(["Off", "Schedule", "ContinuousComfort"]),
+        "dhwStatus": rng.choice(["Idle", "Idle", "ProducingHeat"]),
+        "dhwType": "Combi",
+        "nextSwitchActivity": "Reduced",
+        "capabilityBoostMode": True,
+        "dhwTemperature": round(rng.uniform(40.0, 60.0), 1),
+        "targetSetpoint": 60.0,
+        "reducedSetpoint": 15.0,
+        "comfortSetPoint": 60.0,
+        "setPointMin": 40.0,
+        "setPointMax": 65.0,
+        "setPointRanges": {
+            "comfortSetpointMin": 40.0,
+            "comfortSetpointMax": 65.0,
+            "reducedSetpointMin": 10.0,
+            "reducedSetpointMax": 60.0,
+        },
+        "boostDuration": None,
+        "boostModeEndTime": None,
+        "nextSwitchTime": _timestamp(next_switch_time),
+        "activeDwhTimeProgramNumber": 1,
+    }
+
+
+def generate_appliance(
+    rng: random.Random,
+    index: int,
+    climate_zones: int,
+    hot_water_zones: int,
+    appliance_type: str | None = None,
+) -> dict:
+    """Generate a single appliance with its climate and hot water zones."""
+    appliance_id = _uuid(rng)
+    appliance_type = appliance_type or rng.choice(["Boiler", "HeatPump"])
+    return {
+        "applianceId": appliance_id,
+        "applianceOnline": True,
+        "applianceConnectionStatus": "Connected",
+        "applianceType": appliance_type,
+        "pairingStatus": "Paired",
+        "houseName": f"Home {index + 1}",
+        "errorStatus": "Running",
+        "activeThermalMode": "Idle",
+        "operatingMode": "AutomaticHeating",
+        "outdoorTemperatureInformation": {
+            "outdoorTemperatureSource": "Wired",
+            "internetOutdoorTemperature": None,
+            "applianceOutdoorTemperature": round(rng.uniform(-5.0, 25.0), 1),
+            "utilizeOutdoorTemperature": None,
+            "internetOutdoorTemperatureExpected": False,
+            "isDayTime": True,
+            "weatherCode": "light fog",
+            "cloudOutdoorTemperature": rng.randint(-5, 25),
+            "cloudOutdoorTemperatureStatus": "Ok",
+        },
+        "currentTimestamp": None,
+        "holidaySchedule": {
+            "startTime": "0001-01-01T00:00:00Z",
+            "endTime": "0001-01-01T00:00:00Z",
+            "active": False,
+        },
+        "autoFillingMode": "Disabled",
+        "autoFilling": {"mode": "Disabled", "status": "Standby"},
+        "waterPressure": round(rng.uniform(1.0, 2.0), 1),
+        "waterPressureOK": True,
+        "capabilityEnergyConsumption": True,
+        "capabilityCooling": appliance_type == "HeatPump",
+        "capabilityPreHeat": True,
+        "capabilityMultiSchedule": True,
+        "capabilityPowerSettings": False,
+        "capabilityOutdoorTemperature": True,
+        "capabilityUtilizeOutdoorTemperature": False,
+        "capabilityInternetOutdoorTemperatureExpected": True,
+        "hasOverwrittenActivityNames": True,
+        "gasCalorificValue": 10.8134,
+        "isActive": True,
+        "hotWaterZones": [
+            generate_hot_water_zone(rng, appliance_id, i)
+            for i in range(hot_water_zones)
+        ],
+        "climateZones": [
+            generate_climate_zone(rng, appliance_id, i, appliance_type)
+            for i in range(climate_zones)
+        ],
+        "solarThermals": [],
+    }
+
+
+def generate_dashboard(
+    appliances: int = 1,
+    climate_zones: int = 1,
+    hot_water_zones: int = 1,
+    seed: int | None = 0,
+    appliance_type: str | None = None,
+) -> dict:
+    """Generate a `/homes/dashboard` response for a home of the given size."""
+    rng = random.Random(seed)
+    return {
+        "appliances": [
+            generate_appliance(rng, i, climate_zones, hot_water_zones, appliance_type)
+            for i in range(appliances)
+        ]
+    }
+
+
+def generate_technical_details(appliance: dict) -> dict:
+    """Generate a `/appliances/{id}/technicaldetails` response for an appliance."""
+    return {
+        "applianceName": (
+            "Elga Ace" if appliance["applianceType"] == "HeatPump" else "Calenta Ace"
+        ),
+        "internetConnectedGateways": [
+            {
+                "name": "eTwist",
+                "hardwareVersion": "1.0",
+                "softwareVersion": "2.4.1",
+            }
+        ],
+    }
+
+
+def generate_consumption(
+    appliance_id: str, start: datetime, end: datetime, interval: str
+) -> dict:
+    """Generate an `/appliances/{id}/energyconsumption/{interval}` response.
+
+    Naive start and end times are taken as UTC, the timestamps in the response
+    have a UTC offset like those of the API.
+    """
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+    rng = random.Random(f"{appliance_id}-{interval}-{start.isoformat()}")
+    data = []
+    current = start
+    while current <= end:
+        data.append(
+            {
+                "timeStamp": current.isoformat(),
+                "heatingEnergyConsumed": round(rng.uniform(0.0, 30.0), 2),
+                "hotWaterEnergyConsumed": round(rng.uniform(0.0, 5.0), 2),
+                "coolingEnergyConsumed": 0.0,
+                "heatingEnergyDelivered": round(rng.uniform(0.0, 90.0), 2),
+                "hotWaterEnergyDelivered": round(rng.uniform(0.0, 15.0), 2),
+                "coolingEnergyDelivered": 0.0,
+            }
+        )
+        if interval == "daily":
+            current += timedelta(days=1)
+        elif interval == "monthly":
+            current = (current.replace(day=1) + timedelta(days=32)).replace(day=1)
+        else:
+            current = current.replace(year=current.year + 1, month=1, day=1)
+
+    return {
+        "startDateTimeUsed": start.isoformat(),
+        "endDateTimeUsed": end.isoformat(),
+        "data": data,
+    }
@@ -0,0 +1,73 @@
+"""Fixtures for the Remeha Home tests."""
+
+from collections.abc import Generator
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.remeha_home.const import DOMAIN
+from devtools.synthetic import generate_dashboard, generate_technical_details
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable loading the integration from custom_components."""
+    return
+
+
+@pytest.fixture
+def oauth_session() -> MagicMock:
+    """Return an OAuth2 session with a valid token."""
+    session = MagicMock(
+        valid_token=True,
+        token={"access_token": "access-token", "expires_at": time.time() + 3600},
+    )
+    session.async_request = AsyncMock()
+    return session
+
+
+@pytest.fixture
+def config_entry() -> MockConfigEntry:
+    """Return a config entry with a valid token."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        unique_id=DOMAIN,
+        data={
+            "auth_implementation": DOMAIN,
+            "token": {
+                "access_token": "access-token",
+                "refresh_token": "refresh-token",
+                "expires_at": time.time() + 3600,
+            },
+        },
+    )
+
+
+@pytest.fixture
+def dashboard() -> dict:
+    """Return the dashboard of a home with two climate zones."""
+    return generate_dashboard(climate_zones=2, appliance_type="Boiler")
+
+
+@pytest.fixture
+def mock_api(dashboard: dict) -> Generator[dict[str, AsyncMock]]:
+    """Patch the requests of the API client to return synthetic data."""
+    api = "custom_components.remeha_home.api.RemehaHomeAPI"
+    mocks = {
+        "async_get_dashboard": AsyncMock(return_value=dashboard),
+        "async_get_appliance_technical_information": AsyncMock(
+            return_value=generate_technical_details(dashboard["appliances"][0])
+        ),
+        "async_get_consumption_data_for_today": AsyncMock(return_value={"data": []}),
+        "async_set_manual": AsyncMock(),
+        "async_set_schedule": AsyncMock(),
+        "async_set_temporary_override": AsyncMock(),
+        "async_set_off": AsyncMock(),
+        "async_warm_up": AsyncMock(),
+    }
+    with patch.multiple(api, **mocks), patch(
+        f"{api}.async_start_token_refresh", return_value=MagicMock()
+    ):
+        yield mocks
@@ -0,0 +1,170 @@
+"""Tests for the Remeha Home API client."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from aiohttp import ClientPayloadError, hdrs
+import pytest
+
+from custom_components.remeha_home.api import RemehaHomeAPI
+from custom_components.remeha_home.const import (
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    RETRY_MAX_ATTEMPTS,
+)
+from custom_components.remeha_home.retry import CircuitOpenError
+
+
+async def _hang(*args, **kwargs):
+    await asyncio.Event().wait()
+
+
+async def test_hanging_request_is_retried_until_the_circuit_opens(
+    oauth_session: MagicMock,
+) -> None:
+    """Test that attempts without a response time out, are retried and trip the circuit."""
+    oauth_session.async_request.side_effect = _hang
+    api = RemehaHomeAPI(oauth_session)
+
+    with patch("custom_components.remeha_home.api.REQUEST_TIMEOUT", 0.01), patch(
+        "custom_components.remeha_home.api.backoff_delay", return_value=0
+    ):
+        with pytest.raises(TimeoutError):
+            await api.async_get_appliance_technical_information("appliance-id")
+        assert oauth_session.async_request.call_count == RETRY_MAX_ATTEMPTS + 1
+        assert api.circuit_breaker.state == "closed"
+
+        # The next failure reaches the threshold, the retry fails fast
+        with pytest.raises(CircuitOpenError):
+            await api.async_get_appliance_technical_information("appliance-id")
+
+    assert api.circuit_breaker.state == "open"
+    assert oauth_session.async_request.call_count == CIRCUIT_BREAKER_FAILURE_THRESHOLD
+    assert api.request_stats["appliance"]["errors"] == {
+        "TimeoutError": CIRCUIT_BREAKER_FAILURE_THRESHOLD
+    }
+
+
+async def test_request_is_not_retried_past_the_deadline(
+    oauth_session: MagicMock,
+) -> None:
+    """Test that a retry which does not fit in the deadline raises the error."""
+    oauth_session.async_request.side_effect = _hang
+    api = RemehaHomeAPI(oauth_session)
+
+    with patch("custom_components.remeha_home.api.REQUEST_TIMEOUT", 0.01), patch(
+        "custom_components.remeha_home.api.REQUEST_DEADLINE", 0.5
+    ), pytest.raises(TimeoutError):
+        await api.async_get_appliance_technical_information("appliance-id")
+
+    assert oauth_session.async_request.call_count == 1
+    assert api.request_stats["appliance"]["retries"] == 0
+
+
+async def test_concurrent_dashboard_callers_share_a_request(
+    oauth_session: MagicMock,
+) -> None:
+    """Test that concurrent callers share a request a cancelled caller does not cancel."""
+    api = RemehaHomeAPI(oauth_session)
+    dashboard = {"appliances": []}
+    release = asyncio.Event()
+
+    async def _fetch() -> dict:
+        await release.wait()
+        return dashboard
+
+    with patch.object(api, "_async_fetch_dashboard", side_effect=_fetch) as fetch:
+        first = asyncio.create_task(api.async_get_dashboard())
+        second = asyncio.create_task(api.async_get_dashboard())
+        await asyncio.sleep(0)
+
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        release.set()
+        assert await second is dashboard
+
+        # A caller within the freshness window reuses the result
+        assert await api.async_get_dashboard() is dashboard
+
+    assert fetch.call_count == 1
+
+
+async def test_dashboard_request_completes_without_callers(
+    oauth_session: MagicMock,
+) -> None:
+    """Test that the result of a request whose callers were all cancelled is kept."""
+    api = RemehaHomeAPI(oauth_session)
+    dashboard = {"appliances": []}
+    release = asyncio.Event()
+
+    async def _fetch() -> dict:
+        await release.wait()
+        return dashboard
+
+    with patch.object(api, "_async_fetch_dashboard", side_effect=_fetch) as fetch:
+        caller = asyncio.create_task(api.async_get_dashboard())
+        await asyncio.sleep(0)
+        request = api._dashboard_request
+
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        release.set()
+        await request
+
+        assert await api.async_get_dashboard() is dashboard
+
+    assert fetch.call_count == 1
+
+
+def _response(status: int, body: bytes = b"", headers: dict | None = None) -> MagicMock:
+    """Return a dashboard response with a status and body."""
+    response = MagicMock(status=status, headers=headers or {})
+    response.read = AsyncMock(return_value=body)
+    return response
+
+
+async def test_dashboard_with_empty_body(oauth_session: MagicMock) -> None:
+    """Test that an empty dashboard body raises a client error."""
+    api = RemehaHomeAPI(oauth_session)
+
+    with patch.object(
+        api, "_async_api_request", return_value=_response(200, headers={hdrs.ETAG: "1"})
+    ), pytest.raises(ClientPayloadError):
+        await api.async_get_dashboard()
+
+    # The validators of the invalid response are not sent
+    assert api._dashboard_validators == {}
+
+
+async def test_dashboard_not_modified_without_previous_response(
+    oauth_session: MagicMock,
+) -> None:
+    """Test that validators are only sent with a body and a bare 304 raises."""
+    api = RemehaHomeAPI(oauth_session)
+    api._dashboard_validators = {hdrs.IF_NONE_MATCH: "1"}
+
+    with patch.object(
+        api, "_async_api_request", return_value=_response(304)
+    ) as api_request, pytest.raises(ClientPayloadError):
+        await api.async_get_dashboard()
+
+    assert hdrs.IF_NONE_MATCH not in api_request.call_args.kwargs["headers"]
+
+
+async def test_dashboard_not_modified(oauth_session: MagicMock) -> None:
+    """Test that a 304 response returns the previous dashboard."""
+    api = RemehaHomeAPI(oauth_session, dashboard_freshness=0)
+
+    with patch.object(
+        api,
+        "_async_api_request",
+        side_effect=[
+            _response(200, b'{"appliances": []}', {hdrs.ETAG: "1"}),
+            _response(304),
+        ],
+    ) as api_request:
+        dashboard = await api.async_get_dashboard()
+        assert await api.async_get_dashboard() is dashboard
+
+    assert api_request.call_args.kwargs["headers"][hdrs.IF_NONE_MATCH] == "1"
@@ -0,0 +1,230 @@
+"""Tests for the Remeha Home update coordinator."""
+
+from collections.abc import AsyncGenerator
+import copy
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from aiohttp import ClientError
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.remeha_home.const import COMMAND_PATCH_TIMEOUT
+from custom_components.remeha_home.coordinator import RemehaHomeUpdateCoordinator
+from devtools.synthetic import generate_technical_details
+
+
+@pytest.fixture
+def api(dashboard: dict) -> MagicMock:
+    """Return an API client returning the dashboard."""
+    api = MagicMock()
+    api.async_get_dashboard = AsyncMock(return_value=dashboard)
+    api.async_get_appliance_technical_information = AsyncMock(
+        return_value=generate_technical_details(dashboard["appliances"][0])
+    )
+    return api
+
+
+@pytest.fixture
+async def coordinator(
+    hass: HomeAssistant, api: MagicMock
+) -> AsyncGenerator[RemehaHomeUpdateCoordinator]:
+    """Return a coordinator after its first refresh."""
+    coordinator = RemehaHomeUpdateCoordinator(hass, api)
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    yield coordinator
+    await coordinator.async_shutdown()
+
+
+@pytest.fixture
+def listeners(
+    dashboard: dict, coordinator: RemehaHomeUpdateCoordinator
+) -> dict[str | None, MagicMock]:
+    """Register a listener for every item and one without an item."""
+    appliance = dashboard["appliances"][0]
+    item_ids = [
+        None,
+        appliance["applianceId"],
+        *(zone["climateZoneId"] for zone in appliance["climateZones"]),
+        *(zone["hotWaterZoneId"] for zone in appliance["hotWaterZones"]),
+    ]
+    listeners = {item_id: MagicMock() for item_id in item_ids}
+    for item_id, listener in listeners.items():
+        coordinator.async_add_listener(listener, item_id)
+    return listeners
+
+
+def _called(listeners: dict[str | None, MagicMock]) -> set[str | None]:
+    """Return the items of the listeners that were called."""
+    return {item_id for item_id, listener in listeners.items() if listener.called}
+
+
+async def test_only_listeners_of_changed_items_are_updated(
+    dashboard: dict,
+    api: MagicMock,
+    coordinator: RemehaHomeUpdateCoordinator,
+    listeners: dict[str | None, MagicMock],
+) -> None:
+    """Test that a refresh only updates the listeners of the changed items."""
+    changed = copy.deepcopy(dashboard)
+    zone = changed["appliances"][0]["climateZones"][0]
+    zone["roomTemperature"] += 1
+    api.async_get_dashboard.return_value = changed
+
+    await coordinator.async_refresh()
+
+    assert _called(listeners) == {None, zone["climateZoneId"]}
+
+
+async def test_unchanged_dashboard_updates_no_item_listeners(
+    dashboard: dict,
+    api: MagicMock,
+    coordinator: RemehaHomeUpdateCoordinator,
+    listeners: dict[str | None, MagicMock],
+) -> None:
+    """Test that an unchanged dashboard only updates listeners without an item."""
+    api.async_get_dashboard.return_value = copy.deepcopy(dashboard)
+    await coordinator.async_refresh()
+
+    # The API returns the previous response object for an unchanged dashboard
+    await coordinator.async_refresh()
+
+    assert _called(listeners) == {None}
+    assert listeners[None].call_count == 2
+
+
+async def test_changed_device_list_updates_all_listeners(
+    dashboard: dict,
+    api: MagicMock,
+    coordinator: RemehaHomeUpdateCoordinator,
+    listeners: dict[str | None, MagicMock],
+) -> None:
+    """Test that all listeners are updated when a zone is removed."""
+    changed = copy.deepcopy(dashboard)
+    changed["appliances"][0]["climateZones"].pop()
+    api.async_get_dashboard.return_value = changed
+
+    await coordinator.async_refresh()
+
+    assert _called(listeners) == set(listeners)
+
+
+async def test_changed_availability_updates_all_listeners(
+    api: MagicMock,
+    coordinator: RemehaHomeUpdateCoordinator,
+    listeners: dict[str | None, MagicMock],
+) -> None:
+    """Test that all listeners are updated when the data becomes unavailable."""
+    api.async_get_dashboard.side_effect = ClientError
+
+    await coordinator.async_refresh()
+
+    assert not coordinator.last_update_success
+    assert _called(listeners) == set(listeners)
+
+
+def _climate_zone(dashboard: dict) -> dict:
+    """Return the first climate zone of a dashboard response."""
+    return dashboard["appliances"][0]["climateZones"][0]
+
+
+async def test_patch_is_applied_locally(
+    dashboard: dict,
+    coordinator: RemehaHomeUpdateCoordinator,
+    listeners: dict[str | None, MagicMock],
+) -> None:
+    """Test that a patch updates the item and only notifies its listeners."""
+    zone_id = _climate_zone(dashboard)["climateZoneId"]
+
+    coordinator.async_patch_item(zone_id, {"set_point": 25.5})
+
+    assert coordinator.get_by_id(zone_id).set_point == 25.5
+    assert _called(listeners) == {None, zone_id}
+
+
+async def test_patch_is_kept_until_the_cloud_confirms_it(
+    dashboard: dict, api: MagicMock, coordinator: RemehaHomeUpdateCoordinator
+) -> None:
+    """Test that a patch survives refreshes until the cloud reports its value."""
+    zone_id = _climate_zone(dashboard)["climateZoneId"]
+    coordinator.async_patch_item(zone_id, {"set_point": 25.5})
+
+    # The cloud has not processed the command yet
+    api.async_get_dashboard.return_value = copy.deepcopy(dashboard)
+    await coordinator.async_refresh()
+    assert coordinator.get_by_id(zone_id).set_point == 25.5
+    assert zone_id in coordinator._pending_patches
+
+    confirmed = copy.deepcopy(dashboard)
+    _climate_zone(confirmed)["setPoint"] = 25.5
+    api.async_get_dashboard.return_value = confirmed
+    await coordinator.async_refresh()
+    assert coordinator.get_by_id(zone_id).set_point == 25.5
+    assert zone_id not in coordinator._pending_patches
+
+
+async def test_patch_is_rolled_back_after_the_timeout(
+    dashboard: dict, api: MagicMock, coordinator: RemehaHomeUpdateCoordinator
+) -> None:
+    """Test that the cloud state wins once a patch was not confirmed in time."""
+    zone = _climate_zone(dashboard)
+    coordinator.async_patch_item(zone["climateZoneId"], {"set_point": 25.5})
+    api.async_get_dashboard.return_value = copy.deepcopy(dashboard)
+
+    with patch("custom_components.remeha_home.coordinator.time") as mock_time:
+        mock_time.time.side_effect = time.time
+        mock_time.monotonic.return_value = time.monotonic() + COMMAND_PATCH_TIMEOUT
+        await coordinator.async_refresh()
+
+    assert coordinator.get_by_id(zone["climateZoneId"]).set_point == zone["setPoint"]
+    assert not coordinator._pending_patches
+
+
+async def test_cloud_change_overrides_a_patch(
+    dashboard: dict, api: MagicMock, coordinator: RemehaHomeUpdateCoordinator
+) -> None:
+    """Test that any other change of a patched field by the cloud wins."""
+    zone_id = _climate_zone(dashboard)["climateZoneId"]
+    coordinator.async_patch_item(zone_id, {"set_point": 25.5})
+
+    changed = copy.deepcopy(dashboard)
+    _climate_zone(changed)["setPoint"] = 12.0
+    api.async_get_dashboard.return_value = changed
+    await coordinator.async_refresh()
+
+    assert coordinator.get_by_id(zone_id).set_point == 12.0
+    assert not coordinator._pending_patches
+
+
+async def test_stacked_patches(
+    dashboard: dict, api: MagicMock, coordinator: RemehaHomeUpdateCoordinator
+) -> None:
+    """Test that patches of an item stack and are confirmed per field."""
+    zone = _climate_zone(dashboard)
+    zone_id = zone["climateZoneId"]
+    coordinator.async_patch_item(zone_id, {"zone_mode": "FrostProtection"})
+    coordinator.async_patch_item(zone_id, {"set_point": 25.5})
+    coordinator.async_patch_item(zone_id, {"set_point": 26.0})
+
+    item = coordinator.get_by_id(zone_id)
+    assert (item.zone_mode, item.set_point) == ("FrostProtection", 26.0)
+    changes, cloud_values, _ = coordinator._pending_patches[zone_id]
+    assert changes == {"zone_mode": "FrostProtection", "set_point": 26.0}
+    # The cloud values are those from before the first patch of each field
+    assert cloud_values == {
+        "zone_mode": zone["zoneMode"],
+        "set_point": zone["setPoint"],
+    }
+
+    # The cloud confirms the mode, the set point is still pending
+    partially_confirmed = copy.deepcopy(dashboard)
+    _climate_zone(partially_confirmed)["zoneMode"] = "FrostProtection"
+    api.async_get_dashboard.return_value = partially_confirmed
+    await coordinator.async_refresh()
+
+    item = coordinator.get_by_id(zone_id)
+    assert (item.zone_mode, item.set_point) == ("FrostProtection", 26.0)
+    changes, _, _ = coordinator._pending_patches[zone_id]
+    assert changes == {"set_point": 26.0}
@@ -0,0 +1,187 @@
+"""Tests for the energy history import of the Remeha Home integration."""
+
+from collections.abc import Generator
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from aiohttp import ClientError
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from custom_components.remeha_home.history import (
+    ENERGY_FIELDS,
+    RemehaHomeEnergyHistoryImporter,
+    energy_statistic_id,
+)
+from custom_components.remeha_home.models import Appliance
+
+HISTORY = "custom_components.remeha_home.history"
+APPLIANCE = Appliance(appliance_id="appliance-id", house_name="Home")
+STATISTIC_ID = energy_statistic_id(APPLIANCE.appliance_id, "heatingEnergyConsumed")
+DAYS = 70
+
+
+def _consumption(
+    appliance_id: str, interval: str, start: datetime, end: datetime, priority
+) -> dict:
+    """Return daily consumption of 1 kWh for every field and day in the window."""
+    data = []
+    day = start
+    while day <= end:
+        data.append({"timeStamp": day.isoformat(), **dict.fromkeys(ENERGY_FIELDS, 1.0)})
+        day += timedelta(days=1)
+    return {"data": data}
+
+
+@pytest.fixture(autouse=True)
+async def utc_time_zone(hass: HomeAssistant) -> None:
+    """Use UTC, so every day of the history lasts 24 hours."""
+    await hass.config.async_set_time_zone("UTC")
+
+
+@pytest.fixture
+def api() -> MagicMock:
+    """Return an API client returning the consumption history."""
+    api = MagicMock()
+    api.async_get_consumption_data = AsyncMock(side_effect=_consumption)
+    return api
+
+
+@pytest.fixture
+def recorder() -> Generator[dict[str, MagicMock]]:
+    """Stub the recorder, running its executor jobs right away."""
+    instance = MagicMock()
+    instance.async_add_executor_job = AsyncMock(
+        side_effect=lambda target, *args: target(*args)
+    )
+    with patch(f"{HISTORY}.get_instance", return_value=instance), patch(
+        f"{HISTORY}.get_last_statistics", return_value={}
+    ) as get_last_statistics, patch(
+        f"{HISTORY}.statistics_during_period", return_value={}
+    ) as statistics_during_period, patch(
+        f"{HISTORY}.async_add_external_statistics"
+    ) as async_add_external_statistics, patch(
+        f"{HISTORY}.HISTORY_REQUEST_INTERVAL", 0
+    ):
+        yield {
+            "get_last_statistics": get_last_statistics,
+            "statistics_during_period": statistics_during_period,
+            "async_add_external_statistics": async_add_external_statistics,
+        }
+
+
+@pytest.fixture
+def importer(hass: HomeAssistant, api: MagicMock) -> RemehaHomeEnergyHistoryImporter:
+    """Return an energy history importer."""
+    return RemehaHomeEnergyHistoryImporter(hass, api, MockConfigEntry(domain="test"))
+
+
+def _imported(async_add_external_statistics: MagicMock) -> list[tuple[datetime, float]]:
+    """Return the start and sum of the statistics imported for STATISTIC_ID."""
+    return [
+        (statistic["start"], statistic["sum"])
+        for call in async_add_external_statistics.call_args_list
+        if call.args[1]["statistic_id"] == STATISTIC_ID
+        for statistic in call.args[2]
+    ]
+
+
+def _expected(start: datetime, first_sum: float) -> list[tuple[datetime, float]]:
+    """Return the start and sum of every day from start up to today."""
+    return [(start + timedelta(days=day), first_sum + day) for day in range(DAYS)]
+
+
+async def test_import_continues_the_sum_across_windows(
+    importer: RemehaHomeEnergyHistoryImporter, recorder: dict[str, MagicMock]
+) -> None:
+    """Test that the sum continues over the window boundaries without gaps."""
+    start = dt_util.start_of_local_day() - timedelta(days=DAYS)
+
+    await importer.async_import([APPLIANCE], start)
+
+    assert _imported(recorder["async_add_external_statistics"]) == _expected(start, 1.0)
+
+
+async def test_import_resumes_after_an_interruption(
+    importer: RemehaHomeEnergyHistoryImporter,
+    api: MagicMock,
+    recorder: dict[str, MagicMock],
+) -> None:
+    """Test that an interrupted import resumes at the failed window and sum."""
+    start = dt_util.start_of_local_day() - timedelta(days=DAYS)
+    api.async_get_consumption_data.side_effect = [
+        _consumption(APPLIANCE.appliance_id, "daily", start, start + timedelta(30), 0),
+        ClientError("Connection reset"),
+    ]
+
+    with patch(f"{HISTORY}.HISTORY_BATCH_WINDOWS", 1):
+        await importer.async_import([APPLIANCE], start)
+        assert (
+            _imported(recorder["async_add_external_statistics"])
+            == _expected(start, 1.0)[:31]
+        )
+
+        api.async_get_consumption_data.side_effect = _consumption
+        await importer.async_import([APPLIANCE])
+
+    assert _imported(recorder["async_add_external_statistics"]) == _expected(start, 1.0)
+    # The import resumed at the window that failed
+    assert api.async_get_consumption_data.call_args_list[2].args[
+        2
+    ] == start + timedelta(days=31)
+
+
+async def test_import_continues_the_last_statistic(
+    importer: RemehaHomeEnergyHistoryImporter, recorder: dict[str, MagicMock]
+) -> None:
+    """Test that an import after existing statistics continues their sum."""
+    start = dt_util.start_of_local_day() - timedelta(days=DAYS)
+    recorder["get_last_statistics"].side_effect = (
+        lambda hass, count, statistic_id, *_: {
+            statistic_id: [
+                {"start": (start - timedelta(days=1)).timestamp(), "sum": 100.0}
+            ]
+        }
+    )
+
+    await importer.async_import([APPLIANCE], start)
+
+    assert _imported(recorder["async_add_external_statistics"]) == _expected(
+        start, 101.0
+    )
+    recorder["statistics_during_period"].assert_not_called()
+
+
+async def test_import_overlapping_statistics_continues_before_the_start(
+    importer: RemehaHomeEnergyHistoryImporter, recorder: dict[str, MagicMock]
+) -> None:
+    """Test that a reimport continues the sum of the last statistic before it."""
+    start = dt_util.start_of_local_day() - timedelta(days=DAYS)
+    recorder["get_last_statistics"].side_effect = (
+        lambda hass, count, statistic_id, *_: {
+            statistic_id: [
+                {"start": (start + timedelta(days=5)).timestamp(), "sum": 200.0}
+            ]
+        }
+    )
+    recorder["statistics_during_period"].side_effect = (
+        lambda hass, start_time, end_time, statistic_ids, *_: {
+            statistic_id: [
+                {"start": (end_time - timedelta(days=2)).timestamp(), "sum": 49.0},
+                {"start": (end_time - timedelta(days=1)).timestamp(), "sum": 50.0},
+            ]
+            for statistic_id in statistic_ids
+        }
+    )
+
+    await importer.async_import([APPLIANCE], start)
+
+    assert _imported(recorder["async_add_external_statistics"]) == _expected(
+        start, 51.0
+    )
+    # The statistics are looked up up to the start of the import
+    for call in recorder["statistics_during_period"].call_args_list:
+        assert call.args[2] == start
@@ -0,0 +1,65 @@
+"""Tests for the setup of the Remeha Home integration."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.auth.models import User
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import Context, HomeAssistant
+from homeassistant.exceptions import Unauthorized
+
+from custom_components.remeha_home.const import DOMAIN
+from custom_components.remeha_home.services import (
+    SERVICE_IMPORT_ENERGY_HISTORY,
+    SERVICE_PROFILE_REFRESH,
+    SERVICE_SET_ZONES,
+)
+
+
+async def test_setup_entry(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_api: dict[str, AsyncMock],
+) -> None:
+    """Test that a config entry is set up and registers the services."""
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert config_entry.state is ConfigEntryState.LOADED
+    for service in (
+        SERVICE_IMPORT_ENERGY_HISTORY,
+        SERVICE_PROFILE_REFRESH,
+        SERVICE_SET_ZONES,
+    ):
+        assert hass.services.has_service(DOMAIN, service)
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    assert config_entry.state is ConfigEntryState.NOT_LOADED
+
+
+async def test_profile_refresh_requires_admin(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_api: dict[str, AsyncMock],
+    hass_read_only_user: User,
+) -> None:
+    """Test that the profile_refresh service is only available to administrators."""
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    with pytest.raises(Unauthorized):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_PROFILE_REFRESH,
+            {},
+            blocking=True,
+            return_response=True,
+            context=Context(user_id=hass_read_only_user.id),
+        )
+    assert mock_api["async_get_dashboard"].call_count == 1
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
@@ -0,0 +1,133 @@
+"""Tests for the Remeha Home snapshot models."""
+
+import copy
+
+import pytest
+
+from custom_components.remeha_home.models import (
+    ConsumptionData,
+    Dashboard,
+    compile_key_path,
+    parse_dashboard,
+)
+from devtools.synthetic import generate_dashboard
+
+
+def _items(dashboard: Dashboard) -> dict:
+    """Return the appliances and zones of a dashboard by id."""
+    items = {}
+    for appliance in dashboard.appliances:
+        items[appliance.item_id] = appliance
+        for zone in (*appliance.climate_zones, *appliance.hot_water_zones):
+            items[zone.item_id] = zone
+    return items
+
+
+@pytest.fixture
+def data() -> dict:
+    """Return a dashboard response of two appliances with two climate zones."""
+    return generate_dashboard(appliances=2, climate_zones=2)
+
+
+def test_unchanged_dashboard_keeps_identity(data: dict) -> None:
+    """Test that all items of an unchanged dashboard are reused."""
+    previous = _items(parse_dashboard(data, {}))
+
+    dashboard = parse_dashboard(copy.deepcopy(data), previous)
+
+    assert dashboard.appliances == tuple(
+        previous[appliance["applianceId"]] for appliance in data["appliances"]
+    )
+    for item_id, item in _items(dashboard).items():
+        assert item is previous[item_id]
+
+
+def test_changed_zone_is_replaced(data: dict) -> None:
+    """Test that only a changed zone and its appliance are new objects."""
+    previous = _items(parse_dashboard(data, {}))
+    changed = copy.deepcopy(data)
+    changed_zone = changed["appliances"][0]["climateZones"][0]
+    changed_zone["setPoint"] += 1
+
+    dashboard = parse_dashboard(changed, previous)
+
+    items = _items(dashboard)
+    zone = items[changed_zone["climateZoneId"]]
+    assert zone is not previous[zone.item_id]
+    assert zone.set_point == changed_zone["setPoint"]
+    # The appliance holds the new zone, but is equal to the previous one
+    appliance = dashboard.appliances[0]
+    assert appliance is not previous[appliance.item_id]
+    assert appliance == previous[appliance.item_id]
+    assert appliance.climate_zones[0] is zone
+    assert appliance.climate_zones[1] is previous[appliance.climate_zones[1].item_id]
+    for hot_water_zone in appliance.hot_water_zones:
+        assert hot_water_zone is previous[hot_water_zone.item_id]
+    # Other appliances are reused as a whole
+    assert dashboard.appliances[1] is previous[dashboard.appliances[1].item_id]
+
+
+def test_changed_appliance_reuses_its_zones(data: dict) -> None:
+    """Test that a changed appliance is replaced and keeps its unchanged zones."""
+    previous = _items(parse_dashboard(data, {}))
+    changed = copy.deepcopy(data)
+    changed["appliances"][0]["waterPressure"] += 0.5
+
+    dashboard = parse_dashboard(changed, previous)
+
+    appliance = dashboard.appliances[0]
+    assert appliance is not previous[appliance.item_id]
+    assert appliance.water_pressure == changed["appliances"][0]["waterPressure"]
+    for zone in (*appliance.climate_zones, *appliance.hot_water_zones):
+        assert zone is previous[zone.item_id]
+
+
+def test_removed_zone(data: dict) -> None:
+    """Test that an appliance with a removed zone is replaced."""
+    previous = _items(parse_dashboard(data, {}))
+    changed = copy.deepcopy(data)
+    removed_zone = changed["appliances"][0]["climateZones"].pop()
+
+    dashboard = parse_dashboard(changed, previous)
+
+    appliance = dashboard.appliances[0]
+    assert appliance is not previous[appliance.item_id]
+    assert removed_zone["climateZoneId"] not in _items(dashboard)
+
+
+def test_model_round_trip(data: dict) -> None:
+    """Test that a model converts back to the shape of the API response."""
+    dashboard = Dashboard.from_dict(data)
+
+    assert Dashboard.from_dict(dashboard.as_dict()) == dashboard
+
+
+def test_compile_key_path(data: dict) -> None:
+    """Test that a camel case key path returns the model attribute."""
+    appliance = Dashboard.from_dict(data).appliances[0]
+    outdoor_temperature = data["appliances"][0]["outdoorTemperatureInformation"][
+        "applianceOutdoorTemperature"
+    ]
+
+    get_value = compile_key_path(
+        "outdoorTemperatureInformation.applianceOutdoorTemperature"
+    )
+
+    assert get_value(appliance) == outdoor_temperature
+    assert compile_key_path("waterPressure")(appliance) == appliance.water_pressure
+    assert compile_key_path("heatingEnergyConsumed")(
+        ConsumptionData(heating_energy_consumed=1.5)
+    ) == pytest.approx(1.5)
+    # Compiled key paths are cached
+    assert (
+        compile_key_path("outdoorTemperatureInformation.applianceOutdoorTemperature")
+        is get_value
+    )
+
+
+def test_compile_key_path_missing_attribute(data: dict) -> None:
+    """Test that a key path which does not exist raises AttributeError."""
+    appliance = Dashboard.from_dict(data).appliances[0]
+
+    with pytest.raises(AttributeError):
+        compile_key_path("outdoorTemperatureInformation.unknownField")(appliance)
@@ -0,0 +1,120 @@
+"""Tests for the client side rate limiting of the Remeha Home API requests."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from custom_components.remeha_home.ratelimit import (
+    RequestPriority,
+    TokenBucket,
+    parse_retry_after,
+)
+
+
+async def test_tokens_refill_at_the_rate() -> None:
+    """Test that the burst is handed out at once and then refilled at the rate."""
+    bucket = TokenBucket(rate=10.0, capacity=2)
+
+    assert await bucket.async_acquire() == pytest.approx(0.0, abs=0.01)
+    assert await bucket.async_acquire() == pytest.approx(0.0, abs=0.01)
+    assert await bucket.async_acquire() == pytest.approx(0.1, abs=0.05)
+
+
+async def test_tokens_refill_up_to_the_capacity() -> None:
+    """Test that an idle bucket holds no more tokens than its capacity."""
+    bucket = TokenBucket(rate=100.0, capacity=2)
+    await asyncio.sleep(0.1)
+
+    await bucket.async_acquire()
+    await bucket.async_acquire()
+    assert await bucket.async_acquire() == pytest.approx(0.01, abs=0.01)
+
+
+async def test_waiters_are_served_by_priority() -> None:
+    """Test that waiting requests get tokens by priority, then in arrival order."""
+    bucket = TokenBucket(rate=50.0, capacity=1)
+    await bucket.async_acquire()
+    served = []
+
+    async def _acquire(name: str, priority: RequestPriority) -> None:
+        await bucket.async_acquire(priority)
+        served.append(name)
+
+    async with asyncio.TaskGroup() as task_group:
+        for name, priority in (
+            ("background", RequestPriority.BACKGROUND),
+            ("poll 1", RequestPriority.POLL),
+            ("command", RequestPriority.COMMAND),
+            ("poll 2", RequestPriority.POLL),
+        ):
+            task_group.create_task(_acquire(name, priority))
+            # Make sure the requests are queued in this order
+            await asyncio.sleep(0)
+
+    assert served == ["command", "poll 1", "poll 2", "background"]
+
+
+async def test_cancelled_waiter_does_not_block_others() -> None:
+    """Test that a cancelled request leaves the queue."""
+    bucket = TokenBucket(rate=20.0, capacity=1)
+    await bucket.async_acquire()
+
+    cancelled = asyncio.create_task(bucket.async_acquire(RequestPriority.COMMAND))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+    assert await bucket.async_acquire() == pytest.approx(0.05, abs=0.03)
+
+
+async def test_pause_after_throttling() -> None:
+    """Test that no tokens are handed out while the bucket is paused."""
+    bucket = TokenBucket(rate=100.0, capacity=5)
+
+    await bucket.async_pause(0.2)
+    assert await bucket.async_acquire() == pytest.approx(0.2, abs=0.05)
+    # A shorter pause does not end an ongoing one early
+    await bucket.async_pause(0.2)
+    await bucket.async_pause(0.05)
+    assert await bucket.async_acquire() == pytest.approx(0.2, abs=0.05)
+
+
+async def test_pause_wakes_up_waiting_requests() -> None:
+    """Test that a pause also delays requests which were already waiting."""
+    bucket = TokenBucket(rate=20.0, capacity=1)
+    await bucket.async_acquire()
+
+    waiter = asyncio.create_task(bucket.async_acquire())
+    await asyncio.sleep(0)
+    await bucket.async_pause(0.2)
+
+    assert await waiter == pytest.approx(0.2, abs=0.05)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("120", 120.0),
+        ("1.5", 1.5),
+        ("-5", 0.0),
+        ("", None),
+        (None, None),
+        ("soon", None),
+    ],
+)
+def test_parse_retry_after_seconds(value: str | None, expected: float | None) -> None:
+    """Test parsing a Retry-After header in seconds."""
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date() -> None:
+    """Test parsing a Retry-After header with an HTTP date."""
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+
+    assert parse_retry_after(format_datetime(retry_at, usegmt=True)) == pytest.approx(
+        60, abs=2
+    )
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
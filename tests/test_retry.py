@@ -0,0 +1,104 @@
+"""Tests for the retry policy and circuit breaker of the Remeha Home API."""
+
+from collections.abc import Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.remeha_home.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    backoff_delay,
+)
+
+
+@pytest.fixture
+def clock() -> Generator[MagicMock]:
+    """Patch the clock of the circuit breaker."""
+    with patch("custom_components.remeha_home.retry.time") as mock_time:
+        mock_time.monotonic.return_value = 1000.0
+        yield mock_time
+
+
+def test_circuit_opens_after_consecutive_failures(clock: MagicMock) -> None:
+    """Test that the circuit opens at the failure threshold and fails fast."""
+    breaker = CircuitBreaker("api.example", failure_threshold=3, reset_timeout=60)
+
+    for _ in range(2):
+        breaker.record_failure()
+        breaker.check()
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    assert breaker.trips == 1
+    clock.monotonic.return_value += 59
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+
+def test_success_resets_the_failure_count(clock: MagicMock) -> None:
+    """Test that only consecutive failures open the circuit."""
+    breaker = CircuitBreaker("api.example", failure_threshold=3, reset_timeout=60)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+
+    assert breaker.state == "closed"
+    assert breaker.failures == 2
+
+
+def test_half_open_circuit_closes_after_success(clock: MagicMock) -> None:
+    """Test that the first request after the reset timeout closes the circuit."""
+    breaker = CircuitBreaker("api.example", failure_threshold=2, reset_timeout=60)
+    breaker.record_failure()
+    breaker.record_failure()
+
+    clock.monotonic.return_value += 60
+    breaker.check()
+    assert breaker.state == "half_open"
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.failures == 0
+    breaker.record_failure()
+    assert breaker.state == "closed"
+
+
+def test_half_open_circuit_reopens_after_failure(clock: MagicMock) -> None:
+    """Test that a failure after the reset timeout opens the circuit again."""
+    breaker = CircuitBreaker("api.example", failure_threshold=2, reset_timeout=60)
+    breaker.record_failure()
+    breaker.record_failure()
+
+    clock.monotonic.return_value += 60
+    breaker.check()
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    assert breaker.trips == 2
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+
+@pytest.mark.parametrize(
+    ("attempt", "delay"),
+    [(1, 1.0), (2, 2.0), (3, 4.0), (4, 8.0), (5, 10.0), (10, 10.0)],
+)
+def test_backoff_delay_bounds(attempt: int, delay: float) -> None:
+    """Test that the backoff doubles up to the cap with jitter in its upper half."""
+    with patch(
+        "custom_components.remeha_home.retry.random.uniform",
+        side_effect=lambda low, high: high,
+    ):
+        assert backoff_delay(attempt, 1.0, 10.0) == delay
+    with patch(
+        "custom_components.remeha_home.retry.random.uniform",
+        side_effect=lambda low, high: low,
+    ):
+        assert backoff_delay(attempt, 1.0, 10.0) == delay / 2
+
+    for _ in range(100):
+        assert delay / 2 <= backoff_delay(attempt, 1.0, 10.0) <= delay
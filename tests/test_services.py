@@ -0,0 +1,186 @@
+"""Tests for the Remeha Home services."""
+
+from unittest.mock import AsyncMock
+
+from aiohttp import ClientError
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.components.climate import ATTR_HVAC_MODE, HVACMode
+from homeassistant.const import ATTR_ENTITY_ID, ATTR_TEMPERATURE, Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.remeha_home.const import DOMAIN
+from custom_components.remeha_home.services import ATTR_ZONES, SERVICE_SET_ZONES
+
+
+@pytest.fixture
+async def climate_entities(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_api: dict[str, AsyncMock],
+) -> list[er.RegistryEntry]:
+    """Set up the integration and return the climate zone entities."""
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    return [
+        entity_entry
+        for entity_entry in er.async_entries_for_config_entry(
+            er.async_get(hass), config_entry.entry_id
+        )
+        if entity_entry.domain == Platform.CLIMATE
+    ]
+
+
+async def test_set_zones_partial_failure(
+    hass: HomeAssistant,
+    mock_api: dict[str, AsyncMock],
+    climate_entities: list[er.RegistryEntry],
+) -> None:
+    """Test that the response reports the result of every zone."""
+    succeeding, failing = climate_entities
+    failing_zone_id = failing.unique_id.removeprefix(f"{DOMAIN}_")
+
+    async def _set_manual(climate_zone_id: str, setpoint: float) -> None:
+        if climate_zone_id == failing_zone_id:
+            raise ClientError("Connection reset")
+
+    mock_api["async_set_manual"].side_effect = _set_manual
+    dashboard_requests = mock_api["async_get_dashboard"].call_count
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_ZONES,
+        {
+            ATTR_ZONES: [
+                {
+                    ATTR_ENTITY_ID: succeeding.entity_id,
+                    ATTR_HVAC_MODE: HVACMode.HEAT,
+                    ATTR_TEMPERATURE: 20.5,
+                },
+                {
+                    ATTR_ENTITY_ID: failing.entity_id,
+                    ATTR_HVAC_MODE: HVACMode.HEAT,
+                    ATTR_TEMPERATURE: 20.5,
+                },
+            ]
+        },
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response == {
+        ATTR_ZONES: {
+            succeeding.entity_id: {"success": True},
+            failing.entity_id: {"success": False, "error": "Connection reset"},
+        }
+    }
+    assert mock_api["async_set_manual"].call_count == 2
+    # The commands are confirmed with a single refresh
+    assert mock_api["async_get_dashboard"].call_count == dashboard_requests + 1
+
+    assert await hass.config_entries.async_unload(succeeding.config_entry_id)
+
+
+async def test_set_zones_reports_results(
+    hass: HomeAssistant,
+    mock_api: dict[str, AsyncMock],
+    climate_entities: list[er.RegistryEntry],
+) -> None:
+    """Test the response of zones that were all set and of an unknown entity."""
+    first, second = climate_entities
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_ZONES,
+        {
+            ATTR_ZONES: [
+                {ATTR_ENTITY_ID: first.entity_id, ATTR_HVAC_MODE: HVACMode.OFF},
+                {ATTR_ENTITY_ID: second.entity_id, ATTR_HVAC_MODE: HVACMode.AUTO},
+                {ATTR_ENTITY_ID: "climate.unknown", ATTR_HVAC_MODE: HVACMode.OFF},
+            ]
+        },
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response == {
+        ATTR_ZONES: {
+            first.entity_id: {"success": True},
+            second.entity_id: {"success": True},
+            "climate.unknown": {
+                "success": False,
+                "error": "climate.unknown is not a Remeha Home climate zone",
+            },
+        }
+    }
+    mock_api["async_set_off"].assert_awaited_once()
+    mock_api["async_set_schedule"].assert_awaited_once()
+
+    assert await hass.config_entries.async_unload(first.config_entry_id)
+
+
+async def test_set_zones_failure_without_response(
+    hass: HomeAssistant,
+    mock_api: dict[str, AsyncMock],
+    climate_entities: list[er.RegistryEntry],
+) -> None:
+    """Test that a failed zone raises when no response is requested."""
+    mock_api["async_set_off"].side_effect = ClientError("Connection reset")
+
+    with pytest.raises(HomeAssistantError, match=climate_entities[0].entity_id):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_ZONES,
+            {
+                ATTR_ZONES: [
+                    {
+                        ATTR_ENTITY_ID: climate_entities[0].entity_id,
+                        ATTR_HVAC_MODE: HVACMode.OFF,
+                    }
+                ]
+            },
+            blocking=True,
+        )
+
+    assert await hass.config_entries.async_unload(climate_entities[0].config_entry_id)
+
+
+async def test_set_zones_temperature_out_of_range(
+    hass: HomeAssistant,
+    mock_api: dict[str, AsyncMock],
+    climate_entities: list[er.RegistryEntry],
+) -> None:
+    """Test that a temperature outside the range of the zone is not sent."""
+    entity_id = climate_entities[0].entity_id
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_ZONES,
+        {
+            ATTR_ZONES: [
+                {
+                    ATTR_ENTITY_ID: entity_id,
+                    ATTR_HVAC_MODE: HVACMode.HEAT,
+                    ATTR_TEMPERATURE: 50.0,
+                }
+            ]
+        },
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response == {
+        ATTR_ZONES: {
+            entity_id: {
+                "success": False,
+                "error": "Temperature 50.0 is outside the range of the zone, 5.0 to 30.0",
+            }
+        }
+    }
+    mock_api["async_set_manual"].assert_not_awaited()
+
+    assert await hass.config_entries.async_unload(climate_entities[0].config_entry_id)